@@ -0,0 +1,158 @@
+"""Micro-benchmarks for the conversion, formatting and parsing hot paths.
+
+Run the suite and optionally store the results:
+
+    python benchmarks/bench.py run --save results.json
+
+Compare against stored results, exiting with an error on regressions:
+
+    python benchmarks/bench.py compare benchmarks/baseline.json
+
+Every benchmark reports the best time per call out of several repeats, which
+is the most reproducible statistic for code that does not allocate much. When
+comparing, a benchmark slower than the threshold is measured again a few times
+and only counts as a regression if none of the attempts is within it, as a
+busy machine easily slows down a single measurement.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from binary import Converter, convert_units, parse_size
+from binary.core import BINARY_PREFIXES, DECIMAL_PREFIXES
+
+Benchmark = Callable[[], object]
+
+
+def reference_format(n: int) -> str:
+    return '{:.2f} {}'.format(*convert_units(n))
+
+
+def collect() -> Dict[str, Benchmark]:
+    benchmarks: Dict[str, Benchmark] = {}
+
+    for prefixes, si in ((BINARY_PREFIXES, False), (DECIMAL_PREFIXES, True)):
+        for unit, suffix in prefixes.items():
+            n = unit * 3 // 2
+            f = float(n)
+            benchmarks[f'auto/float/{suffix}'] = partial(convert_units, f, si=si)
+            benchmarks[f'auto/int/{suffix}'] = partial(convert_units, n, si=si)
+            benchmarks[f'auto/exact/{suffix}'] = partial(convert_units, f, si=si, exact=True)
+            benchmarks[f'to/float/{suffix}'] = partial(convert_units, f, to=unit)
+            benchmarks[f'to/exact/{suffix}'] = partial(convert_units, f, to=unit, exact=True)
+
+    converter = Converter()
+    formatter = Converter(precision=2)
+    convert = converter.convert
+    render = formatter.format
+    benchmarks['converter/call'] = partial(converter, 1610612736)
+    benchmarks['converter/convert'] = partial(convert, 1610612736)
+    benchmarks['converter/reference'] = partial(convert_units, 1610612736)
+    benchmarks['converter/format'] = partial(render, 1610612736)
+    benchmarks['converter/format_ref'] = partial(reference_format, 1610612736)
+    benchmarks['parse/int'] = lambda: parse_size('200MB')
+    benchmarks['parse/float'] = lambda: parse_size('1.5 GiB')
+    benchmarks['parse/exact'] = lambda: parse_size('1.5 GiB', exact=True)
+
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int) -> float:
+    timer = timeit.Timer(benchmark)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(pattern: Optional[str], repeat: int) -> Dict[str, float]:
+    results = {}
+    for name, benchmark in collect().items():
+        if pattern and pattern not in name:
+            continue
+
+        results[name] = measure(benchmark, repeat)
+        print(f'{name:<24} {results[name]:>10.1f} ns')
+
+    return results
+
+
+def metadata() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks')
+    run_parser.add_argument('-k', dest='pattern', help='Only run benchmarks whose name contains this')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5)
+    run_parser.add_argument('--save', help='Write the results to this JSON file')
+
+    compare_parser = subparsers.add_parser('compare', help='Run the benchmarks and compare with stored results')
+    compare_parser.add_argument('baseline', help='A JSON file written by the run command')
+    compare_parser.add_argument('-k', dest='pattern', help='Only run benchmarks whose name contains this')
+    compare_parser.add_argument('-r', '--repeat', type=int, default=5)
+    compare_parser.add_argument(
+        '-t', '--threshold', type=float, default=0.1, help='Tolerated slowdown as a fraction, defaults to 0.1'
+    )
+    compare_parser.add_argument(
+        '-c', '--confirm', type=int, default=3, help='Attempts to measure a slower benchmark again, defaults to 3'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.pattern, args.repeat)
+        if args.save:
+            with open(args.save, 'w') as f:
+                json.dump({'metadata': metadata(), 'results': results}, f, indent=2, sort_keys=True)
+                f.write('\n')
+
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    if baseline['metadata'] != metadata():
+        print(f'warning: baseline was recorded on {baseline["metadata"]}', file=sys.stderr)
+
+    results = run(args.pattern, args.repeat)
+    benchmarks = collect()
+    regressions = []
+    print()
+    for name, elapsed in results.items():
+        expected = baseline['results'].get(name)
+        if expected is None:
+            continue
+
+        for _ in range(args.confirm):
+            if elapsed / expected - 1 <= args.threshold:
+                break
+            elapsed = min(elapsed, measure(benchmarks[name], args.repeat))
+
+        change = elapsed / expected - 1
+        flag = ''
+        if change > args.threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+
+        print(f'{name:<24} {expected:>10.1f} -> {elapsed:>10.1f} ns {change:>+8.1%}{flag}')
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) above {args.threshold:.0%}', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
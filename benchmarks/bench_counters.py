@@ -0,0 +1,79 @@
+"""Increment throughput of ShardedCounter by number of threads, compared with
+an integer guarded by a lock.
+
+    python benchmarks/bench_counters.py [-n COUNT] [-t MAX_THREADS]
+
+Every thread performs COUNT increments. Threads only run in parallel on
+free-threaded builds of Python, elsewhere the scaling column measures the
+cost of contention rather than a speedup.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+from binary.counters import ShardedCounter
+
+
+class LockedCounter:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def add(self, n: int = 1) -> None:
+        with self._lock:
+            self.value += n
+
+
+def run(add: Callable[[int], None], threads: int, count: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(count):
+            add(4096)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--count', type=int, default=1_000_000)
+    parser.add_argument('-t', '--max-threads', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}, {os.cpu_count()} CPUs')
+    print(f'{"threads":>7} {"counter":>8} {"seconds":>9} {"adds/s":>12} {"scaling":>8}')
+
+    for name, factory in (('sharded', ShardedCounter), ('locked', LockedCounter)):
+        reference = None
+        threads = 1
+        while threads <= args.max_threads:
+            counter = factory()
+            elapsed = run(counter.add, threads, args.count)
+            assert counter.value == threads * args.count * 4096
+
+            throughput = threads * args.count / elapsed
+            if reference is None:
+                reference = throughput
+            print(f'{threads:>7} {name:>8} {elapsed:>9.3f} {throughput:>12.3g} {throughput / reference:>8.2f}')
+            threads *= 2
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
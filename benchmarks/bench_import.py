@@ -0,0 +1,72 @@
+"""Measures the cost of importing the package using ``-X importtime``.
+
+    python benchmarks/bench_import.py [-n RUNS] [--budget MICROSECONDS] [MODULE]
+
+Each run happens in a fresh interpreter. The median cumulative import time is
+reported along with the slowest modules imported as a consequence. With a
+budget, the exit code signals whether the median exceeded it.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+def import_times(module: str) -> Tuple[int, Dict[str, int]]:
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    # Nested imports are indented and precede the module that caused them.
+    times: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+        if name.startswith('  '):
+            times[name.strip()] = int(cumulative)
+        elif name.strip() == module:
+            return int(cumulative), times
+        else:
+            times = {}
+
+    raise RuntimeError(f'Unable to find the import time of {module}')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('module', nargs='?', default='binary')
+    parser.add_argument('-n', '--runs', type=int, default=20)
+    parser.add_argument('--budget', type=int, help='The maximum median import time in microseconds')
+    args = parser.parse_args(argv)
+
+    totals = []
+    modules: Dict[str, List[int]] = {}
+    for _ in range(args.runs):
+        total, times = import_times(args.module)
+        totals.append(total)
+        for name, elapsed in times.items():
+            modules.setdefault(name, []).append(elapsed)
+
+    median = statistics.median(totals)
+    print(f'import {args.module}: {median:.0f} us (median of {args.runs}, min {min(totals)} us)')
+
+    slowest = sorted(modules, key=lambda name: statistics.median(modules[name]), reverse=True)
+    for name in slowest[:10]:
+        print(f'  {name:<30} {statistics.median(modules[name]):>8.0f} us')
+
+    if args.budget is not None and median > args.budget:
+        print(f'Median import time exceeds the budget of {args.budget} us', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
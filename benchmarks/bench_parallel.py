@@ -0,0 +1,61 @@
+"""Throughput of convert_units_parallel by number of worker processes.
+
+    python benchmarks/bench_parallel.py [-n COUNT] [-w MAX_WORKERS] [--chunk-size SIZE]
+
+The single process row is convert_units_many for reference. Requires NumPy.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from binary.batch import convert_units_many
+from binary.parallel import DEFAULT_CHUNK_SIZE, convert_units_parallel
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--count', type=int, default=20_000_000)
+    parser.add_argument('-w', '--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    values = np.random.default_rng(0).lognormal(20, 6, args.count)
+
+    elapsed = best_of(lambda: convert_units_many(values), args.repeat)
+    print(f'{"workers":>7} {"seconds":>9} {"values/s":>12} {"speedup":>8}')
+    print(f'{"-":>7} {elapsed:>9.3f} {args.count / elapsed:>12.3g} {1:>8.2f}')
+    reference = elapsed
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ProcessPoolExecutor(workers) as pool:
+            # Start the workers outside of the measurement.
+            list(pool.map(abs, range(workers)))
+            elapsed = best_of(
+                lambda: convert_units_parallel(values, chunk_size=args.chunk_size, executor=pool), args.repeat
+            )
+
+        print(f'{workers:>7} {elapsed:>9.3f} {args.count / elapsed:>12.3g} {reference / elapsed:>8.2f}')
+        workers *= 2
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
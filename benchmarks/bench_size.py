@@ -0,0 +1,49 @@
+"""Construction time and memory use of Size compared with plain ints.
+
+    python benchmarks/bench_size.py [-n COUNT]
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, List, Optional
+
+from binary import Size
+
+
+def memory_per_item(factory: Callable[[int], object], count: int) -> float:
+    # Offset the values so that small ints are not served from the cache.
+    offset = 2 ** 40
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(offset + i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del items
+    return (after - before) / count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--count', type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    factories = {
+        'int': int,
+        'Size': Size,
+    }
+
+    print(f'{"":<6} {"construct":>12} {"bytes/item":>12}')
+    for name, factory in factories.items():
+        timer = timeit.Timer('factory(123456789)', globals={'factory': factory})
+        number, _ = timer.autorange()
+        elapsed = min(timer.repeat(5, number)) / number * 1e9
+        memory = memory_per_item(factory, args.count)
+        print(f'{name:<6} {elapsed:>9.1f} ns {memory:>12.1f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
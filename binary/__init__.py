@@ -8,9 +8,20 @@ from .core import (
     EXBIBYTE, EXABYTE,
     ZEBIBYTE, ZETTABYTE,
     YOBIBYTE, YOTTABYTE,
-    BinaryUnits, DecimalUnits, convert_units
+    convert_units, convert_units_int, convert_units_rounded
 )
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ._units import BinaryUnits, DecimalUnits
+    from .batch import common_unit, convert_units_common, convert_units_many
+    from .cache import CachedConverter
+    from .converter import Converter
+    from .parsing import parse_size, parse_sizes
+    from .progress import Progress
+    from .rate import RateMeter, format_rate
+    from .size import Size
+
 __all__ = [
     "BYTE",
     "KIBIBYTE", "KILOBYTE",
@@ -21,6 +32,44 @@ __all__ = [
     "EXBIBYTE", "EXABYTE",
     "ZEBIBYTE", "ZETTABYTE",
     "YOBIBYTE", "YOTTABYTE",
-    "BinaryUnits", "DecimalUnits", "convert_units",
+    "BinaryUnits", "DecimalUnits", "convert_units", "convert_units_int", "convert_units_rounded",
+    "convert_units_many", "convert_units_common", "common_unit", "Converter", "parse_size", "parse_sizes",
+    "CachedConverter", "Size", "RateMeter", "format_rate",
+    "Progress",
 ]
 __version__ = '1.0.2'
+
+# Everything not needed for basic conversion is imported on first access to
+# keep the cost of importing the package low for short-lived programs.
+_LAZY_IMPORTS = {
+    'BinaryUnits': '_units',
+    'DecimalUnits': '_units',
+    'convert_units_many': 'batch',
+    'convert_units_common': 'batch',
+    'common_unit': 'batch',
+    'CachedConverter': 'cache',
+    'Converter': 'converter',
+    'parse_size': 'parsing',
+    'parse_sizes': 'parsing',
+    'Size': 'size',
+    'RateMeter': 'rate',
+    'format_rate': 'rate',
+    'Progress': 'progress',
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,81 @@
+from typing import NamedTuple
+
+from .core import (
+    BYTE,
+    EXABYTE, EXBIBYTE,
+    GIBIBYTE, GIGABYTE,
+    KIBIBYTE, KILOBYTE,
+    MEBIBYTE, MEGABYTE,
+    PEBIBYTE, PETABYTE,
+    TEBIBYTE, TERABYTE,
+    YOBIBYTE, YOTTABYTE,
+    ZEBIBYTE, ZETTABYTE,
+)
+
+
+class _BinaryUnits(NamedTuple):
+    BYTE: int
+    B: int
+    KIBIBYTE: int
+    KB: int
+    MEBIBYTE: int
+    MB: int
+    GIBIBYTE: int
+    GB: int
+    TEBIBYTE: int
+    TB: int
+    PEBIBYTE: int
+    PB: int
+    EXBIBYTE: int
+    EB: int
+    ZEBIBYTE: int
+    ZB: int
+    YOBIBYTE: int
+    YB: int
+
+
+BinaryUnits = _BinaryUnits(
+    BYTE, BYTE,
+    KIBIBYTE, KIBIBYTE,
+    MEBIBYTE, MEBIBYTE,
+    GIBIBYTE, GIBIBYTE,
+    TEBIBYTE, TEBIBYTE,
+    PEBIBYTE, PEBIBYTE,
+    EXBIBYTE, EXBIBYTE,
+    ZEBIBYTE, ZEBIBYTE,
+    YOBIBYTE, YOBIBYTE,
+)
+
+
+class _DecimalUnits(NamedTuple):
+    BYTE: int
+    B: int
+    KILOBYTE: int
+    KB: int
+    MEGABYTE: int
+    MB: int
+    GIGABYTE: int
+    GB: int
+    TERABYTE: int
+    TB: int
+    PETABYTE: int
+    PB: int
+    EXABYTE: int
+    EB: int
+    ZETTABYTE: int
+    ZB: int
+    YOTTABYTE: int
+    YB: int
+
+
+DecimalUnits = _DecimalUnits(
+    BYTE, BYTE,
+    KILOBYTE, KILOBYTE,
+    MEGABYTE, MEGABYTE,
+    GIGABYTE, GIGABYTE,
+    TERABYTE, TERABYTE,
+    PETABYTE, PETABYTE,
+    EXABYTE, EXABYTE,
+    ZETTABYTE, ZETTABYTE,
+    YOTTABYTE, YOTTABYTE,
+)
@@ -0,0 +1,262 @@
+from bisect import bisect_right
+from math import ceil, log
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, Union
+import typing
+
+from .batch import (
+    BINARY_FLOAT_THRESHOLDS, BINARY_SUFFIXES, BINARY_THRESHOLDS, DECIMAL_FLOAT_THRESHOLDS, DECIMAL_SUFFIXES,
+    DECIMAL_THRESHOLDS, _is_ndarray
+)
+
+Number = Union[int, float]
+
+
+class Summary(NamedTuple):
+    n: int
+    total: Number
+    minimum: Optional[Number]
+    maximum: Optional[Number]
+    percentiles: Dict[float, float]
+    histogram: Dict[str, int]
+
+
+class SizeSummary:
+    r"""Accumulates the count, total, extremes, a histogram and percentile
+    estimates of a stream of sizes in constant memory, so that collections
+    never need to be materialized just to be totalled and labelled.
+
+    The histogram counts values by the unit ``convert_units`` would display
+    them in, i.e. buckets are bounded by the binary or decimal prefixes.
+
+    Percentiles are estimated from logarithmically spaced buckets whose
+    count only grows with the range of magnitudes seen, never with the number
+    of values. Estimates are within ``relative_accuracy`` of a value from the
+    input, and are always within the observed minimum and maximum.
+
+    NumPy arrays passed to :meth:`update` are aggregated without a Python
+    level loop.
+
+    :param si: Bucket the histogram by decimal rather than binary units.
+    :type si: ``bool``
+    :param relative_accuracy: The relative error of percentile estimates.
+    :type relative_accuracy: ``float``
+    """
+    __slots__ = (
+        'si', 'relative_accuracy', 'count', 'total', 'minimum', 'maximum',
+        '_counts', '_positive', '_negative', '_zeros', '_gamma', '_scale',
+        '_thresholds', '_float_thresholds', '_suffixes',
+    )
+
+    def __init__(self, si: bool = False, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('The relative accuracy must be between 0 and 1.')
+
+        self.si = si
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self.total: Number = 0
+        self.minimum: Optional[Number] = None
+        self.maximum: Optional[Number] = None
+
+        if si:
+            self._thresholds, self._float_thresholds = DECIMAL_THRESHOLDS, DECIMAL_FLOAT_THRESHOLDS
+            self._suffixes = DECIMAL_SUFFIXES
+        else:
+            self._thresholds, self._float_thresholds = BINARY_THRESHOLDS, BINARY_FLOAT_THRESHOLDS
+            self._suffixes = BINARY_SUFFIXES
+
+        self._counts = [0] * len(self._thresholds)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._scale = 1 / log(self._gamma)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The arithmetic mean, or ``None`` if nothing was added.
+
+        :rtype: ``float``
+        """
+        return self.total / self.count if self.count else None
+
+    @property
+    def histogram(self) -> Dict[str, int]:
+        """The number of values per unit, from smallest to largest unit.
+
+        :rtype: ``dict``
+        """
+        return dict(zip(self._suffixes, self._counts))
+
+    def add(self, n: Number) -> None:
+        r"""Adds a single size.
+
+        :param n: The number of bytes.
+        :type n: ``int`` or ``float``
+        :raises ValueError: If ``n`` is NaN.
+        """
+        if n != n:
+            # NaN fails every comparison and would poison the total
+            raise ValueError('Sizes must not be NaN.')
+
+        self.count += 1
+        self.total += n
+        if self.minimum is None or n < self.minimum:
+            self.minimum = n
+        if self.maximum is None or n > self.maximum:
+            self.maximum = n
+
+        babs = -n if n < 0 else n
+        index = bisect_right(self._thresholds, babs) - 1
+        self._counts[index if index > 0 else 0] += 1
+
+        if n > 0:
+            key = ceil(log(n) * self._scale)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif n < 0:
+            key = ceil(log(babs) * self._scale)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zeros += 1
+
+    def update(self, values: Iterable[Number]) -> None:
+        r"""Adds every size of ``values``.
+
+        :param values: The numbers of bytes.
+        :type values: iterable or NumPy array of ``int`` or ``float``
+        :raises ValueError: If any size is NaN, in which case sizes of an
+                            array are not added but those of an iterable
+                            up to the NaN are.
+        """
+        if _is_ndarray(values):
+            self._update_array(values)
+            return
+
+        add = self.add
+        for n in values:
+            add(n)
+
+    def _update_array(self, values: Any) -> None:
+        import numpy as np
+
+        values = values.ravel()
+        if not values.size:
+            return
+
+        if values.dtype.kind == 'f' and np.isnan(values).any():
+            raise ValueError('Sizes must not be NaN.')
+
+        minimum, maximum = values.min().item(), values.max().item()
+
+        self.count += int(values.size)
+        if values.dtype.kind in 'iu':
+            # Sum the high and low 32 bits separately so that neither can
+            # overflow, then combine them exactly.
+            values = values.astype(np.uint64 if values.dtype.kind == 'u' else np.int64, copy=False)
+            self.total += (int((values >> 32).sum()) << 32) + int((values & 0xFFFFFFFF).sum())
+        else:
+            self.total += float(values.sum())
+        if self.minimum is None or minimum < self.minimum:
+            self.minimum = minimum
+        if self.maximum is None or maximum > self.maximum:
+            self.maximum = maximum
+
+        babs = np.abs(values.astype(np.float64))
+        indices = np.searchsorted(np.array(self._float_thresholds), babs, side='right') - 1
+        np.maximum(indices, 0, out=indices)
+        for index, count in enumerate(np.bincount(indices, minlength=len(self._counts)).tolist()):
+            self._counts[index] += count
+
+        self._zeros += int(np.count_nonzero(values == 0))
+        for store, mask in ((self._positive, values > 0), (self._negative, values < 0)):
+            keys, counts = np.unique(np.ceil(np.log(babs[mask]) * self._scale).astype(np.int64), return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                store[key] = store.get(key, 0) + count
+
+    def percentile(self, q: float) -> Optional[float]:
+        r"""Estimates the ``q``-th percentile of the sizes added so far.
+
+        :param q: The percentile, between 0 and 100 inclusive.
+        :type q: ``float``
+        :returns: The estimate, or ``None`` if nothing was added.
+        :rtype: ``float``
+        """
+        if not 0 <= q <= 100:
+            raise ValueError('Percentiles must be between 0 and 100.')
+        elif not self.count:
+            return None
+
+        return self._percentile(q)
+
+    def _percentile(self, q: float) -> float:
+        rank = q / 100 * (self.count - 1)
+        seen = 0
+        estimate = 0.0
+
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                estimate = -self._value(key)
+                break
+        else:
+            seen += self._zeros
+            if seen <= rank:
+                for key in sorted(self._positive):
+                    seen += self._positive[key]
+                    if seen > rank:
+                        estimate = self._value(key)
+                        break
+
+        # The extremes are known exactly.
+        minimum, maximum = typing.cast(Number, self.minimum), typing.cast(Number, self.maximum)
+        return float(min(max(estimate, minimum), maximum))
+
+    def summary(self, percentiles: Sequence[float] = (50, 90, 99)) -> Summary:
+        r"""Returns a snapshot of all the aggregates.
+
+        :param percentiles: The percentiles to estimate.
+        :type percentiles: sequence of ``float``
+        :rtype: :class:`Summary`
+        """
+        return Summary(
+            self.count,
+            self.total,
+            self.minimum,
+            self.maximum,
+            {q: self._percentile(q) for q in percentiles} if self.count else {},
+            self.histogram,
+        )
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+def summarize(
+    values: Iterable[Number],
+    si: bool = False,
+    percentiles: Sequence[float] = (50, 90, 99)
+) -> Summary:
+    r"""Aggregates ``values`` in a single pass with constant memory, see
+    :class:`SizeSummary`. When ``values`` is a NumPy array, percentiles are
+    computed exactly rather than estimated.
+
+    :param values: The numbers of bytes.
+    :type values: iterable or NumPy array of ``int`` or ``float``
+    :param si: Bucket the histogram by decimal rather than binary units.
+    :type si: ``bool``
+    :param percentiles: The percentiles to compute, between 0 and 100.
+    :type percentiles: sequence of ``float``
+    :rtype: :class:`Summary`
+    """
+    summary = SizeSummary(si)
+    summary.update(values)
+    result = summary.summary(percentiles)
+
+    if _is_ndarray(values) and summary.count:
+        import numpy as np
+
+        array: Any = values
+        exact = np.percentile(array, list(percentiles)).tolist() if percentiles else []
+        result = result._replace(percentiles=dict(zip(percentiles, exact)))
+
+    return result
@@ -0,0 +1,288 @@
+from array import array
+from bisect import bisect_right
+from math import inf, nextafter
+from typing import Any, Iterable, List, Optional, Tuple, Union
+import typing
+
+from .core import BINARY_PREFIXES, BYTE, DECIMAL_PREFIXES, PREFIXES
+
+BINARY_THRESHOLDS = tuple(BINARY_PREFIXES)
+DECIMAL_THRESHOLDS = tuple(DECIMAL_PREFIXES)
+BINARY_SUFFIXES = tuple(BINARY_PREFIXES.values())
+DECIMAL_SUFFIXES = tuple(DECIMAL_PREFIXES.values())
+
+
+def _float_thresholds(thresholds: Tuple[int, ...]) -> Tuple[float, ...]:
+    # Python compares floats against ints exactly, so a float threshold must
+    # be rounded up whenever the unit itself is not representable.
+    result = []
+    for threshold in thresholds:
+        f = float(threshold)
+        if f < threshold:
+            f = nextafter(f, inf)
+        result.append(f)
+
+    return tuple(result)
+
+
+BINARY_FLOAT_THRESHOLDS = _float_thresholds(BINARY_THRESHOLDS)
+DECIMAL_FLOAT_THRESHOLDS = _float_thresholds(DECIMAL_THRESHOLDS)
+
+
+def convert_units_many(
+    values: Iterable[float],
+    unit: int = BYTE,
+    to: Optional[int] = None,
+    si: bool = False
+) -> Tuple[Any, Any]:
+    r"""Batched version of :func:`~binary.core.convert_units`. ``values``
+    may be a NumPy array, an ``array.array``, any other object supporting
+    the buffer protocol, or an iterable of numbers. The prefix of every
+    element is chosen independently, exactly as the scalar function would.
+
+    When NumPy is installed the work is fully vectorized and a pair of
+    arrays is returned: the ``float64`` quantities and the unit strings.
+    Otherwise the quantities are returned as an ``array.array`` of doubles
+    and the unit strings as a list.
+
+    Results are bit-identical to the scalar path for float input and for
+    integer input whose byte count is exactly representable as a double,
+    except for integer input converted to the decimal ``YB``. That unit is
+    not representable as a double, so the quantities are divided by its
+    closest double whereas the scalar path divides the integers exactly,
+    which may differ in the last bit.
+
+    :param values: The numbers of ``unit``\ s.
+    :type values: array-like of ``int`` or ``float``
+    :param unit: The unit the ``values`` represent.
+    :type unit: one of the global constants
+    :param to: The unit to convert to.
+    :type to: one of the global constants
+    :param si: Assume SI units when no ``unit`` nor ``to`` is specified.
+    :type si: ``bool``
+    :returns: The quantities and the units' strings.
+    :rtype: tuple(quantities, strings)
+    """
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    if to and to not in PREFIXES:
+        raise ValueError(f'{to} is not a valid unit.')
+
+    thresholds, float_thresholds, suffixes = _unit_system(unit, si)
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _convert_units_many_python(values, unit, to, thresholds, suffixes)
+
+    amounts, indices = _convert_array(_as_ndarray(values), unit, to, thresholds, float_thresholds)
+    if indices is None:
+        return amounts, np.full(amounts.shape, PREFIXES[typing.cast(int, to)])
+
+    return amounts, np.array(suffixes)[indices]
+
+
+def _unit_system(unit: int, si: bool) -> Tuple[Tuple[int, ...], Tuple[float, ...], Tuple[str, ...]]:
+    if unit in BINARY_PREFIXES and not si:
+        return BINARY_THRESHOLDS, BINARY_FLOAT_THRESHOLDS, BINARY_SUFFIXES
+    return DECIMAL_THRESHOLDS, DECIMAL_FLOAT_THRESHOLDS, DECIMAL_SUFFIXES
+
+
+def _convert_array(
+    values: Any,
+    unit: int,
+    to: Optional[int],
+    thresholds: Tuple[int, ...],
+    float_thresholds: Tuple[float, ...]
+) -> Tuple[Any, Any]:
+    # Returns the quantities and, unless converting to a fixed unit, the
+    # index of each quantity's unit.
+    import numpy as np
+
+    b = values * unit
+
+    # Dividing by the decimal YB divides by its closest double, as the
+    # scalar path does for floats but not for ints, see convert_units_many
+    if to:
+        return b // to if to == BYTE else b / to, None
+
+    indices = np.searchsorted(np.array(float_thresholds), np.abs(b), side='right') - 1
+    np.maximum(indices, 0, out=indices)
+
+    return b / np.array(thresholds, dtype=np.float64)[indices], indices
+
+
+def _convert_units_many_python(
+    values: Iterable[float],
+    unit: int,
+    to: Optional[int],
+    thresholds: Tuple[int, ...],
+    suffixes: Tuple[str, ...]
+) -> Tuple['array[float]', List[str]]:
+    values = _as_list(values)
+    amounts = array('d')
+    units: List[str] = []
+
+    if to:
+        suffix = PREFIXES[to]
+        for n in values:
+            b = n * unit
+            amounts.append(b // to if to == BYTE else b / to)
+            units.append(suffix)
+
+        return amounts, units
+
+    for n in values:
+        b = n * unit
+        index = bisect_right(thresholds, abs(b)) - 1
+        if index < 0:
+            index = 0
+
+        amounts.append(b / thresholds[index])
+        units.append(suffixes[index])
+
+    return amounts, units
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # Linear interpolation between closest ranks, as numpy.percentile does
+    rank = q / 100 * (len(ordered) - 1)
+    lower = int(rank)
+    if lower + 1 >= len(ordered):
+        return ordered[lower]
+
+    return ordered[lower] + (ordered[lower + 1] - ordered[lower]) * (rank - lower)
+
+
+def _common_unit(magnitudes: Any, policy: Union[str, float], thresholds: Tuple[int, ...], numpy: bool) -> int:
+    if not len(magnitudes):
+        return BYTE
+
+    if policy == 'max':
+        magnitude = float(magnitudes.max()) if numpy else max(magnitudes)
+    else:
+        q = 50 if policy == 'median' else typing.cast(float, policy)
+        if numpy:
+            import numpy as np
+
+            # Python compares floats with the int thresholds exactly
+            magnitude = float(np.percentile(magnitudes, q))
+        else:
+            magnitude = _percentile(sorted(magnitudes), q)
+
+    index = bisect_right(thresholds, magnitude) - 1
+    return thresholds[index if index > 0 else 0]
+
+
+def _check_policy(policy: Union[str, float]) -> None:
+    if isinstance(policy, str):
+        if policy not in ('max', 'median'):
+            raise ValueError(f'Unknown policy: {policy!r}')
+    elif not 0 <= policy <= 100:
+        raise ValueError('Percentiles must be between 0 and 100.')
+
+
+def convert_units_common(
+    values: Iterable[float],
+    unit: int = BYTE,
+    si: bool = False,
+    policy: Union[str, float] = 'max'
+) -> Tuple[Any, str]:
+    r"""Converts every element of ``values`` to one shared unit, so that a
+    column of sizes is displayed consistently. ``values`` is read once; the
+    unit is the one :func:`~binary.core.convert_units` would choose for a
+    representative magnitude and every value is then divided by it in a
+    single vectorized step.
+
+    The representative magnitude depends on ``policy``:
+
+    - ``'max'``: the largest absolute value, so no quantity exceeds 1024
+      (or 1000)
+    - ``'median'``: the median absolute value, so most quantities are short
+    - a number between 0 and 100: that percentile of the absolute values
+
+    :param values: The numbers of ``unit``\ s.
+    :type values: array-like of ``int`` or ``float``
+    :param unit: The unit the ``values`` represent.
+    :type unit: one of the global constants
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param policy: How to pick the shared unit.
+    :type policy: ``str`` or ``float``
+    :returns: The quantities and the shared unit's string.
+    :rtype: tuple(quantities, string)
+    """
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    _check_policy(policy)
+
+    thresholds, _, suffixes = _unit_system(unit, si)
+
+    try:
+        import numpy as np
+    except ImportError:
+        scaled = [n * unit for n in _as_list(values)]
+        to = _common_unit([abs(n) for n in scaled], policy, thresholds, False)
+        return array('d', [n / to for n in scaled]), PREFIXES[to]
+
+    b = _as_ndarray(values) * unit
+    to = _common_unit(np.abs(b).ravel(), policy, thresholds, True)
+    return b / to, PREFIXES[to]
+
+
+def common_unit(
+    values: Iterable[float],
+    unit: int = BYTE,
+    si: bool = False,
+    policy: Union[str, float] = 'max'
+) -> int:
+    r"""Returns the unit :func:`convert_units_common` would convert
+    ``values`` to, see it for the parameters.
+
+    :rtype: one of the global constants
+    """
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    _check_policy(policy)
+
+    thresholds = _unit_system(unit, si)[0]
+
+    try:
+        import numpy as np
+    except ImportError:
+        return _common_unit([abs(n * unit) for n in _as_list(values)], policy, thresholds, False)
+
+    return _common_unit(np.abs(_as_ndarray(values) * unit).ravel(), policy, thresholds, True)
+
+
+def _as_list(values: Iterable[float]) -> Iterable[float]:
+    if not isinstance(values, (array, list, tuple)):
+        try:
+            view = memoryview(values)  # type: ignore[arg-type]
+        except TypeError:
+            pass
+        else:
+            return view.tolist()
+
+    return values
+
+
+def _is_ndarray(values: Any) -> bool:
+    # Checks without importing NumPy
+    return type(values).__module__ == 'numpy' and type(values).__name__ == 'ndarray'
+
+
+def _as_ndarray(values: Iterable[float]) -> Any:
+    # NumPy turns buffers such as bytes into a single scalar and sets or
+    # other unordered collections into object arrays, so only arrays and
+    # sequences are passed through, buffers are viewed as their elements and
+    # anything else is read into a list.
+    import numpy as np
+
+    if not isinstance(values, (list, tuple)) and not hasattr(values, '__array__'):
+        try:
+            values = memoryview(values)  # type: ignore[arg-type]
+        except TypeError:
+            values = list(values)
+
+    return np.asarray(values, dtype=np.float64)
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from math import copysign
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Tuple, Union
+
+from .core import BYTE, convert_units
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from .core import Number
+
+
+def _convert_units(
+    n: 'Number', unit: int, to: Optional[int], si: bool, exact: bool, key: Hashable
+) -> Tuple[Union[float, 'Decimal'], str]:
+    # The key only distinguishes quantities that compare equal but convert
+    # differently, see CachedConverter.
+    return convert_units(n, unit, to, si, exact)
+
+
+class CachedConverter:
+    r"""A memoizing wrapper around :func:`~binary.core.convert_units` for
+    workloads that convert the same few values over and over, such as quota
+    limits or block sizes. Results are kept in a bounded LRU cache keyed on
+    ``(n, unit, to, si, exact)``, where quantities of different types are
+    cached separately so that ``1`` and ``1.0`` do not collide. Equal
+    quantities that convert differently are also kept apart: ``-0.0`` and
+    ``0.0`` by their sign, and decimals such as ``Decimal('1.5')`` and
+    ``Decimal('1.50')`` by their digits and exponent.
+
+    The cache is safe to share across threads.
+
+    :param maxsize: The maximum number of cached results, or ``None`` for an
+                    unbounded cache.
+    :type maxsize: ``int``
+    """
+    __slots__ = ('maxsize', '_convert')
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+        self._convert = lru_cache(maxsize=maxsize, typed=True)(_convert_units)
+
+    def __call__(
+        self,
+        n: 'Number',
+        unit: int = BYTE,
+        to: Optional[int] = None,
+        si: bool = False,
+        exact: bool = False
+    ) -> Tuple[Union[float, 'Decimal'], str]:
+        # Always pass positionally so that equivalent calls share a key.
+        cls = type(n)
+        if cls is int:
+            return self._convert(n, unit, to, si, exact, None)
+        elif cls is float:
+            return self._convert(n, unit, to, si, exact, copysign(1.0, n))
+
+        as_tuple = getattr(n, 'as_tuple', None)
+        return self._convert(n, unit, to, si, exact, None if as_tuple is None else as_tuple())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(maxsize={self.maxsize!r})'
+
+    @property
+    def stats(self) -> Any:
+        """The hits, misses, maximum size and current size of the cache.
+
+        :rtype: named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``
+        """
+        return self._convert.cache_info()
+
+    def clear(self) -> None:
+        """Empties the cache and resets its statistics."""
+        self._convert.cache_clear()
@@ -0,0 +1,95 @@
+import argparse
+import sys
+from typing import Iterable, List, Optional
+
+from .converter import Converter
+from .stream import humanize_columns, humanize_json, read_lines, write_lines
+
+
+def humanize(args: argparse.Namespace) -> int:
+    converter = Converter(si=args.si, precision=args.precision)
+
+    lines: Iterable[str]
+    if args.file in (None, '-'):
+        lines = sys.stdin
+    else:
+        lines = read_lines(args.file)
+
+    if args.field is not None:
+        output = humanize_json(lines, args.field, converter)
+    else:
+        output = humanize_columns(lines, args.column, args.delimiter, converter)
+
+    try:
+        write_lines(output, sys.stdout)
+    except BrokenPipeError:
+        raise
+    except OSError as e:
+        # The input file is only opened once the first line is read
+        print(f'binary humanize: {e}', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def du(args: argparse.Namespace) -> int:
+    # Only this command needs the thread pool
+    from .du import scan
+
+    converter = Converter(si=args.si, precision=args.precision)
+    errors = 0
+
+    def report(error: OSError) -> None:
+        nonlocal errors
+        errors += 1
+        print(f'binary du: {error}', file=sys.stderr)
+
+    for path in args.paths:
+        try:
+            for usage in scan(path, args.workers, args.max_depth, args.dereference, report):
+                size = usage.apparent if args.apparent_size else usage.allocated
+                # Flush as subtrees finish so that progress is visible
+                print(f'{converter.format(size)}\t{usage.path}', flush=True)
+        except BrokenPipeError:
+            raise
+        except OSError as e:
+            # The path itself cannot be read, continue with the others
+            report(e)
+
+    # Like du, any error fails the command even though the rest is reported
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='binary')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    humanize_parser = subparsers.add_parser(
+        'humanize', help='Convert a column of delimited text or a field of JSON Lines to human readable units'
+    )
+    humanize_parser.add_argument('file', nargs='?', help='The input file, defaults to standard input')
+    humanize_parser.add_argument('-c', '--column', type=int, default=0, help='The index of the column to convert')
+    humanize_parser.add_argument('-d', '--delimiter', default='\t', help='The column separator, defaults to tab')
+    humanize_parser.add_argument('-f', '--field', help='Treat the input as JSON Lines and convert this field')
+    humanize_parser.add_argument('-p', '--precision', type=int, default=2, help='Digits after the decimal point')
+    humanize_parser.add_argument('--si', action='store_true', help='Use decimal rather than binary units')
+    humanize_parser.set_defaults(func=humanize)
+
+    du_parser = subparsers.add_parser('du', help='Summarize the disk usage of directory trees')
+    du_parser.add_argument('paths', nargs='*', default=['.'], help='The directories, defaults to the current one')
+    du_parser.add_argument('-d', '--max-depth', type=int, help='Only report directories this many levels deep')
+    du_parser.add_argument('-b', '--apparent-size', action='store_true', help='Report sizes rather than disk usage')
+    du_parser.add_argument('-L', '--dereference', action='store_true', help='Follow symbolic links')
+    du_parser.add_argument('-j', '--workers', type=int, help='The number of threads')
+    du_parser.add_argument('-p', '--precision', type=int, default=1, help='Digits after the decimal point')
+    du_parser.add_argument('--si', action='store_true', help='Use decimal rather than binary units')
+    du_parser.set_defaults(func=du)
+
+    args = parser.parse_args(argv)
+    try:
+        status: int = args.func(args)
+    except BrokenPipeError:
+        sys.stderr.close()
+        return 0
+
+    return status
@@ -0,0 +1,250 @@
+from bisect import bisect_right
+from operator import floordiv, truediv
+from string import Formatter
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
+
+from .core import BINARY_PREFIXES, BYTE, DECIMAL_PREFIXES, PREFIXES, _EXACT_UNITS, _import_decimal, _to_decimal
+
+if TYPE_CHECKING:
+    from decimal import Context, Decimal
+
+    from .core import Number
+
+    Result = Tuple[Union[float, Decimal], str]
+
+
+def _auto_converter(
+    unit: int,
+    thresholds: Tuple[int, ...],
+    suffixes: Tuple[str, ...],
+    exact: bool,
+    context: Optional['Context']
+) -> Callable[['Number'], 'Result']:
+    # Each variant binds everything it needs as closure variables so that
+    # nothing is looked up or checked per call beyond the conversion itself.
+    if not exact:
+        def convert(n: 'Number') -> 'Result':
+            b: float = n * unit  # type: ignore[assignment]
+            index = bisect_right(thresholds, -b if b < 0 else b) - 1
+            if index <= 0:
+                return b, 'B'
+            return b / thresholds[index], suffixes[index]
+
+        return convert
+
+    scale = _EXACT_UNITS[unit]
+    divisors = tuple(_EXACT_UNITS[threshold] for threshold in thresholds)
+
+    if context is None:
+        def convert_exact(n: 'Number') -> 'Result':
+            b = _to_decimal(n) * scale
+            index = bisect_right(thresholds, -b if b < 0 else b) - 1
+            if index <= 0:
+                return b, 'B'
+            return b / divisors[index], suffixes[index]
+
+        return convert_exact
+
+    multiply = context.multiply
+    divide = context.divide
+
+    def convert_context(n: 'Number') -> 'Result':
+        b = multiply(_to_decimal(n, context), scale)
+        index = bisect_right(thresholds, -b if b < 0 else b) - 1
+        if index <= 0:
+            return b, 'B'
+        return divide(b, divisors[index]), suffixes[index]
+
+    return convert_context
+
+
+def _fixed_converter(unit: int, to: int, exact: bool, context: Optional['Context']) -> Callable[['Number'], 'Result']:
+    suffix = PREFIXES[to]
+    floor = to == BYTE
+
+    if not exact:
+        if floor:
+            def convert_floor(n: 'Number') -> 'Result':
+                b: float = n * unit  # type: ignore[assignment]
+                return b // to, suffix
+
+            return convert_floor
+
+        def convert(n: 'Number') -> 'Result':
+            b: float = n * unit  # type: ignore[assignment]
+            return b / to, suffix
+
+        return convert
+
+    scale = _EXACT_UNITS[unit]
+    divisor = _EXACT_UNITS[to]
+
+    if context is None:
+        divide = floordiv if floor else truediv
+
+        def convert_exact(n: 'Number') -> 'Result':
+            return divide(_to_decimal(n) * scale, divisor), suffix
+
+        return convert_exact
+
+    multiply = context.multiply
+    divide_context = context.divide_int if floor else context.divide
+
+    def convert_context(n: 'Number') -> 'Result':
+        return divide_context(multiply(_to_decimal(n, context), scale), divisor), suffix
+
+    return convert_context
+
+
+def _auto_formatter(unit: int, thresholds: Tuple[int, ...], templates: Tuple[str, ...]) -> Callable[['Number'], str]:
+    # The same as the conversion of _auto_converter but formats the amount
+    # directly with the template of its unit, saving a call and a lookup.
+    def format_auto(n: 'Number') -> str:
+        b: float = n * unit  # type: ignore[assignment]
+        index = bisect_right(thresholds, -b if b < 0 else b) - 1
+        text: str
+        if index <= 0:
+            text = templates[0] % b
+        else:
+            text = templates[index] % (b / thresholds[index])
+        return text
+
+    return format_auto
+
+
+def _fixed_formatter(convert: Callable[['Number'], 'Result'], template: str) -> Callable[['Number'], str]:
+    def format_fixed(n: 'Number') -> str:
+        text: str = template % convert(n)[0]
+        return text
+
+    return format_fixed
+
+
+def _printf_template(precision: Optional[int], suffix: str) -> str:
+    # The printf-style operator is the cheapest way to format a float
+    return f'{"%s" if precision is None else f"%.{precision}f"} {suffix.replace("%", "%%")}'
+
+
+def _template_formatter(convert: Callable[['Number'], 'Result'], template: str) -> Callable[['Number'], str]:
+    renders = {suffix: _compile_template(template, suffix).format for suffix in PREFIXES.values()}
+
+    def format_template(n: 'Number') -> str:
+        amount, suffix = convert(n)
+        return renders[suffix](amount)
+
+    return format_template
+
+
+def _compile_template(template: str, suffix: str) -> str:
+    # Renders the unit fields of the template so that only the amount is
+    # formatted per call, as the only positional field.
+    formatter = Formatter()
+    parts = []
+    for literal, field, spec, conversion in formatter.parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+        elif field == 'unit':
+            value = format(formatter.convert_field(suffix, conversion), spec or '')
+            parts.append(value.replace('{', '{{').replace('}', '}}'))
+        elif field == 'amount':
+            parts.append(f'{{0{"!" + conversion if conversion else ""}{":" + spec if spec else ""}}}')
+        else:
+            raise ValueError(f'{field!r} is not a field of the template, use amount or unit.')
+
+    return ''.join(parts)
+
+
+class Converter:
+    r"""A reusable equivalent of :func:`~binary.core.convert_units` with
+    fixed options. Validation and the choice of unit system happen once at
+    construction, which also picks a conversion function specialized for
+    the options, so that converting a value does no more than the
+    arithmetic and, when auto-scaling, a bisection over the unit thresholds.
+
+    :attr:`convert` returns the same unit pair as ``convert_units``, as does
+    calling the converter, which is slower due to the overhead of calling an
+    instance. :attr:`format` renders the pair with ``template``, compiled
+    into one template per unit so that only the amount is formatted per call.
+
+    :param unit: The unit ``n`` represents.
+    :type unit: one of the global constants
+    :param to: The unit to convert to.
+    :type to: one of the global constants
+    :param si: Assume SI units when no ``unit`` nor ``to`` is specified.
+    :type si: ``bool``
+    :param exact: Use decimal.Decimal for calculations.
+    :type exact: ``bool``
+    :param precision: The number of digits after the decimal point used by
+                      the default ``template``.
+    :type precision: ``int``
+    :param template: A format string with ``amount`` and ``unit`` fields.
+    :type template: ``str``
+    :param context: The context for decimal.Decimal calculations.
+    :type context: ``decimal.Context``
+    """
+    __slots__ = ('unit', 'to', 'si', 'exact', 'context', 'template', 'convert', 'format')
+
+    def __init__(
+        self,
+        unit: int = BYTE,
+        to: Optional[int] = None,
+        si: bool = False,
+        exact: bool = False,
+        precision: Optional[int] = None,
+        template: Optional[str] = None,
+        context: Optional['Context'] = None
+    ) -> None:
+        if unit not in PREFIXES:
+            raise ValueError(f'{unit} is not a valid binary unit.')
+        if to and to not in PREFIXES:
+            raise ValueError(f'{to} is not a valid unit.')
+
+        default = template is None
+        if template is None:
+            template = '{amount} {unit}' if precision is None else f'{{amount:.{precision}f}} {{unit}}'
+
+        self.unit = unit
+        self.to = to or None
+        self.si = si
+        self.exact = exact
+        self.context = context if exact else None
+        self.template = template
+
+        if exact and not _EXACT_UNITS:
+            _import_decimal()
+
+        prefixes = BINARY_PREFIXES if unit in BINARY_PREFIXES and not si else DECIMAL_PREFIXES
+        thresholds = tuple(prefixes)
+        convert: Callable[['Number'], 'Result']
+        if self.to:
+            convert = _fixed_converter(unit, self.to, exact, self.context)
+        else:
+            convert = _auto_converter(unit, thresholds, tuple(prefixes.values()), exact, self.context)
+
+        self.convert: Callable[['Number'], 'Result'] = convert
+        self.format: Callable[['Number'], str]
+        if exact or not default:
+            # Decimals keep their own formatting rather than being converted
+            # to floats by the printf-style operator
+            self.format = _template_formatter(convert, template)
+        elif self.to:
+            self.format = _fixed_formatter(convert, _printf_template(precision, PREFIXES[self.to]))
+        else:
+            templates = tuple(_printf_template(precision, suffix) for suffix in prefixes.values())
+            self.format = _auto_formatter(unit, thresholds, templates)
+
+    def __call__(self, n: 'Number') -> 'Result':
+        r"""Converts ``n``, the same as :attr:`convert`.
+
+        :param n: The number of ``unit``\ s.
+        :type n: ``int``, ``float``, ``decimal.Decimal`` or ``fractions.Fraction``
+        :rtype: tuple(quantity, string)
+        """
+        return self.convert(n)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(unit={self.unit!r}, to={self.to!r}, si={self.si!r}, '
+            f'exact={self.exact!r}, template={self.template!r}, context={self.context!r})'
+        )
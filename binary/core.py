@@ -1,30 +1,44 @@
-from decimal import Decimal
-from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple, Union
-import typing
+from bisect import bisect_right
 
-BYTE = 1
+# Neither decimal nor typing are imported at runtime because together they
+# account for most of the cost of importing this module, hence the quoted
+# annotations. The former is only loaded once exact calculations are requested.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from decimal import Context, Decimal, getcontext
+    from fractions import Fraction
+    from typing import Dict, Final, Optional, Tuple, Union
+
+    from ._units import BinaryUnits as BinaryUnits, DecimalUnits as DecimalUnits
+
+    Number = Union[float, Decimal, Fraction]
+    # The scale to bytes, thresholds, the amount that rounds up to the next
+    # unit, thresholds of integer digits, divisors and unit strings
+    RoundingTable = Tuple[float, Tuple[float, ...], float, Tuple[float, ...], Tuple[float, ...], Tuple[str, ...]]
+
+BYTE: 'Final' = 1
 
 # Binary
-KIBIBYTE = BYTE * 1024
-MEBIBYTE = KIBIBYTE * 1024
-GIBIBYTE = MEBIBYTE * 1024
-TEBIBYTE = GIBIBYTE * 1024
-PEBIBYTE = TEBIBYTE * 1024
-EXBIBYTE = PEBIBYTE * 1024
-ZEBIBYTE = EXBIBYTE * 1024
-YOBIBYTE = ZEBIBYTE * 1024
+KIBIBYTE: 'Final' = BYTE * 1024
+MEBIBYTE: 'Final' = KIBIBYTE * 1024
+GIBIBYTE: 'Final' = MEBIBYTE * 1024
+TEBIBYTE: 'Final' = GIBIBYTE * 1024
+PEBIBYTE: 'Final' = TEBIBYTE * 1024
+EXBIBYTE: 'Final' = PEBIBYTE * 1024
+ZEBIBYTE: 'Final' = EXBIBYTE * 1024
+YOBIBYTE: 'Final' = ZEBIBYTE * 1024
 
 # SI
-KILOBYTE = BYTE * 1000
-MEGABYTE = KILOBYTE * 1000
-GIGABYTE = MEGABYTE * 1000
-TERABYTE = GIGABYTE * 1000
-PETABYTE = TERABYTE * 1000
-EXABYTE = PETABYTE * 1000
-ZETTABYTE = EXABYTE * 1000
-YOTTABYTE = ZETTABYTE * 1000
-
-BINARY_PREFIXES = {
+KILOBYTE: 'Final' = BYTE * 1000
+MEGABYTE: 'Final' = KILOBYTE * 1000
+GIGABYTE: 'Final' = MEGABYTE * 1000
+TERABYTE: 'Final' = GIGABYTE * 1000
+PETABYTE: 'Final' = TERABYTE * 1000
+EXABYTE: 'Final' = PETABYTE * 1000
+ZETTABYTE: 'Final' = EXABYTE * 1000
+YOTTABYTE: 'Final' = ZETTABYTE * 1000
+
+BINARY_PREFIXES: 'Final' = {
     BYTE: 'B',
     KIBIBYTE: 'KiB',
     MEBIBYTE: 'MiB',
@@ -35,7 +49,7 @@ BINARY_PREFIXES = {
     ZEBIBYTE: 'ZiB',
     YOBIBYTE: 'YiB',
 }
-DECIMAL_PREFIXES = {
+DECIMAL_PREFIXES: 'Final' = {
     BYTE: 'B',
     KILOBYTE: 'KB',
     MEGABYTE: 'MB',
@@ -47,91 +61,83 @@ DECIMAL_PREFIXES = {
     YOTTABYTE: 'YB',
 }
 
-PREFIXES = BINARY_PREFIXES.copy()
+PREFIXES: 'Final' = BINARY_PREFIXES.copy()
 PREFIXES.update(DECIMAL_PREFIXES)
 
+_BINARY_UNITS: 'Final' = tuple(BINARY_PREFIXES)
+_BINARY_STRINGS: 'Final' = tuple(BINARY_PREFIXES.values())
+_DECIMAL_UNITS: 'Final' = tuple(DECIMAL_PREFIXES)
+_DECIMAL_STRINGS: 'Final' = tuple(DECIMAL_PREFIXES.values())
+_EXACT_UNITS: 'Dict[int, Decimal]' = {}
+# Tables of convert_units_rounded by its arguments other than n, built on
+# first use.
+_ROUNDING_TABLES: 'Dict[Tuple[int, bool, int, Optional[int]], RoundingTable]' = {}
+
+# Whether this module was compiled with mypyc, see the README. Constants are
+# declared final so that the compiled module can inline them.
+COMPILED: 'Final' = not __file__.endswith(('.py', '.pyc'))
+
+
+def _getattr(name: str) -> object:
+    # The unit tuples require typing so they are only built on first access.
+    if name in ('BinaryUnits', 'DecimalUnits'):
+        from . import _units
+
+        value = getattr(_units, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Assigned rather than defined because mypyc cannot compile a module level
+# __getattr__, see COMPILED.
+globals()['__getattr__'] = _getattr
 
-class _BinaryUnits(NamedTuple):
-    BYTE: int
-    B: int
-    KIBIBYTE: int
-    KB: int
-    MEBIBYTE: int
-    MB: int
-    GIBIBYTE: int
-    GB: int
-    TEBIBYTE: int
-    TB: int
-    PEBIBYTE: int
-    PB: int
-    EXBIBYTE: int
-    EB: int
-    ZEBIBYTE: int
-    ZB: int
-    YOBIBYTE: int
-    YB: int
-
-
-BinaryUnits = _BinaryUnits(
-    BYTE, BYTE,
-    KIBIBYTE, KIBIBYTE,
-    MEBIBYTE, MEBIBYTE,
-    GIBIBYTE, GIBIBYTE,
-    TEBIBYTE, TEBIBYTE,
-    PEBIBYTE, PEBIBYTE,
-    EXBIBYTE, EXBIBYTE,
-    ZEBIBYTE, ZEBIBYTE,
-    YOBIBYTE, YOBIBYTE,
-)
-
-
-class _DecimalUnits(NamedTuple):
-    BYTE: int
-    B: int
-    KILOBYTE: int
-    KB: int
-    MEGABYTE: int
-    MB: int
-    GIGABYTE: int
-    GB: int
-    TERABYTE: int
-    TB: int
-    PETABYTE: int
-    PB: int
-    EXABYTE: int
-    EB: int
-    ZETTABYTE: int
-    ZB: int
-    YOTTABYTE: int
-    YB: int
-
-
-DecimalUnits = _DecimalUnits(
-    BYTE, BYTE,
-    KILOBYTE, KILOBYTE,
-    MEGABYTE, MEGABYTE,
-    GIGABYTE, GIGABYTE,
-    TERABYTE, TERABYTE,
-    PETABYTE, PETABYTE,
-    EXABYTE, EXABYTE,
-    ZETTABYTE, ZETTABYTE,
-    YOTTABYTE, YOTTABYTE,
-)
+
+def _import_decimal() -> None:
+    global Decimal, getcontext
+    from decimal import Decimal, getcontext
+
+    # Other threads treat a non-empty table as initialized, so it must be
+    # filled in a single update from a complete dict rather than a unit at
+    # a time.
+    _EXACT_UNITS.update({unit: Decimal(unit) for unit in PREFIXES})
+
+
+def _to_decimal(n: 'Number', context: 'Optional[Context]' = None) -> 'Decimal':
+    if not _EXACT_UNITS:
+        _import_decimal()
+
+    # Avoid the string round trip for types that Decimal represents exactly.
+    if isinstance(n, Decimal):
+        return n
+    elif isinstance(n, int):
+        return Decimal(n)
+
+    denominator = getattr(n, 'denominator', None)
+    if denominator is not None:
+        return (context or getcontext()).divide(Decimal(n.numerator), Decimal(denominator))  # type: ignore[union-attr]
+
+    # Floats use their shortest representation, i.e. 3.14 is exactly 3.14
+    return Decimal(str(n))
 
 
 def convert_units(
-    n: float,
+    n: 'Number',
     unit: int = BYTE,
-    to: Optional[int] = None,
+    to: 'Optional[int]' = None,
     si: bool = False,
-    exact: bool = False
-) -> Tuple[Union[float, Decimal], str]:
+    exact: bool = False,
+    context: 'Optional[Context]' = None
+) -> 'Tuple[Union[float, Decimal], str]':
     r"""Converts between and within binary and decimal units. If no ``unit``
     is specified, ``n`` is assumed to already be in bytes. If no ``to`` is
     specified, ``n`` will be converted to the highest unit possible. If
     no ``unit`` nor ``to`` is specified, the output will be binary units
     unless ``si`` is ``True``. If ``exact`` is ``True``. the calculations
-    will use decimal.Decimal.
+    will use decimal.Decimal, performed with ``context`` if provided or
+    else the current thread's context.
 
     Binary units conform to IEC standards, see:
     https://en.wikipedia.org/wiki/Binary_prefix
@@ -141,8 +147,8 @@ def convert_units(
     Decimal units conform to SI standards, see:
     https://en.wikipedia.org/wiki/International_System_of_Units
 
-    :param n: The number of ``unit``s.
-    :type n: ``int`` or ``float``
+    :param n: The number of ``unit``\ s.
+    :type n: ``int``, ``float``, ``decimal.Decimal`` or ``fractions.Fraction``
     :param unit: The unit ``n`` represents.
     :type unit: one of the global constants
     :param to: The unit to convert to.
@@ -151,6 +157,8 @@ def convert_units(
     :type si: ``bool``
     :param exact: Use decimal.Decimal for calculations.
     :type exact: ``bool``
+    :param context: The context for decimal.Decimal calculations.
+    :type context: ``decimal.Context``
     :returns: The unit pair: a numeric quantity and the unit's string.
     :rtype: tuple(quantity, string)
     """
@@ -159,54 +167,226 @@ def convert_units(
 
     # Always work with bytes to simplify logic.
     b: Union[float, Decimal]
+    d: Decimal
     if exact:
-        b = Decimal(str(n)) * unit
+        d = _to_decimal(n, context)
+        if context is None:
+            b = d = d * _EXACT_UNITS[unit]
+        else:
+            b = d = context.multiply(d, _EXACT_UNITS[unit])
     else:
-        b = n * unit
+        b = n * unit  # type: ignore[assignment]
 
     if to:
-        try:
-            return b // to if to == BYTE else b / to, PREFIXES[to]
-        except KeyError:
+        if to not in PREFIXES:
             raise ValueError(f'{to} is not a valid unit.')
 
-    babs = typing.cast(Union[float, Decimal], abs(b))
+        if exact and context is not None:
+            if to == BYTE:
+                return context.divide_int(d, _EXACT_UNITS[to]), PREFIXES[to]
+            return context.divide(d, _EXACT_UNITS[to]), PREFIXES[to]
+
+        return b // to if to == BYTE else b / to, PREFIXES[to]
+
+    babs = -b if b < 0 else b
 
     if unit in BINARY_PREFIXES and not si:
         if babs < KIBIBYTE:
             return b, 'B'
         elif babs < MEBIBYTE:
-            return b / KIBIBYTE, 'KiB'
+            to = KIBIBYTE
         elif babs < GIBIBYTE:
-            return b / MEBIBYTE, 'MiB'
+            to = MEBIBYTE
         elif babs < TEBIBYTE:
-            return b / GIBIBYTE, 'GiB'
+            to = GIBIBYTE
         elif babs < PEBIBYTE:
-            return b / TEBIBYTE, 'TiB'
+            to = TEBIBYTE
         elif babs < EXBIBYTE:
-            return b / PEBIBYTE, 'PiB'
+            to = PEBIBYTE
         elif babs < ZEBIBYTE:
-            return b / EXBIBYTE, 'EiB'
+            to = EXBIBYTE
         elif babs < YOBIBYTE:
-            return b / ZEBIBYTE, 'ZiB'
+            to = ZEBIBYTE
         else:
-            return b / YOBIBYTE, 'YiB'
+            to = YOBIBYTE
     else:
         if babs < KILOBYTE:
             return b, 'B'
         elif babs < MEGABYTE:
-            return b / KILOBYTE, 'KB'
+            to = KILOBYTE
         elif babs < GIGABYTE:
-            return b / MEGABYTE, 'MB'
+            to = MEGABYTE
         elif babs < TERABYTE:
-            return b / GIGABYTE, 'GB'
+            to = GIGABYTE
         elif babs < PETABYTE:
-            return b / TERABYTE, 'TB'
+            to = TERABYTE
         elif babs < EXABYTE:
-            return b / PETABYTE, 'PB'
+            to = PETABYTE
         elif babs < ZETTABYTE:
-            return b / EXABYTE, 'EB'
+            to = EXABYTE
         elif babs < YOTTABYTE:
-            return b / ZETTABYTE, 'ZB'
+            to = ZETTABYTE
         else:
-            return b / YOTTABYTE, 'YB'
+            to = YOTTABYTE
+
+    if exact:
+        if context is None:
+            return d / _EXACT_UNITS[to], PREFIXES[to]
+        return context.divide(d, _EXACT_UNITS[to]), PREFIXES[to]
+
+    return b / to, PREFIXES[to]
+
+
+def convert_units_int(
+    n: int,
+    unit: int = BYTE,
+    to: 'Optional[int]' = None,
+    si: bool = False
+) -> 'Tuple[int, int, str]':
+    r"""Integer-only counterpart of :func:`convert_units`. No float nor
+    decimal.Decimal is ever created so results are exact for any magnitude.
+    Rather than a fractional quantity, the whole number of units is
+    returned along with the remaining bytes. Both take the sign of ``n``
+    so that ``quotient * unit + remainder`` always equals the byte count.
+
+    When auto-scaling binary units, the prefix is derived directly from the
+    bit length of the byte count.
+
+    :param n: The number of ``unit``\ s.
+    :type n: ``int``
+    :param unit: The unit ``n`` represents.
+    :type unit: one of the global constants
+    :param to: The unit to convert to.
+    :type to: one of the global constants
+    :param si: Assume SI units when no ``unit`` nor ``to`` is specified.
+    :type si: ``bool``
+    :returns: The whole number of units, the remaining bytes and the unit's
+              string.
+    :rtype: tuple(int, int, string)
+    """
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+
+    b = n * unit
+    babs = -b if b < 0 else b
+
+    if to:
+        try:
+            suffix = PREFIXES[to]
+        except KeyError:
+            raise ValueError(f'{to} is not a valid unit.')
+    elif unit in BINARY_PREFIXES and not si:
+        # Each binary prefix spans exactly 10 bits.
+        index = (babs.bit_length() - 1) // 10
+        if index < 0:
+            index = 0
+        elif index > 8:
+            index = 8
+
+        to, suffix = _BINARY_UNITS[index], _BINARY_STRINGS[index]
+    else:
+        index = bisect_right(_DECIMAL_UNITS, babs) - 1
+        if index < 0:
+            index = 0
+
+        to, suffix = _DECIMAL_UNITS[index], _DECIMAL_STRINGS[index]
+
+    quotient, remainder = divmod(babs, to)
+    if b < 0:
+        return -quotient, -remainder, suffix
+
+    return quotient, remainder, suffix
+
+
+def _rounding_table(unit: int, si: bool, precision: int, digits: 'Optional[int]') -> 'RoundingTable':
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    if precision < 0:
+        raise ValueError(f'{precision} is not a valid precision.')
+    if digits is not None and digits < 1:
+        raise ValueError(f'{digits} is not a valid number of significant digits.')
+
+    if unit in BINARY_PREFIXES and not si:
+        units, strings = _BINARY_UNITS, _BINARY_STRINGS
+    else:
+        units, strings = _DECIMAL_UNITS, _DECIMAL_STRINGS
+
+    # The largest amount of a unit, e.g. 1023, has the fewest decimals
+    base = units[1]
+    top = precision if digits is None else max(digits - len(str(base - 1)), 0)
+
+    # An amount is displayed in the next unit as soon as it would round up to
+    # the base of the unit system, e.g. from 1023.995 KiB onwards at a
+    # precision of 2.
+    half = 0.5 / 10 ** top
+    thresholds = tuple(unit - half * previous for previous, unit in zip(units, units[1:]))
+
+    # The amounts at which rounding adds an integer digit, if the number of
+    # decimals depends on them.
+    digit_thresholds: 'Tuple[float, ...]' = ()
+    if digits is not None:
+        digit_thresholds = tuple(
+            10 ** i - 0.5 / 10 ** max(digits - i, 0) for i in range(1, len(str(base - 1)))
+        )
+
+    # Floats throughout as comparing them with ints is much slower
+    table = _ROUNDING_TABLES[unit, si, precision, digits] = (
+        float(unit), thresholds, base - half, digit_thresholds, tuple(map(float, units)), strings
+    )
+    return table
+
+
+def convert_units_rounded(
+    n: float,
+    unit: int = BYTE,
+    si: bool = False,
+    precision: int = 2,
+    digits: 'Optional[int]' = None
+) -> 'Tuple[float, int, str]':
+    r"""Converts ``n`` to the highest unit possible like
+    :func:`convert_units` and rounds the quantity, choosing the unit after
+    rounding so that e.g. 1023.997 KiB becomes 1.00 MiB rather than
+    1024.00 KiB.
+
+    Either a fixed number of digits after the decimal point is kept, or the
+    number of decimals is adapted to keep ``digits`` significant digits.
+    Integer digits are never rounded away, so e.g. 1000 KiB keeps 4
+    significant digits.
+
+    The thresholds for every combination of arguments are computed once, so
+    the unit is still chosen in a single pass without converting twice.
+
+    :param n: The number of ``unit``\ s.
+    :type n: ``int`` or ``float``
+    :param unit: The unit ``n`` represents.
+    :type unit: one of the global constants
+    :param si: Assume SI units even if ``unit`` is binary.
+    :type si: ``bool``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :param digits: The number of significant digits, overriding
+                   ``precision``.
+    :type digits: ``int``
+    :returns: The rounded quantity, the number of digits after the decimal
+              point it should be displayed with and the unit's string.
+    :rtype: tuple(float, int, string)
+    """
+    try:
+        scale, thresholds, limit, digit_thresholds, units, strings = _ROUNDING_TABLES[unit, si, precision, digits]
+    except KeyError:
+        scale, thresholds, limit, digit_thresholds, units, strings = _rounding_table(unit, si, precision, digits)
+
+    b = n * scale
+    index = bisect_right(thresholds, -b if b < 0 else b)
+    amount = b / units[index] if index else b
+
+    # The thresholds and the division round independently, so an amount may
+    # still land on the base.
+    if index < 8 and (-amount if amount < 0 else amount) >= limit:
+        index += 1
+        amount = b / units[index]
+
+    if digits is not None:
+        precision = max(digits - 1 - bisect_right(digit_thresholds, -amount if amount < 0 else amount), 0)
+
+    return round(amount, precision), precision, strings[index]
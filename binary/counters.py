@@ -0,0 +1,164 @@
+"""Byte counters shared by many threads, e.g. for status endpoints.
+
+Every thread increments its own shard so that threads never write to the same
+object, which would otherwise contend on a lock or, on free-threaded builds
+of Python, on the reference counts and cache lines of a shared integer.
+Shards are only merged when a value is read.
+"""
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .styles import Style, formatter
+
+
+class ShardedCounter:
+    r"""A counter that is cheap to increment from any number of threads.
+
+    The first increment from a thread creates its shard, after which
+    :meth:`add` touches nothing shared with other threads. Reading
+    :attr:`value` sums the shards under a lock and folds those of threads
+    that have exited into a single total, so memory is proportional to the
+    number of live threads.
+
+    :meth:`humanize` renders the value in ``style`` and caches the string
+    until the value changes.
+
+    :param style: The name of one of :data:`~binary.styles.STYLES` or a
+                  style.
+    :type style: ``str`` or :class:`~binary.styles.Style`
+    """
+    __slots__ = ('style', '_local', '_lock', '_shards', '_retired', '_render', '_rendered')
+
+    def __init__(self, style: Union[str, Style] = 'iec') -> None:
+        self.style = style
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, List[int]]] = []
+        self._retired = 0
+        self._render: Callable[[float], str] = formatter(style)
+        self._rendered: Optional[Tuple[int, str]] = None
+
+    def add(self, n: int = 1) -> None:
+        r"""Adds ``n`` to the counter from the current thread.
+
+        :param n: The number to add, e.g. of bytes.
+        :type n: ``int``
+        """
+        try:
+            self._local.shard[0] += n
+        except AttributeError:
+            self._register()[0] += n
+
+    def _register(self) -> List[int]:
+        shard = self._local.shard = [0]
+        with self._lock:
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    @property
+    def value(self) -> int:
+        """The sum of every increment so far. Increments made concurrently
+        with the read may or may not be included.
+
+        :rtype: ``int``
+        """
+        with self._lock:
+            total = self._retired
+            live = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                    total += shard[0]
+                else:
+                    # The shard of an exited thread can no longer change
+                    self._retired += shard[0]
+                    total += shard[0]
+
+            self._shards = live
+
+        return total
+
+    def humanize(self) -> str:
+        """Renders the current value, reusing the previous string if the
+        value has not changed since.
+
+        :rtype: ``str``
+        """
+        value = self.value
+        rendered = self._rendered
+        if rendered is None or rendered[0] != value:
+            rendered = self._rendered = (value, self._render(value))
+        return rendered[1]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(value={self.value!r}, style={self.style!r})'
+
+
+class CounterRegistry:
+    r"""Named :class:`ShardedCounter`\ s, e.g. bytes read, written and
+    cached, that are read together.
+
+    .. code-block:: python
+
+        >>> counters = CounterRegistry()
+        >>> read = counters.counter('read')
+        >>> read.add(1536)
+        >>> counters.humanize()
+        {'read': '1.50 KiB'}
+
+    :param style: The name of one of :data:`~binary.styles.STYLES` or a
+                  style used by every counter.
+    :type style: ``str`` or :class:`~binary.styles.Style`
+    """
+    __slots__ = ('style', '_lock', '_counters', '_render', '_rendered')
+
+    def __init__(self, style: Union[str, Style] = 'iec') -> None:
+        self.style = style
+        self._lock = threading.Lock()
+        self._counters: Dict[str, ShardedCounter] = {}
+        self._render: Callable[[float], str] = formatter(style)
+        self._rendered: Optional[Tuple[Dict[str, int], Dict[str, str]]] = None
+
+    def counter(self, name: str) -> ShardedCounter:
+        r"""Returns the counter called ``name``, creating it if necessary.
+        Threads should keep the counter rather than look it up for every
+        increment.
+
+        :param name: The name of the counter.
+        :type name: ``str``
+        :rtype: :class:`ShardedCounter`
+        """
+        try:
+            return self._counters[name]
+        except KeyError:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = self._counters[name] = ShardedCounter(self.style)
+                return counter
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._counters
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def snapshot(self) -> Dict[str, int]:
+        """The value of every counter.
+
+        :rtype: ``dict``
+        """
+        return {name: counter.value for name, counter in list(self._counters.items())}
+
+    def humanize(self) -> Dict[str, str]:
+        """The rendered value of every counter. Nothing is rendered again
+        unless a value has changed since the previous call.
+
+        :rtype: ``dict``
+        """
+        snapshot = self.snapshot()
+        rendered = self._rendered
+        if rendered is None or rendered[0] != snapshot:
+            render = self._render
+            rendered = self._rendered = (snapshot, {name: render(value) for name, value in snapshot.items()})
+        return dict(rendered[1])
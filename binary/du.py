@@ -0,0 +1,186 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISDIR
+from typing import Callable, Generator, List, NamedTuple, Optional, Set, Tuple, Union
+
+
+class DirectoryUsage(NamedTuple):
+    path: str
+    apparent: int
+    allocated: int
+    files: int
+    depth: int
+
+
+class _Node:
+    __slots__ = ('path', 'parent', 'depth', 'apparent', 'allocated', 'files', 'pending')
+
+    def __init__(self, path: str, parent: Optional['_Node'], depth: int, apparent: int, allocated: int) -> None:
+        self.path = path
+        self.parent = parent
+        self.depth = depth
+        self.apparent = apparent
+        self.allocated = allocated
+        self.files = 0
+        # The scan of the directory itself is pending until it has listed
+        # its entries, after which each subdirectory is.
+        self.pending = 1
+
+
+def _allocated(st: os.stat_result) -> int:
+    # Windows does not report blocks
+    blocks = getattr(st, 'st_blocks', None)
+    return st.st_size if blocks is None else blocks * 512
+
+
+def scan(
+    path: Union[str, 'os.PathLike[str]'] = '.',
+    workers: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    follow_symlinks: bool = False,
+    onerror: Optional[Callable[[OSError], object]] = None
+) -> Generator[DirectoryUsage, None, None]:
+    r"""Walks a directory tree with a pool of threads, so that many ``stat``
+    calls are in flight at once, and lazily yields the totals of every
+    directory as soon as its whole subtree has been scanned. Children are
+    therefore always yielded before their parent and ``path`` itself is
+    yielded last.
+
+    Each total counts the apparent size, i.e. the sum of ``st_size``, and
+    the allocated size on disk of every file and directory in the subtree,
+    including the directory itself. Files with several hard links are only
+    counted once, like ``du`` does.
+
+    Memory does not grow with the number of files but with the number of
+    directories whose subtree is unfinished. Every directory is queued for
+    the pool as soon as it is found, so a wide tree may have most of its
+    directories pending at once.
+
+    If ``path`` is not a directory, like ``du`` its own usage is the only
+    one yielded, as a single file at depth 0.
+
+    :param path: The root of the tree.
+    :type path: ``str`` or path-like
+    :param workers: The number of threads, defaults to that of
+                    :class:`~concurrent.futures.ThreadPoolExecutor`.
+    :type workers: ``int``
+    :param max_depth: Only yield directories at most this many levels below
+                      ``path``, which is at depth 0. Deeper directories are
+                      still counted.
+    :type max_depth: ``int``
+    :param follow_symlinks: Count the targets of symbolic links rather than
+                            the links themselves.
+    :type follow_symlinks: ``bool``
+    :param onerror: Called with every ``OSError`` raised while scanning,
+                    which otherwise are ignored.
+    :type onerror: callable
+    :raises OSError: If ``path`` cannot be accessed.
+    :rtype: generator of :class:`DirectoryUsage`
+    """
+    root_path = os.fspath(path)
+    root_stat = os.stat(root_path, follow_symlinks=follow_symlinks)
+    if not S_ISDIR(root_stat.st_mode):
+        yield DirectoryUsage(root_path, root_stat.st_size, _allocated(root_stat), 1, 0)
+        return
+
+    root = _Node(root_path, None, 0, root_stat.st_size, _allocated(root_stat))
+
+    results: 'queue.Queue[Union[_Node, BaseException]]' = queue.Queue()
+    lock = threading.Lock()
+    seen: Set[Tuple[int, int]] = set()
+    stopped = threading.Event()
+    if follow_symlinks:
+        seen.add((root_stat.st_dev, root_stat.st_ino))
+
+    def complete(node: Optional[_Node]) -> None:
+        # Called with the lock held once a scan finishes, adding the totals of
+        # every directory it completes to its parent.
+        while node is not None:
+            node.pending -= 1
+            if node.pending:
+                return
+
+            results.put(node)
+            parent = node.parent
+            if parent is not None:
+                parent.apparent += node.apparent
+                parent.allocated += node.allocated
+                parent.files += node.files
+                # Allow finished subtrees to be freed
+                node.parent = None
+
+            node = parent
+
+    def first_time(st: os.stat_result) -> bool:
+        key = (st.st_dev, st.st_ino)
+        with lock:
+            if key in seen:
+                return False
+
+            seen.add(key)
+            return True
+
+    def visit(node: _Node) -> None:
+        apparent = allocated = files = 0
+        children: List[_Node] = []
+
+        try:
+            if stopped.is_set():
+                return
+
+            with os.scandir(node.path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                    except OSError as e:
+                        if onerror is not None:
+                            onerror(e)
+                        continue
+
+                    if is_dir:
+                        if follow_symlinks and not first_time(st):
+                            continue
+                        children.append(_Node(entry.path, node, node.depth + 1, st.st_size, _allocated(st)))
+                    elif st.st_nlink <= 1 or first_time(st):
+                        apparent += st.st_size
+                        allocated += _allocated(st)
+                        files += 1
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+        except BaseException as e:
+            results.put(e)
+        finally:
+            with lock:
+                node.apparent += apparent
+                node.allocated += allocated
+                node.files += files
+                node.pending += len(children)
+                complete(node)
+
+        for child in children:
+            try:
+                executor.submit(visit, child)
+            except RuntimeError:
+                # The consumer stopped iterating and the pool was shut down
+                return
+
+    executor = ThreadPoolExecutor(workers)
+    try:
+        executor.submit(visit, root)
+        while True:
+            item = results.get()
+            if isinstance(item, BaseException):
+                raise item
+
+            if max_depth is None or item.depth <= max_depth:
+                yield DirectoryUsage(item.path, item.apparent, item.allocated, item.files, item.depth)
+
+            if item is root:
+                break
+    finally:
+        stopped.set()
+        executor.shutdown(wait=True, cancel_futures=True)
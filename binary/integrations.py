@@ -0,0 +1,240 @@
+"""Vectorized conversion and parsing of pandas and Arrow size columns.
+
+Importing this module registers a ``binary`` accessor on ``pandas.Series``
+when pandas is installed. The Arrow helpers require pyarrow. Neither is a
+dependency of the package.
+"""
+from typing import Any, List, Optional, Tuple
+import typing
+
+from .batch import _convert_array, _unit_system
+from .core import BYTE, PREFIXES
+from .parsing import BIT_SUFFIXES, SUFFIXES
+
+# The numbers parse_size accepts: integer and float literals, optionally
+# with underscores between digits, but neither inf nor nan
+_DIGITS = r'[0-9](?:_?[0-9])*'
+NUMBER_PATTERN = rf'[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?'
+# The quantity and an optional alphabetic suffix, see parse_size. Values
+# that do not match have no valid number.
+SIZE_PATTERN = rf'^\s*(?P<number>{NUMBER_PATTERN})\s*(?P<suffix>[A-Za-z]*)\s*$'
+
+
+def _check_units(unit: int, to: Optional[int]) -> None:
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    if to and to not in PREFIXES:
+        raise ValueError(f'{to} is not a valid unit.')
+
+
+def _convert(values: Any, unit: int, to: Optional[int], si: bool) -> Tuple[Any, Any, Tuple[str, ...]]:
+    # Returns the quantities, the index of each one's unit and the units.
+    import numpy as np
+
+    _check_units(unit, to)
+    thresholds, float_thresholds, suffixes = _unit_system(unit, si)
+    amounts, indices = _convert_array(values, unit, to, thresholds, float_thresholds)
+
+    if indices is None:
+        return amounts, np.zeros(amounts.shape, dtype=np.int8), (PREFIXES[typing.cast(int, to)],)
+
+    return amounts, indices.astype(np.int8), suffixes
+
+
+def _humanize(values: Any, unit: int, si: bool, precision: int) -> Any:
+    """Renders an array of sizes as an object array of strings. Only the
+    conversion is vectorized: formatting is a Python level loop over the
+    rows, as NumPy cannot build strings any faster.
+    """
+    import numpy as np
+
+    amounts, indices, suffixes = _convert(values, unit, None, si)
+    # One template per unit is about twice as fast as numpy.char formatting
+    templates = [f'%.{precision}f {suffix}' for suffix in suffixes]
+    return np.array([templates[i] % a for a, i in zip(amounts.tolist(), indices.tolist())], dtype=object)
+
+
+def _lookup_units(suffixes: List[str]) -> List[float]:
+    units = []
+    for suffix in suffixes:
+        unit = SUFFIXES.get(suffix)
+        if unit is None:
+            bits = BIT_SUFFIXES.get(suffix)
+            if bits is not None:
+                units.append(bits / 8)
+                continue
+
+            unit = SUFFIXES.get(suffix.lower())
+            if unit is None:
+                raise ValueError(f'Unknown unit: {suffix!r}')
+
+        units.append(float(unit))
+
+    return units
+
+
+try:
+    import pandas as pd
+except ImportError:
+    pass
+else:
+    @pd.api.extensions.register_series_accessor('binary')
+    class SizeAccessor:
+        r"""Converts and parses size columns without a Python level loop per
+        row, available as ``Series.binary``. Only :meth:`humanize` formats
+        each row in Python.
+        """
+        def __init__(self, series: 'pd.Series[Any]') -> None:
+            self._series = series
+
+        def _values(self) -> Any:
+            import numpy as np
+
+            return self._series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        def convert(self, unit: int = BYTE, to: Optional[int] = None, si: bool = False) -> 'pd.DataFrame':
+            r"""Vectorized :func:`~binary.core.convert_units`.
+
+            :param unit: The unit the values represent.
+            :type unit: one of the global constants
+            :param to: The unit to convert to.
+            :type to: one of the global constants
+            :param si: Assume SI units when no ``unit`` nor ``to`` is
+                       specified.
+            :type si: ``bool``
+            :returns: An ``amount`` column and a categorical ``unit`` column.
+            :rtype: ``pandas.DataFrame``
+            """
+            amounts, indices, suffixes = _convert(self._values(), unit, to, si)
+            units = pd.Categorical.from_codes(indices, categories=list(suffixes))
+            return pd.DataFrame({'amount': amounts, 'unit': units}, index=self._series.index)
+
+        def humanize(self, unit: int = BYTE, si: bool = False, precision: int = 2) -> 'pd.Series[Any]':
+            r"""Renders every value in the highest unit possible, e.g.
+            ``'1.50 KiB'``. Missing values stay missing. The conversion is
+            vectorized, the formatting is a Python level loop per row.
+
+            :param unit: The unit the values represent.
+            :type unit: one of the global constants
+            :param si: Use decimal rather than binary units.
+            :type si: ``bool``
+            :param precision: The number of digits after the decimal point.
+            :type precision: ``int``
+            :rtype: ``pandas.Series``
+            """
+            result = pd.Series(
+                _humanize(self._values(), unit, si, precision), index=self._series.index, dtype=object
+            )
+            return result.where(self._series.notna(), None)
+
+        def parse(self) -> 'pd.Series[Any]':
+            r"""Vectorized :func:`~binary.parsing.parse_size` returning
+            ``float64`` numbers of bytes. Missing values stay missing.
+
+            :raises ValueError: If a value is not a valid size.
+            :rtype: ``pandas.Series``
+            """
+            parts = self._series.astype('string').str.extract(SIZE_PATTERN)
+            if (parts['number'].isna() & self._series.notna()).any():
+                raise ValueError('Sizes must start with a number.')
+
+            suffixes = parts['suffix'].astype('category')
+            units = _lookup_units(list(suffixes.cat.categories))
+            multipliers = pd.Series(suffixes.cat.codes.map(dict(enumerate(units))), index=parts.index)
+            numbers = pd.to_numeric(parts['number'].str.replace('_', '', regex=False)).astype('float64')
+            return numbers * multipliers
+
+
+def _map_chunks(func: Any, array: Any) -> Any:
+    import pyarrow as pa
+
+    if isinstance(array, pa.ChunkedArray):
+        return pa.chunked_array([func(chunk) for chunk in array.chunks])
+
+    return func(array)
+
+
+def convert_array(array: Any, unit: int = BYTE, to: Optional[int] = None, si: bool = False) -> Any:
+    r"""Vectorized :func:`~binary.core.convert_units` for a numeric Arrow
+    array.
+
+    :param array: The numbers of ``unit``\ s.
+    :type array: ``pyarrow.Array`` or ``pyarrow.ChunkedArray``
+    :param unit: The unit the values represent.
+    :type unit: one of the global constants
+    :param to: The unit to convert to.
+    :type to: one of the global constants
+    :param si: Assume SI units when no ``unit`` nor ``to`` is specified.
+    :type si: ``bool``
+    :returns: Structs of a ``float64`` ``amount`` and a dictionary encoded
+              ``unit``.
+    :rtype: ``pyarrow.StructArray`` or ``pyarrow.ChunkedArray``
+    """
+    import pyarrow as pa
+
+    def convert(chunk: Any) -> Any:
+        values = chunk.to_numpy(zero_copy_only=False).astype('float64', copy=False)
+        amounts, indices, suffixes = _convert(values, unit, to, si)
+        mask = chunk.is_null().to_numpy(zero_copy_only=False)
+        return pa.StructArray.from_arrays(
+            [
+                pa.array(amounts, mask=mask),
+                pa.DictionaryArray.from_arrays(pa.array(indices, mask=mask), pa.array(suffixes)),
+            ],
+            names=['amount', 'unit'],
+        )
+
+    return _map_chunks(convert, array)
+
+
+def humanize_array(array: Any, unit: int = BYTE, si: bool = False, precision: int = 2) -> Any:
+    r"""Renders every value of a numeric Arrow array in the highest unit
+    possible, e.g. ``'1.50 KiB'``. Nulls stay null. The conversion is
+    vectorized, the formatting is a Python level loop per row.
+
+    :param array: The numbers of ``unit``\ s.
+    :type array: ``pyarrow.Array`` or ``pyarrow.ChunkedArray``
+    :param unit: The unit the values represent.
+    :type unit: one of the global constants
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :rtype: ``pyarrow.StringArray`` or ``pyarrow.ChunkedArray``
+    """
+    import pyarrow as pa
+
+    def humanize(chunk: Any) -> Any:
+        values = chunk.to_numpy(zero_copy_only=False).astype('float64', copy=False)
+        mask = chunk.is_null().to_numpy(zero_copy_only=False)
+        return pa.array(_humanize(values, unit, si, precision), type=pa.string(), mask=mask)
+
+    return _map_chunks(humanize, array)
+
+
+def parse_array(array: Any) -> Any:
+    r"""Vectorized :func:`~binary.parsing.parse_size` for an Arrow string
+    array. Nulls stay null.
+
+    :param array: The sizes to parse.
+    :type array: ``pyarrow.StringArray`` or ``pyarrow.ChunkedArray``
+    :raises ValueError: If a value is not a valid size.
+    :returns: The numbers of bytes.
+    :rtype: ``pyarrow.DoubleArray`` or ``pyarrow.ChunkedArray``
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    def parse(chunk: Any) -> Any:
+        parts = pc.extract_regex(chunk, SIZE_PATTERN)
+        if parts.null_count > chunk.null_count:
+            raise ValueError('Sizes must start with a number.')
+
+        numbers = pc.cast(pc.replace_substring(pc.struct_field(parts, 'number'), '_', ''), pa.float64())
+
+        suffixes = pc.struct_field(parts, 'suffix').dictionary_encode()
+        multipliers = pa.array(_lookup_units(suffixes.dictionary.to_pylist()), type=pa.float64())
+        return pc.multiply(numbers, multipliers.take(suffixes.indices))
+
+    return _map_chunks(parse, array)
+
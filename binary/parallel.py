@@ -0,0 +1,277 @@
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from .batch import _convert_array, _is_ndarray, _unit_system, convert_units_many
+from .core import BYTE, PREFIXES
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+T = TypeVar('T')
+
+
+def _convert_chunk(values: List[float], unit: int, to: Optional[int], si: bool) -> Tuple[Any, Any]:
+    return convert_units_many(values, unit, to, si)
+
+
+def _convert_file_range(
+    path: str, start: int, stop: int, unit: int, to: Optional[int], si: bool
+) -> Tuple[Any, Any]:
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+
+    return convert_units_many([float(line) for line in data.split() if line], unit, to, si)
+
+
+def _attach(name: str) -> 'SharedMemory':
+    from multiprocessing.shared_memory import SharedMemory
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    from multiprocessing import parent_process, resource_tracker
+
+    # In the creating process, e.g. with a thread pool, registering again is
+    # harmless and patching the tracker would affect every other thread.
+    if parent_process() is None:
+        return SharedMemory(name)
+
+    # Attaching registers the segment with the worker's resource tracker,
+    # which would unlink it when the worker exits if the worker was started
+    # before the parent's tracker. Only the creator should own it.
+
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name)
+    finally:
+        resource_tracker.register = register
+
+
+def _convert_shared(
+    names: Tuple[str, str, str], length: int, start: int, stop: int, unit: int, to: Optional[int], si: bool
+) -> None:
+    import numpy as np
+
+    blocks = [_attach(name) for name in names]
+    try:
+        source = np.ndarray((length,), dtype=np.float64, buffer=blocks[0].buf)
+        amounts = np.ndarray((length,), dtype=np.float64, buffer=blocks[1].buf)
+        indices = np.ndarray((length,), dtype=np.intp, buffer=blocks[2].buf)
+
+        thresholds, float_thresholds, _ = _unit_system(unit, si)
+        chunk_amounts, chunk_indices = _convert_array(source[start:stop], unit, to, thresholds, float_thresholds)
+        amounts[start:stop] = chunk_amounts
+        if chunk_indices is not None:
+            indices[start:stop] = chunk_indices
+
+        del source, amounts, indices, chunk_amounts, chunk_indices
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _chunks(values: Iterable[float], chunk_size: int) -> Iterator[List[float]]:
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+
+        yield chunk
+
+
+def _file_ranges(path: str, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    # Split the file into ranges of roughly ``chunk_size`` bytes that end on
+    # line boundaries.
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            stop = min(f.tell(), size)
+            yield start, stop
+            start = stop
+
+
+def _concatenate(results: Iterable[Tuple[Any, Any]]) -> Tuple[Any, Any]:
+    results = list(results)
+
+    try:
+        import numpy as np
+    except ImportError:
+        from array import array
+
+        amounts: Any = array('d')
+        units: List[str] = []
+        for chunk_amounts, chunk_units in results:
+            amounts.extend(chunk_amounts)
+            units.extend(chunk_units)
+
+        return amounts, units
+
+    if not results:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=str)
+
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def convert_units_parallel(
+    values: Union[Iterable[float], str, 'os.PathLike[str]'],
+    unit: int = BYTE,
+    to: Optional[int] = None,
+    si: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None
+) -> Tuple[Any, Any]:
+    r"""Shards a large conversion across a process pool, returning exactly
+    what :func:`~binary.batch.convert_units_many` would, in the input's
+    order.
+
+    ``values`` may be:
+
+    - a NumPy array, which is copied once into shared memory that every
+      worker converts a slice of in place, so neither the input nor the
+      results are pickled
+    - the path of a text file with one number per line, which workers read
+      and parse ranges of themselves
+    - any other iterable of numbers, which is sent to workers in chunks
+
+    Inputs no larger than ``chunk_size`` are converted in the current
+    process. No more than twice as many tasks as there are workers are
+    pending at a time, so iterables are read as results come back rather
+    than up front.
+
+    :param values: The numbers of ``unit``\ s, or the path of a file of them.
+    :type values: NumPy array, iterable of ``int`` or ``float``, or ``str``
+    :param unit: The unit the ``values`` represent.
+    :type unit: one of the global constants
+    :param to: The unit to convert to.
+    :type to: one of the global constants
+    :param si: Assume SI units when no ``unit`` nor ``to`` is specified.
+    :type si: ``bool``
+    :param workers: The number of processes, defaults to the number of CPUs.
+                    With an ``executor``, the number of its workers, which
+                    only bounds the pending tasks.
+    :type workers: ``int``
+    :param chunk_size: The number of values, or bytes of a file, per task.
+    :type chunk_size: ``int``
+    :param executor: An existing pool to submit tasks to.
+    :type executor: :class:`concurrent.futures.Executor`
+    :returns: The quantities and the units' strings.
+    :rtype: tuple(quantities, strings)
+    """
+    if unit not in PREFIXES:
+        raise ValueError(f'{unit} is not a valid binary unit.')
+    if to and to not in PREFIXES:
+        raise ValueError(f'{to} is not a valid unit.')
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be positive.')
+
+    if isinstance(values, (str, os.PathLike)):
+        path = os.fspath(values)
+        ranges = list(_file_ranges(path, chunk_size))
+        if len(ranges) <= 1:
+            return _concatenate(_convert_file_range(path, *r, unit, to, si) for r in ranges)
+
+        with _pool(executor, workers) as (pool, limit):
+            return _concatenate(_map(pool, limit, _convert_file_range, ((path, *r, unit, to, si) for r in ranges)))
+
+    if _is_ndarray(values):
+        array: Any = values
+        if array.size <= chunk_size:
+            return convert_units_many(array, unit, to, si)
+
+        return _convert_ndarray(array, unit, to, si, chunk_size, executor, workers)
+
+    if hasattr(values, '__len__') and len(values) <= chunk_size:  # type: ignore[arg-type]
+        return convert_units_many(values, unit, to, si)
+
+    with _pool(executor, workers) as (pool, limit):
+        chunks = ((chunk, unit, to, si) for chunk in _chunks(values, chunk_size))
+        return _concatenate(_map(pool, limit, _convert_chunk, chunks))
+
+
+def _convert_ndarray(
+    values: Any, unit: int, to: Optional[int], si: bool, chunk_size: int,
+    executor: Optional[Executor], workers: Optional[int]
+) -> Tuple[Any, Any]:
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy as np
+
+    shape = values.shape
+    values = values.ravel()
+    length = int(values.size)
+    nbytes = length * 8
+
+    blocks = [SharedMemory(create=True, size=nbytes) for _ in range(3)]
+    try:
+        np.ndarray((length,), dtype=np.float64, buffer=blocks[0].buf)[:] = values
+        names = (blocks[0].name, blocks[1].name, blocks[2].name)
+
+        with _pool(executor, workers) as (pool, limit):
+            slices = (
+                (names, length, start, min(start + chunk_size, length), unit, to, si)
+                for start in range(0, length, chunk_size)
+            )
+            for _ in _map(pool, limit, _convert_shared, slices):
+                pass
+
+        amounts = np.ndarray((length,), dtype=np.float64, buffer=blocks[1].buf).copy()
+        if to:
+            units = np.full(length, PREFIXES[to])
+        else:
+            indices = np.ndarray((length,), dtype=np.intp, buffer=blocks[2].buf)
+            units = np.array(_unit_system(unit, si)[2])[indices]
+            del indices
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return amounts.reshape(shape), units.reshape(shape)
+
+
+@contextmanager
+def _pool(executor: Optional[Executor], workers: Optional[int]) -> Iterator[Tuple[Executor, int]]:
+    # Yields the pool and the number of tasks to keep in flight, twice its
+    # workers so that none idles while results are collected. A supplied
+    # executor is left running for the caller to reuse.
+    workers = workers or os.cpu_count() or 1
+    if executor is not None:
+        yield executor, 2 * workers
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        yield pool, 2 * workers
+
+
+def _map(
+    pool: Executor, limit: int, fn: Callable[..., T], arguments: Iterable[Tuple[Any, ...]]
+) -> Iterator[T]:
+    # Like Executor.map, in order, but only reads and submits the next
+    # arguments once fewer than ``limit`` tasks are pending, so that the
+    # input is neither consumed up front nor queued in its entirety.
+    pending: Deque['Future[T]'] = deque()
+    try:
+        for args in arguments:
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, *args))
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,98 @@
+from decimal import Decimal, InvalidOperation
+from string import ascii_letters
+from typing import Dict, Iterable, List, Union
+
+from .core import BINARY_PREFIXES, BYTE, DECIMAL_PREFIXES
+
+
+def _build_suffixes() -> Dict[str, int]:
+    suffixes = {'': BYTE, 'B': BYTE, 'byte': BYTE, 'bytes': BYTE}
+
+    for prefixes in (BINARY_PREFIXES, DECIMAL_PREFIXES):
+        for unit, suffix in prefixes.items():
+            if unit != BYTE:
+                # e.g. KiB & Ki, KB & K
+                suffixes[suffix] = unit
+                suffixes[suffix[:-1]] = unit
+
+    # Lowercase spellings are only looked up when the exact one is unknown.
+    suffixes.update({suffix.lower(): unit for suffix, unit in suffixes.items()})
+
+    return suffixes
+
+
+def _build_bit_suffixes() -> Dict[str, int]:
+    # A lowercase b after an uppercase prefix means bits, as rendered by
+    # format_rate, e.g. Kib or Mb. Entirely lowercase suffixes remain bytes.
+    return {
+        suffix[:-1] + 'b': unit
+        for prefixes in (BINARY_PREFIXES, DECIMAL_PREFIXES)
+        for unit, suffix in prefixes.items()
+        if unit != BYTE
+    }
+
+
+SUFFIXES = _build_suffixes()
+BIT_SUFFIXES = _build_bit_suffixes()
+
+
+def parse_size(s: str, exact: bool = False) -> Union[int, float, Decimal]:
+    r"""Parses a human readable size such as ``'1.5 GiB'``, ``'200MB'`` or
+    ``'3T'`` into a number of bytes. This is the inverse of
+    :func:`~binary.core.convert_units`.
+
+    Binary suffixes may be written in IEC (``KiB``) or Kubernetes (``Ki``)
+    style and decimal suffixes as ``KB``, ``kB`` or ``K``. A bare letter is
+    therefore always a decimal unit. Suffixes are case-insensitive and an
+    absent suffix means bytes, except that an uppercase prefix followed by a
+    lowercase ``b`` such as ``Mb`` or ``Gib`` is a number of bits.
+
+    Integer quantities produce an ``int``, otherwise a ``float`` is returned
+    unless ``exact`` is ``True``.
+
+    :param s: The size to parse.
+    :type s: ``str``
+    :param exact: Use decimal.Decimal for calculations.
+    :type exact: ``bool``
+    :returns: The number of bytes.
+    :raises ValueError: If ``s`` is not a valid size.
+    """
+    s = s.strip()
+    number = s.rstrip(ascii_letters)
+    suffix = s[len(number):]
+
+    bits = False
+    unit = SUFFIXES.get(suffix)
+    if unit is None:
+        unit = BIT_SUFFIXES.get(suffix)
+        if unit is not None:
+            bits = True
+        else:
+            unit = SUFFIXES.get(suffix.lower())
+            if unit is None:
+                raise ValueError(f'{s!r} has an unknown unit: {suffix!r}')
+
+    try:
+        if exact:
+            return Decimal(number) * unit / 8 if bits else Decimal(number) * unit
+
+        if '.' in number or 'e' in number or 'E' in number:
+            return float(number) * unit / 8 if bits else float(number) * unit
+
+        # Every unit of bits is a whole number of bytes
+        return int(number) * unit // 8 if bits else int(number) * unit
+    except (ValueError, InvalidOperation):
+        raise ValueError(f'{s!r} is not a valid size.') from None
+
+
+def parse_sizes(sizes: Iterable[str], exact: bool = False) -> List[Union[int, float, Decimal]]:
+    r"""Parses every element of ``sizes`` with :func:`parse_size`.
+
+    :param sizes: The sizes to parse.
+    :type sizes: iterable of ``str``
+    :param exact: Use decimal.Decimal for calculations.
+    :type exact: ``bool``
+    :returns: The numbers of bytes.
+    :rtype: ``list``
+    """
+    return [parse_size(s, exact) for s in sizes]
@@ -0,0 +1,164 @@
+"""Optional instrumentation of :func:`~binary.core.convert_units`.
+
+Profiling works by replacing ``convert_units`` with an instrumented wrapper
+everywhere the package refers to it and putting the original back when
+disabled, so there is no cost at all while it is off. Code that imported
+``convert_units`` itself before profiling was enabled keeps calling the
+original function.
+"""
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from . import core
+from .core import BINARY_PREFIXES, BYTE
+
+PATHS = ('to', 'binary', 'si', 'exact')
+
+Hook = Callable[[str, float], object]
+
+
+class ConversionStats:
+    r"""Call counts and cumulative time in seconds per code path of
+    ``convert_units``:
+
+    - ``exact``: ``exact`` is ``True``
+    - ``to``: an explicit ``to`` unit
+    - ``binary``: scaled to the highest binary unit
+    - ``si``: scaled to the highest decimal unit
+
+    Calls that raise are not counted.
+    """
+    __slots__ = ('calls', 'time')
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, int] = dict.fromkeys(PATHS, 0)
+        self.time: Dict[str, float] = dict.fromkeys(PATHS, 0.0)
+
+    @property
+    def total_calls(self) -> int:
+        """The number of calls of every path.
+
+        :rtype: ``int``
+        """
+        return sum(self.calls.values())
+
+    @property
+    def total_time(self) -> float:
+        """The time spent in every path.
+
+        :rtype: ``float``
+        """
+        return sum(self.time.values())
+
+    def reset(self) -> None:
+        """Sets every counter to zero."""
+        for path in PATHS:
+            self.calls[path] = 0
+            self.time[path] = 0.0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(calls={self.calls!r}, time={self.time!r})'
+
+
+stats = ConversionStats()
+
+_original = core.convert_units
+_active: Optional[Callable[..., Any]] = None
+
+
+def _make_wrapper(hook: Optional[Hook], clock: Callable[[], float]) -> Callable[..., Any]:
+    convert_units = _original
+    calls = stats.calls
+    time = stats.time
+
+    def profiled_convert_units(
+        n: Any, unit: int = BYTE, to: Optional[int] = None, si: bool = False, exact: bool = False,
+        context: Any = None
+    ) -> Any:
+        start = clock()
+        result = convert_units(n, unit, to, si, exact, context)
+        elapsed = clock() - start
+
+        if exact:
+            path = 'exact'
+        elif to:
+            path = 'to'
+        elif unit in BINARY_PREFIXES and not si:
+            path = 'binary'
+        else:
+            path = 'si'
+
+        calls[path] += 1
+        time[path] += elapsed
+        if hook is not None:
+            hook(path, elapsed)
+
+        return result
+
+    profiled_convert_units.__doc__ = convert_units.__doc__
+    profiled_convert_units.__wrapped__ = convert_units  # type: ignore[attr-defined]
+    return profiled_convert_units
+
+
+def _replace(old: Callable[..., Any], new: Callable[..., Any]) -> None:
+    for name, module in list(sys.modules.items()):
+        if (name == 'binary' or name.startswith('binary.')) and getattr(module, 'convert_units', None) is old:
+            module.convert_units = new  # type: ignore[attr-defined]
+
+
+def enable(hook: Optional[Hook] = None, clock: Callable[[], float] = perf_counter) -> ConversionStats:
+    r"""Starts counting calls of ``convert_units`` in :data:`stats`,
+    replacing an instrumented version already enabled.
+
+    :param hook: Called after every conversion with the path taken and the
+                 time it took, e.g. to export metrics.
+    :type hook: callable
+    :param clock: Returns the current time in seconds.
+    :type clock: callable
+    :rtype: :class:`ConversionStats`
+    """
+    global _active
+
+    wrapper = _make_wrapper(hook, clock)
+    _replace(_active or _original, wrapper)
+    _active = wrapper
+    return stats
+
+
+def disable() -> None:
+    """Restores the original ``convert_units``. The counts are kept."""
+    global _active
+
+    if _active is not None:
+        _replace(_active, _original)
+        _active = None
+
+
+def is_enabled() -> bool:
+    """Whether calls are being counted.
+
+    :rtype: ``bool``
+    """
+    return _active is not None
+
+
+@contextmanager
+def profile(hook: Optional[Hook] = None, clock: Callable[[], float] = perf_counter) -> Iterator[ConversionStats]:
+    r"""Counts calls of ``convert_units`` within a ``with`` block from zero,
+    see :func:`enable`.
+
+    :param hook: Called after every conversion with the path taken and the
+                 time it took.
+    :type hook: callable
+    :param clock: Returns the current time in seconds.
+    :type clock: callable
+    :rtype: :class:`ConversionStats`
+    """
+    stats.reset()
+    enable(hook, clock)
+    try:
+        yield stats
+    finally:
+        disable()
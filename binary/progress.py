@@ -0,0 +1,183 @@
+import asyncio
+import sys
+from types import TracebackType
+from typing import Callable, Optional, Type
+
+from .core import convert_units
+from .rate import RateMeter, format_rate
+
+
+def _write_status(text: str) -> None:
+    sys.stderr.write(f'\r{text}\x1b[K')
+    sys.stderr.flush()
+
+
+def format_duration(seconds: float) -> str:
+    """Renders a duration with its two most significant units, e.g.
+    ``'1h12m'``, ``'3m05s'`` or ``'42s'``.
+
+    :param seconds: The duration in seconds.
+    :type seconds: ``float``
+    :rtype: ``str``
+    """
+    seconds = int(seconds + 0.5)
+    if seconds < 60:
+        return f'{seconds}s'
+
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f'{minutes}m{seconds:02d}s'
+
+    hours, minutes = divmod(minutes, 60)
+    if hours < 24:
+        return f'{hours}h{minutes:02d}m'
+
+    days, hours = divmod(hours, 24)
+    return f'{days}d{hours:02d}h'
+
+
+class Progress:
+    r"""Tracks the progress of a transfer shared by any number of asyncio
+    tasks, e.g. ``'12.3 GiB / 4.0 TiB, 850.0 MiB/s, ETA 1h12m'``.
+
+    Tasks report progress with :meth:`add`, which only increments an
+    integer. While the tracker is used as an asynchronous context manager, a
+    background task renders the status every ``interval`` seconds and passes
+    it to ``callback``, so the cost of formatting is bounded no matter how
+    often progress is reported. A final status is rendered on exit.
+
+    .. code-block:: python
+
+        async with Progress(total=size) as progress:
+            async for chunk in source:
+                await sink.write(chunk)
+                progress.add(len(chunk))
+
+    :param total: The expected number of bytes, if known.
+    :type total: ``int``
+    :param interval: The number of seconds between renders.
+    :type interval: ``float``
+    :param callback: Receives each rendered status, defaults to rewriting the
+                     current line of standard error.
+    :type callback: callable
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :param half_life: The smoothing of the rate, see
+                      :class:`~binary.rate.RateMeter`.
+    :type half_life: ``float``
+    """
+    __slots__ = (
+        'completed', 'total', 'interval', 'callback', 'si', 'precision', '_meter', '_reported', '_task'
+    )
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        interval: float = 0.5,
+        callback: Optional[Callable[[str], object]] = None,
+        si: bool = False,
+        precision: int = 1,
+        half_life: float = 3.0,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError('The interval must be positive.')
+
+        self.completed = 0
+        self.total = total
+        self.interval = interval
+        self.callback = _write_status if callback is None else callback
+        self.si = si
+        self.precision = precision
+        self._meter = RateMeter(half_life)
+        self._reported = 0
+        self._task: Optional['asyncio.Task[None]'] = None
+
+    def add(self, n: int) -> None:
+        r"""Records that ``n`` more bytes were transferred.
+
+        :param n: The number of bytes.
+        :type n: ``int``
+        """
+        self.completed += n
+
+    @property
+    def rate(self) -> float:
+        """The smoothed throughput in bytes per second as of the last render.
+
+        :rtype: ``float``
+        """
+        return self._meter.rate
+
+    def eta(self) -> Optional[float]:
+        """The estimated number of seconds remaining as of the last render,
+        or ``None`` if the total or the rate is unknown.
+
+        :rtype: ``float``
+        """
+        rate = self._meter.rate
+        if self.total is None or rate <= 0:
+            return None
+
+        remaining = self.total - self.completed
+        return remaining / rate if remaining > 0 else 0.0
+
+    def render(self, timestamp: float) -> str:
+        r"""Samples the bytes transferred since the previous render and
+        returns the status.
+
+        :param timestamp: The current time in seconds, e.g. from
+                          ``loop.time()``.
+        :type timestamp: ``float``
+        :rtype: ``str``
+        """
+        completed = self.completed
+        self._meter.update(timestamp, completed - self._reported)
+        self._reported = completed
+
+        precision = self.precision
+        amount, unit = convert_units(completed, si=self.si)
+        status = f'{amount:.{precision}f} {unit}'
+
+        if self.total is not None:
+            amount, unit = convert_units(self.total, si=self.si)
+            status += f' / {amount:.{precision}f} {unit}'
+
+        status += f', {format_rate(self._meter.rate, si=self.si, precision=precision)}'
+
+        if self.total is not None:
+            eta = self.eta()
+            status += f', ETA {"?" if eta is None else format_duration(eta)}'
+
+        return status
+
+    async def _refresh(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval)
+            self.callback(self.render(loop.time()))
+
+    async def __aenter__(self) -> 'Progress':
+        loop = asyncio.get_running_loop()
+        self.render(loop.time())
+        self._task = loop.create_task(self._refresh())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            # Only absorbs the cancellation of the task, the enclosing task
+            # may still be cancelled while waiting for it
+            await asyncio.gather(task, return_exceptions=True)
+            if not task.cancelled():
+                # Errors of the refresh are still raised
+                task.result()
+
+        self.callback(self.render(asyncio.get_running_loop().time()))
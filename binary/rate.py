@@ -0,0 +1,127 @@
+from math import exp, log
+from typing import Dict, Optional
+
+from .converter import Converter
+
+_BIT_SUFFIXES = {
+    suffix: f'{suffix[:-1]}b/s'
+    for suffix in ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB', 'ZiB', 'YiB',
+                   'KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB')
+}
+_BYTE_SUFFIXES = {suffix: f'{suffix}/s' for suffix in _BIT_SUFFIXES}
+_CONVERTERS: Dict[bool, Converter] = {False: Converter(), True: Converter(si=True)}
+
+
+def format_rate(bytes_per_second: float, bits: bool = False, si: bool = False, precision: int = 2) -> str:
+    r"""Renders a throughput in the highest unit possible per second, e.g.
+    ``'24.77 GiB/s'`` or, with ``bits``, ``'207.80 Gib/s'``.
+
+    :param bytes_per_second: The throughput in bytes per second.
+    :type bytes_per_second: ``float``
+    :param bits: Render bits rather than bytes per second.
+    :type bits: ``bool``
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :rtype: ``str``
+    """
+    if bits:
+        amount, unit = _CONVERTERS[si].convert(bytes_per_second * 8)
+        return f'{amount:.{precision}f} {_BIT_SUFFIXES[unit]}'
+
+    amount, unit = _CONVERTERS[si].convert(bytes_per_second)
+    return f'{amount:.{precision}f} {_BYTE_SUFFIXES[unit]}'
+
+
+class RateMeter:
+    r"""Measures throughput from a stream of ``(timestamp, byte_count)``
+    samples using an exponentially weighted moving average, where each
+    ``byte_count`` is the number of bytes transferred since the previous
+    sample. Irregular intervals are weighted by their duration, so the
+    influence of a sample halves every ``half_life`` seconds.
+
+    Updating is constant time and stores no samples. Samples sharing a
+    timestamp are coalesced, so the meter may be updated far more often than
+    the clock resolution.
+
+    :param half_life: The time in seconds after which a sample's weight
+                      halves.
+    :type half_life: ``float``
+    :param bits: Render bits rather than bytes per second.
+    :type bits: ``bool``
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    """
+    __slots__ = ('half_life', 'bits', 'si', 'precision', 'total', '_tau', '_rate', '_time', '_pending')
+
+    def __init__(self, half_life: float = 1.0, bits: bool = False, si: bool = False, precision: int = 2) -> None:
+        if half_life <= 0:
+            raise ValueError('The half-life must be positive.')
+
+        self.half_life = half_life
+        self.bits = bits
+        self.si = si
+        self.precision = precision
+        self.total = 0
+        self._tau = half_life / log(2)
+        self._rate: Optional[float] = None
+        self._time: Optional[float] = None
+        self._pending = 0
+
+    @property
+    def rate(self) -> float:
+        """The smoothed throughput in bytes per second, or ``0.0`` until two
+        distinct timestamps have been seen.
+
+        :rtype: ``float``
+        """
+        return self._rate or 0.0
+
+    def update(self, timestamp: float, byte_count: int) -> None:
+        r"""Records that ``byte_count`` bytes were transferred between the
+        previous sample and ``timestamp``.
+
+        :param timestamp: The time of the sample in seconds, e.g. from
+                          ``time.monotonic``.
+        :type timestamp: ``float``
+        :param byte_count: The number of bytes since the previous sample.
+        :type byte_count: ``int``
+        """
+        self.total += byte_count
+
+        if self._time is None:
+            self._time = timestamp
+            return
+
+        self._pending += byte_count
+        elapsed = timestamp - self._time
+        if elapsed <= 0:
+            return
+
+        instant = self._pending / elapsed
+        if self._rate is None:
+            self._rate = instant
+        else:
+            self._rate += (1 - exp(-elapsed / self._tau)) * (instant - self._rate)
+
+        self._time = timestamp
+        self._pending = 0
+
+    def reset(self) -> None:
+        """Forgets all samples."""
+        self.total = 0
+        self._rate = None
+        self._time = None
+        self._pending = 0
+
+    def format(self) -> str:
+        """Renders the smoothed throughput, see :func:`format_rate`.
+
+        :rtype: ``str``
+        """
+        return format_rate(self.rate, self.bits, self.si, self.precision)
+
+    __str__ = format
@@ -0,0 +1,172 @@
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, Mapping, Optional, Union
+
+from .batch import BINARY_SUFFIXES, DECIMAL_SUFFIXES, convert_units_many
+from .core import BYTE, PREFIXES
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class ColumnRenderer:
+    r"""Renders whole columns of sizes as fixed-width, right-aligned records,
+    e.g. ``'    1.50 KiB\n'``, straight into a preallocated buffer or a text
+    stream.
+
+    Values are converted in chunks with
+    :func:`~binary.batch.convert_units_many` and each record is produced by a
+    single ``%`` operation with a template prepared for its unit, so rendering
+    creates one string per record and one per chunk rather than the several
+    temporaries of formatting each ``convert_units`` result.
+
+    Every record is exactly :attr:`record_size` ASCII characters including
+    ``separator``, so the ``i``-th value of a column rendered at ``offset``
+    always starts at ``offset + i * record_size``.
+
+    :param width: The number of characters per value, excluding
+                  ``separator``.
+    :type width: ``int``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :param unit: The unit the values represent.
+    :type unit: one of the global constants
+    :param to: The unit to convert to, instead of scaling each value.
+    :type to: one of the global constants
+    :param si: Use decimal rather than binary units.
+    :type si: ``bool``
+    :param suffixes: Replacements for the unit strings of ``PREFIXES``,
+                     e.g. ``{'KiB': 'K'}``.
+    :type suffixes: ``dict``
+    :param separator: Appended to every value.
+    :type separator: ``str``
+    """
+    __slots__ = ('width', 'precision', 'unit', 'to', 'si', 'separator', 'record_size', '_templates')
+
+    def __init__(
+        self,
+        width: int = 12,
+        precision: int = 2,
+        unit: int = BYTE,
+        to: Optional[int] = None,
+        si: bool = False,
+        suffixes: Optional[Mapping[str, str]] = None,
+        separator: str = '\n'
+    ) -> None:
+        if unit not in PREFIXES:
+            raise ValueError(f'{unit} is not a valid binary unit.')
+        if to and to not in PREFIXES:
+            raise ValueError(f'{to} is not a valid unit.')
+
+        self.width = width
+        self.precision = precision
+        self.unit = unit
+        self.to = to
+        self.si = si
+        self.separator = separator
+        self.record_size = width + len(separator)
+
+        suffixes = suffixes or {}
+        self._templates: Dict[str, str] = {}
+        for suffix in BINARY_SUFFIXES + DECIMAL_SUFFIXES:
+            display = suffixes.get(suffix, suffix)
+            # Right-align the number so that the whole record fills the width
+            number_width = max(width - len(display) - 1 if display else width, 1)
+            suffix_part = f' {display}' if display else ''
+            self._templates[suffix] = f'%{number_width}.{precision}f' + f'{suffix_part}{separator}'.replace('%', '%%')
+
+        if not all(template.isascii() for template in self._templates.values()):
+            raise ValueError('Suffixes and the separator must be ASCII.')
+
+    def chunks(self, values: Iterable[float], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        r"""Lazily renders ``values`` as strings of up to ``chunk_size``
+        records.
+
+        :param values: The numbers of ``unit``\ s.
+        :type values: array-like of ``int`` or ``float``
+        :param chunk_size: The number of records per string.
+        :type chunk_size: ``int``
+        :raises ValueError: If a value does not fit the width.
+        :rtype: iterator of ``str``
+        """
+        templates = self._templates
+        record_size = self.record_size
+
+        for chunk in _split(values, chunk_size):
+            amounts, units = convert_units_many(chunk, self.unit, self.to, self.si)
+            if hasattr(units, 'tolist'):
+                units = units.tolist()
+
+            text = ''.join([templates[u] % a for a, u in zip(amounts.tolist(), units)])
+            if len(text) != len(units) * record_size:
+                raise ValueError(f'A value does not fit in a width of {self.width}.')
+
+            yield text
+
+    def render_into(self, values: Iterable[float], buffer: Union[bytearray, memoryview], offset: int = 0) -> int:
+        r"""Writes the records of ``values`` as ASCII into ``buffer`` starting
+        at ``offset``.
+
+        :param values: The numbers of ``unit``\ s.
+        :type values: array-like of ``int`` or ``float``
+        :param buffer: A writable buffer, e.g. a ``bytearray``, a
+                       ``memoryview`` or an ``mmap``.
+        :param offset: The index of the first byte to write.
+        :type offset: ``int``
+        :raises ValueError: If the buffer is too small or a value does not
+                            fit the width.
+        :returns: The offset after the last record written.
+        :rtype: ``int``
+        """
+        view = memoryview(buffer).cast('B')
+        for text in self.chunks(values):
+            end = offset + len(text)
+            if end > len(view):
+                raise ValueError(f'The buffer cannot fit {end - offset} more bytes at offset {offset}.')
+
+            view[offset:end] = text.encode('ascii')
+            offset = end
+
+        return offset
+
+    def write(self, values: Iterable[float], stream: IO[str]) -> int:
+        r"""Writes the records of ``values`` to a text stream such as
+        ``io.StringIO`` with one call per chunk.
+
+        :param values: The numbers of ``unit``\ s.
+        :type values: array-like of ``int`` or ``float``
+        :param stream: A writable text stream.
+        :raises ValueError: If a value does not fit the width.
+        :returns: The number of characters written.
+        :rtype: ``int``
+        """
+        written = 0
+        for text in self.chunks(values):
+            stream.write(text)
+            written += len(text)
+
+        return written
+
+
+def _split(values: Iterable[float], chunk_size: int) -> Iterator[Any]:
+    if getattr(values, 'ndim', 1) > 1 and hasattr(values, 'ravel'):
+        # Slicing would split arrays along their first axis, records are
+        # rendered in row-major order instead.
+        values = values.ravel()
+
+    if hasattr(values, '__getitem__') and hasattr(values, '__len__'):
+        sequence: Any = values
+        for start in range(0, len(sequence), chunk_size):
+            yield sequence[start:start + chunk_size]
+        return
+
+    try:
+        view = memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            yield chunk
+    else:
+        yield from _split(view.tolist(), chunk_size)
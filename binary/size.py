@@ -0,0 +1,228 @@
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+from .core import BYTE, PREFIXES, convert_units
+
+_UNIT_STRINGS = {suffix: unit for unit, suffix in PREFIXES.items()}
+# Longest first so that e.g. KiB is matched before B
+_SPEC_SUFFIXES = sorted(_UNIT_STRINGS, key=len, reverse=True)
+
+
+@lru_cache(maxsize=256)
+def _parse_spec(spec: str) -> Tuple[str, Optional[int], Optional[bool]]:
+    if spec.endswith('iec'):
+        return spec[:-3], None, False
+    elif spec.endswith('si'):
+        return spec[:-2], None, True
+
+    for suffix in _SPEC_SUFFIXES:
+        if spec.endswith(suffix):
+            return spec[:-len(suffix)], _UNIT_STRINGS[suffix], None
+
+    return spec, None, None
+
+
+class Size:
+    r"""An immutable quantity of bytes that remembers whether it should be
+    displayed in binary or decimal units. Sizes are backed by an ``int``,
+    hash and compare equal to that number of bytes and support arithmetic
+    with each other and with integers, so they can replace raw byte counts.
+
+    The format specification accepts any ``float`` specification followed
+    by an optional unit system, either ``iec`` or ``si``, or an explicit unit
+    string from ``PREFIXES``:
+
+    .. code-block:: python
+
+        >>> s = Size(1536)
+        >>> f'{s:.2f}', f'{s:.2fsi}', f'{s:.0fB}'
+        ('1.50 KiB', '1.54 KB', '1536 B')
+
+    :param n: The number of ``unit``\ s, truncated to whole bytes.
+    :type n: ``int`` or ``float``
+    :param unit: The unit ``n`` represents.
+    :type unit: one of the global constants
+    :param si: Display decimal rather than binary units.
+    :type si: ``bool``
+    """
+    __slots__ = ('_bytes', '_si')
+
+    _bytes: int
+    _si: bool
+
+    def __init__(self, n: Union[int, float] = 0, unit: int = BYTE, si: bool = False) -> None:
+        if type(n) is not int and not hasattr(n, '__float__') and not hasattr(n, '__index__'):
+            # Strings would otherwise be repeated by the unit or parsed by int
+            raise TypeError(f'{self.__class__.__name__}() argument must be a number, not {type(n).__name__!r}')
+
+        if unit != BYTE:
+            if unit not in PREFIXES:
+                raise ValueError(f'{unit} is not a valid binary unit.')
+            n *= unit
+
+        # Attributes can only be set through their slots, see __setattr__
+        _set_bytes(self, n if type(n) is int else int(n))
+        _set_si(self, si)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickling and copying would otherwise restore the slots with setattr
+        return self.__class__, (self._bytes, BYTE, self._si)
+
+    @property
+    def bytes(self) -> int:
+        """The number of bytes.
+
+        :rtype: ``int``
+        """
+        return self._bytes
+
+    @property
+    def si(self) -> bool:
+        """Whether the size is displayed in decimal units.
+
+        :rtype: ``bool``
+        """
+        return self._si
+
+    def convert(self, to: Optional[int] = None) -> Tuple[float, str]:
+        """Converts the size with :func:`~binary.core.convert_units`, to the
+        highest unit possible of its unit system if ``to`` is not specified.
+
+        :param to: The unit to convert to.
+        :type to: one of the global constants
+        :returns: The unit pair: a numeric quantity and the unit's string.
+        :rtype: tuple(quantity, string)
+        """
+        amount, unit = convert_units(self._bytes, to=to, si=self._si)
+        return float(amount), unit
+
+    def __repr__(self) -> str:
+        if self._si:
+            return f'{self.__class__.__name__}({self._bytes}, si=True)'
+        return f'{self.__class__.__name__}({self._bytes})'
+
+    def __str__(self) -> str:
+        amount, unit = convert_units(self._bytes, si=self._si)
+        return f'{amount} {unit}'
+
+    def __format__(self, spec: str) -> str:
+        if not spec:
+            return str(self)
+
+        float_spec, to, si = _parse_spec(spec)
+        amount, unit = convert_units(self._bytes, to=to, si=self._si if si is None else si)
+        return f'{format(amount, float_spec)} {unit}'
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __int__(self) -> int:
+        return self._bytes
+
+    def __index__(self) -> int:
+        return self._bytes
+
+    def __bool__(self) -> bool:
+        return self._bytes != 0
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Size):
+            return self._bytes == other._bytes
+        elif isinstance(other, int):
+            return self._bytes == other
+        return NotImplemented
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, Size):
+            return self._bytes < other._bytes
+        elif isinstance(other, int):
+            return self._bytes < other
+        return NotImplemented
+
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, Size):
+            return self._bytes <= other._bytes
+        elif isinstance(other, int):
+            return self._bytes <= other
+        return NotImplemented
+
+    def __gt__(self, other: Any) -> bool:
+        if isinstance(other, Size):
+            return self._bytes > other._bytes
+        elif isinstance(other, int):
+            return self._bytes > other
+        return NotImplemented
+
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, Size):
+            return self._bytes >= other._bytes
+        elif isinstance(other, int):
+            return self._bytes >= other
+        return NotImplemented
+
+    def __add__(self, other: Any) -> 'Size':
+        if isinstance(other, Size):
+            return Size(self._bytes + other._bytes, si=self._si)
+        elif isinstance(other, int):
+            return Size(self._bytes + other, si=self._si)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> 'Size':
+        if isinstance(other, Size):
+            return Size(self._bytes - other._bytes, si=self._si)
+        elif isinstance(other, int):
+            return Size(self._bytes - other, si=self._si)
+        return NotImplemented
+
+    def __rsub__(self, other: Any) -> 'Size':
+        if isinstance(other, int):
+            return Size(other - self._bytes, si=self._si)
+        return NotImplemented
+
+    def __mul__(self, other: Any) -> 'Size':
+        if isinstance(other, int):
+            return Size(self._bytes * other, si=self._si)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other: Any) -> Any:
+        if isinstance(other, Size):
+            return self._bytes // other._bytes
+        elif isinstance(other, int):
+            return Size(self._bytes // other, si=self._si)
+        return NotImplemented
+
+    def __mod__(self, other: Any) -> 'Size':
+        if isinstance(other, Size):
+            return Size(self._bytes % other._bytes, si=self._si)
+        elif isinstance(other, int):
+            return Size(self._bytes % other, si=self._si)
+        return NotImplemented
+
+    def __truediv__(self, other: Any) -> float:
+        if isinstance(other, Size):
+            return self._bytes / other._bytes
+        return NotImplemented
+
+    def __neg__(self) -> 'Size':
+        return Size(-self._bytes, si=self._si)
+
+    def __pos__(self) -> 'Size':
+        return self
+
+    def __abs__(self) -> 'Size':
+        return Size(abs(self._bytes), si=self._si)
+
+
+# Faster than object.__setattr__, which construction would otherwise need
+_set_bytes = Size.__dict__['_bytes'].__set__
+_set_si = Size.__dict__['_si'].__set__
@@ -0,0 +1,134 @@
+import json
+import mmap
+import os
+import stat
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from .converter import Converter
+
+
+def _to_number(value: str) -> Union[int, float]:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def read_lines(path: str, encoding: str = 'utf-8') -> Iterator[str]:
+    """Lazily reads the lines of a file through a memory map so that the
+    operating system handles buffering and memory stays constant. Files that
+    cannot be mapped, such as pipes, are read through a buffer instead.
+
+    :param path: The file to read.
+    :type path: ``str``
+    :param encoding: The text encoding of the file.
+    :type encoding: ``str``
+    :rtype: iterator of ``str``
+    """
+    with open(path, 'rb') as f:
+        if not stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+            for line in f:
+                yield line.decode(encoding)
+            return
+
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+
+        with mm:
+            for line in iter(mm.readline, b''):
+                yield line.decode(encoding)
+
+
+def write_lines(lines: Iterable[str], out: IO[str], batch_size: int = 4096) -> None:
+    """Writes ``lines`` to ``out`` in batches to amortize the cost of each
+    write call.
+
+    :param lines: The lines to write, including line endings.
+    :type lines: iterable of ``str``
+    :param out: A writable text stream.
+    :param batch_size: The number of lines per write.
+    :type batch_size: ``int``
+    """
+    iterator = iter(lines)
+    while True:
+        batch = ''.join(islice(iterator, batch_size))
+        if not batch:
+            break
+
+        out.write(batch)
+
+
+def humanize_columns(
+    lines: Iterable[str],
+    column: int = 0,
+    delimiter: str = '\t',
+    converter: Optional[Converter] = None
+) -> Iterator[str]:
+    r"""Lazily converts one column of delimited text, such as the output of
+    ``du`` or a CSV file without quoting. Lines whose column is missing or
+    is not a number, like headers, are passed through untouched.
+
+    :param lines: The lines to convert.
+    :type lines: iterable of ``str``
+    :param column: The index of the column holding the number of bytes.
+    :type column: ``int``
+    :param delimiter: The column separator.
+    :type delimiter: ``str``
+    :param converter: The converter used to render each value, by default
+                      binary units with 2 digits of precision.
+    :type converter: :class:`~binary.converter.Converter`
+    :rtype: iterator of ``str``
+    """
+    render = (converter or Converter(precision=2)).format
+
+    for line in lines:
+        body = line.rstrip('\r\n')
+        columns = body.split(delimiter)
+
+        try:
+            columns[column] = render(_to_number(columns[column]))
+        except (IndexError, ValueError):
+            yield line
+            continue
+
+        yield delimiter.join(columns) + line[len(body):]
+
+
+def humanize_json(
+    lines: Iterable[str],
+    field: str,
+    converter: Optional[Converter] = None
+) -> Iterator[str]:
+    r"""Lazily converts one field of every object in JSON Lines input. Lines
+    without a numeric ``field`` are passed through untouched.
+
+    :param lines: The lines to convert.
+    :type lines: iterable of ``str``
+    :param field: The key holding the number of bytes.
+    :type field: ``str``
+    :param converter: The converter used to render each value, by default
+                      binary units with 2 digits of precision.
+    :type converter: :class:`~binary.converter.Converter`
+    :rtype: iterator of ``str``
+    """
+    render = (converter or Converter(precision=2)).format
+    loads, dumps = json.loads, json.dumps
+
+    for line in lines:
+        try:
+            obj = loads(line)
+            value = obj[field]
+        except (ValueError, TypeError, KeyError):
+            yield line
+            continue
+
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            yield line
+            continue
+
+        obj[field] = render(value)
+        yield dumps(obj) + '\n'
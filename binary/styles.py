@@ -0,0 +1,150 @@
+"""Named rendering styles for sizes, e.g. ``1.5 GiB``, ``1.5G`` or ``1.5Gi``.
+
+A :class:`Style` describes the suffix of every unit, the base between them
+and how amounts are written. Compiling a style builds one ``%`` template per
+unit, so rendering a value is a bisection, a division and a single string
+operation with no per-value post-processing. Units are chosen after rounding
+as by :func:`~binary.core.convert_units_rounded`.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Union
+
+from .core import BINARY_PREFIXES, BYTE, DECIMAL_PREFIXES, PREFIXES
+
+_IEC_SUFFIXES = tuple(BINARY_PREFIXES.values())
+_SI_SUFFIXES = tuple(DECIMAL_PREFIXES.values())
+
+
+class Style(NamedTuple):
+    r"""How to render sizes. The ``i``-th suffix is used for amounts of at
+    least ``base ** i``, or that round to it at ``precision``, so the number
+    of suffixes determines the largest unit.
+
+    :param suffixes: The suffix of every unit starting from bytes. Amounts
+                     with an empty suffix are written without ``separator``.
+    :type suffixes: tuple of ``str``
+    :param base: The ratio between consecutive units, 1024 or 1000.
+    :type base: ``int``
+    :param precision: The number of digits after the decimal point.
+    :type precision: ``int``
+    :param decimal_point: Written in place of ``.``, e.g. ``,`` for many
+                          European locales.
+    :type decimal_point: ``str``
+    :param trim: Remove trailing zeros after the decimal point, and the
+                 decimal point itself when nothing follows it.
+    :type trim: ``bool``
+    :param separator: Written between the amount and the suffix.
+    :type separator: ``str``
+    :param multiplier: The number of rendered units per byte, e.g. 8 for
+                       bits.
+    :type multiplier: ``int``
+    """
+    suffixes: Tuple[str, ...]
+    base: int = 1024
+    precision: int = 2
+    decimal_point: str = '.'
+    trim: bool = False
+    separator: str = ' '
+    multiplier: int = 1
+
+    def compile(self, unit: int = BYTE) -> Callable[[float], str]:
+        r"""Prepares a function rendering quantities of ``unit`` in this
+        style.
+
+        :param unit: The unit of the quantities.
+        :type unit: one of the global constants
+        :rtype: callable
+        """
+        if unit not in PREFIXES:
+            raise ValueError(f'{unit} is not a valid binary unit.')
+        if self.base not in (1000, 1024):
+            raise ValueError(f'{self.base} is not a valid base, expected 1000 or 1024.')
+        if not self.suffixes:
+            raise ValueError('At least one suffix is required.')
+
+        scale = unit * self.multiplier
+        divisors = tuple(self.base ** i for i in range(len(self.suffixes)))
+        # Choose the unit after rounding, e.g. 1023.999 KiB is 1.00 MiB
+        half = 0.5 / 10 ** self.precision
+        thresholds = tuple(divisor - half * previous for previous, divisor in zip(divisors, divisors[1:]))
+        number = f'%.{self.precision}f'
+        tails = tuple(f'{self.separator}{suffix}' if suffix else '' for suffix in self.suffixes)
+
+        if not self.trim and self.decimal_point == '.':
+            templates = tuple(number + tail.replace('%', '%%') for tail in tails)
+
+            def render(n: float) -> str:
+                b = n * scale
+                index = bisect_right(thresholds, -b if b < 0 else b)
+                text: str = templates[index] % (b / divisors[index])
+                return text
+
+            return render
+
+        trim = self.trim
+        decimal_point = self.decimal_point
+
+        def render_custom(n: float) -> str:
+            b = n * scale
+            index = bisect_right(thresholds, -b if b < 0 else b)
+
+            text: str = number % (b / divisors[index])
+            if trim and '.' in text:
+                text = text.rstrip('0').rstrip('.')
+            if decimal_point != '.':
+                text = text.replace('.', decimal_point)
+            return text + tails[index]
+
+        return render_custom
+
+
+STYLES: Dict[str, Style] = {
+    # 1.50 GiB
+    'iec': Style(_IEC_SUFFIXES),
+    # 1.61 GB
+    'si': Style(_SI_SUFFIXES, base=1000),
+    # 1.50 GB, decimal symbols with binary multiples as in JEDEC memory sizes
+    'jedec': Style(_SI_SUFFIXES),
+    # 1.5G, as output by ls -h
+    'short': Style(('', *(suffix[0] for suffix in _IEC_SUFFIXES[1:])), precision=1, trim=True, separator=''),
+    # 1.5Gi, the largest binary suffix of Kubernetes quantities is Ei
+    'kubernetes': Style(('', *(suffix[:-1] for suffix in _IEC_SUFFIXES[1:7])), trim=True, separator=''),
+    # 12.88 Gb
+    'bits': Style(tuple(f'{suffix[:-1]}b' for suffix in _SI_SUFFIXES), base=1000, multiplier=8),
+}
+
+
+@lru_cache(maxsize=64)
+def _formatter(style: Style, unit: int) -> Callable[[float], str]:
+    return style.compile(unit)
+
+
+def formatter(style: Union[str, Style] = 'iec', unit: int = BYTE, **options: Any) -> Callable[[float], str]:
+    r"""Returns the compiled function rendering quantities of ``unit`` in
+    ``style``, compiling it only the first time it is requested.
+
+    .. code-block:: python
+
+        >>> formatter('kubernetes')(1610612736)
+        '1.5Gi'
+        >>> formatter('iec', precision=1, decimal_point=',')(1536)
+        '1,5 KiB'
+
+    :param style: The name of one of :data:`STYLES` or a style.
+    :type style: ``str`` or :class:`Style`
+    :param unit: The unit of the quantities.
+    :type unit: one of the global constants
+    :param options: Fields of :class:`Style` to override.
+    :rtype: callable
+    """
+    if isinstance(style, str):
+        try:
+            style = STYLES[style]
+        except KeyError:
+            raise ValueError(f'{style!r} is not a known style, expected one of: {", ".join(STYLES)}') from None
+
+    if options:
+        style = style._replace(**options)
+
+    return _formatter(style, unit)
@@ -0,0 +1,36 @@
+import sys
+from statistics import median
+from typing import Dict, List, Tuple
+
+import pytest
+
+# The mean nanoseconds per call of every implementation and of the reference
+# for each case, recorded by the differential tests
+TIMINGS = pytest.StashKey[Dict[str, List[Tuple[float, float]]]]()
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    # Runs a test with NumPy and with the pure Python fallback
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    return str(request.param)
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    timings = config.stash.get(TIMINGS, None)
+    if not timings:
+        return
+
+    # The median is not skewed by one-off costs such as importing NumPy
+    terminalreporter.write_sep('-', 'median time per conversion')
+    terminalreporter.write_line(f'{"":<12} {"ns":>10} {"reference":>10} {"ratio":>7} {"calls":>7}')
+    for name, pairs in sorted(timings.items()):
+        elapsed = median(pair[0] for pair in pairs)
+        reference = median(pair[1] for pair in pairs)
+        terminalreporter.write_line(
+            f'{name:<12} {elapsed:>10,.0f} {reference:>10,.0f} {elapsed / reference:>7.2f} {len(pairs):>7}'
+        )
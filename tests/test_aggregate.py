@@ -0,0 +1,127 @@
+import random
+import sys
+from typing import List
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits
+from binary.aggregate import SizeSummary, summarize
+
+
+def exact_percentile(values: List[int], q: float) -> float:
+    values = sorted(values)
+    return float(values[round(q / 100 * (len(values) - 1))])
+
+
+class TestSizeSummary:
+    def test_empty(self) -> None:
+        summary = SizeSummary()
+        assert summary.count == summary.total == 0
+        assert summary.minimum is summary.maximum is summary.mean is None
+        assert summary.percentile(50) is None
+        assert set(summary.histogram.values()) == {0}
+
+    def test_aggregates(self) -> None:
+        summary = SizeSummary()
+        summary.update([3, 1, 2])
+        summary.add(10)
+        assert (summary.count, summary.total, summary.minimum, summary.maximum) == (4, 16, 1, 10)
+        assert summary.mean == 4
+
+    def test_exact_total(self) -> None:
+        summary = SizeSummary()
+        summary.update([2 ** 60, 1, 2 ** 60])
+        assert summary.total == 2 ** 61 + 1
+
+    def test_histogram(self) -> None:
+        summary = SizeSummary()
+        summary.update([0, 1023, 1024, -bunits.MB, bunits.YB * 5])
+        assert summary.histogram == {
+            'B': 2, 'KiB': 1, 'MiB': 1, 'GiB': 0, 'TiB': 0, 'PiB': 0, 'EiB': 0, 'ZiB': 0, 'YiB': 1,
+        }
+
+        summary = SizeSummary(si=True)
+        summary.update([999, 1000, 1024, dunits.GB])
+        assert list(summary.histogram.items())[:4] == [('B', 1), ('KB', 2), ('MB', 0), ('GB', 1)]
+
+    def test_percentiles(self) -> None:
+        rng = random.Random(0)
+        values = [int(rng.lognormvariate(20, 3)) for _ in range(10000)]
+        summary = SizeSummary(relative_accuracy=0.01)
+        summary.update(values)
+
+        assert summary.percentile(0) == min(values)
+        assert summary.percentile(100) == max(values)
+        for q in (10, 50, 90, 99):
+            assert summary.percentile(q) == pytest.approx(exact_percentile(values, q), rel=0.011)
+
+    def test_percentiles_with_negatives(self) -> None:
+        summary = SizeSummary()
+        summary.update([-100, -10, 0, 0, 10, 100, 1000])
+        assert summary.percentile(0) == -100
+        assert summary.percentile(20) == pytest.approx(-10, rel=0.011)
+        assert summary.percentile(50) == 0
+        assert summary.percentile(90) == pytest.approx(100, rel=0.011)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            SizeSummary(relative_accuracy=0)
+        with pytest.raises(ValueError):
+            SizeSummary().percentile(101)
+
+    def test_nan(self) -> None:
+        summary = SizeSummary()
+        summary.add(1.5)
+        with pytest.raises(ValueError):
+            summary.add(float('nan'))
+
+        assert (summary.count, summary.total) == (1, 1.5)
+        assert summary.percentile(50) == pytest.approx(1.5, rel=0.011)
+        assert sum(summary.histogram.values()) == 1
+
+    def test_nan_array(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        summary = SizeSummary()
+        with pytest.raises(ValueError):
+            summary.update(np.array([1.0, np.nan]))
+        assert summary.count == summary.total == 0
+
+    def test_array(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        rng = random.Random(0)
+        values = [rng.randrange(-bunits.GB, bunits.TB) for _ in range(10000)] + [0, 2 ** 62, 2 ** 62]
+        expected = SizeSummary()
+        expected.update(values)
+        summary = SizeSummary()
+        summary.update(np.array(values, dtype=np.int64).reshape(-1, 1))
+
+        assert (summary.count, summary.total, summary.minimum, summary.maximum) == (
+            expected.count, expected.total, expected.minimum, expected.maximum
+        )
+        assert summary.histogram == expected.histogram
+        for q in (0, 1, 50, 99, 100):
+            assert summary.percentile(q) == pytest.approx(expected.percentile(q))
+
+        summary.update(np.array([], dtype=np.float64))
+        assert summary.count == expected.count
+
+
+class TestSummarize:
+    def test_iterator(self) -> None:
+        result = summarize(iter([1024, 2048]), si=True, percentiles=(50,))
+        assert (result.n, result.total, result.minimum, result.maximum) == (2, 3072, 1024, 2048)
+        assert list(result.percentiles) == [50]
+        assert result.histogram['KB'] == 2
+
+    def test_array(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        result = summarize(np.array([1.0, 2.0, 3.0, 4.0]), percentiles=(50, 100))
+        assert result.percentiles == {50: 2.5, 100: 4.0}
+        assert result.total == 10.0
+
+    def test_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        assert summarize(range(1, 101), percentiles=(50,)).percentiles[50] == pytest.approx(50, rel=0.011)
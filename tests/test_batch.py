@@ -0,0 +1,180 @@
+import sys
+from array import array
+from typing import Any, Iterable, List, Tuple
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, convert_units
+from binary.batch import common_unit, convert_units_common, convert_units_many
+
+VALUES = [
+    0, 1, -1, 1023, 1024, -1024, 1536, 999, 1000, 10 ** 6, 2 ** 30, 3.14,
+    2 ** 53, float(bunits.YB), -float(bunits.YB), float(dunits.YB), float(dunits.ZB), 1e30,
+]
+
+
+def expected(values: Iterable[float], **kwargs: Any) -> Tuple[List[float], List[str]]:
+    pairs = [convert_units(n, **kwargs) for n in values]
+    return [float(amount) for amount, _ in pairs], [unit for _, unit in pairs]
+
+
+class TestConvertUnitsMany:
+    @pytest.mark.parametrize('si', [False, True])
+    def test_auto_scale(self, backend: str, si: bool) -> None:
+        amounts, units = convert_units_many(VALUES, si=si)
+        assert (list(amounts), list(units)) == expected(VALUES, si=si)
+
+    def test_unit(self, backend: str) -> None:
+        values = [0.5, 1, 1023, 1024, 3.14]
+        amounts, units = convert_units_many(values, unit=bunits.MB)
+        assert (list(amounts), list(units)) == expected(values, unit=bunits.MB)
+
+        amounts, units = convert_units_many(values, unit=dunits.MB)
+        assert (list(amounts), list(units)) == expected(values, unit=dunits.MB)
+
+    @pytest.mark.parametrize('to', [bunits.B, bunits.KB, dunits.GB, bunits.YB])
+    def test_to(self, backend: str, to: int) -> None:
+        values = [1.5, 3, -2.5, 1024]
+        amounts, units = convert_units_many(values, unit=bunits.MB, to=to)
+        assert (list(amounts), list(units)) == expected(values, unit=bunits.MB, to=to)
+
+    def test_float_threshold_is_exact(self, backend: str) -> None:
+        # float(10 ** 24) is slightly less than a yottabyte
+        values = [float(dunits.YB), float(dunits.ZB)]
+        assert list(convert_units_many(values, si=True)[1]) == ['ZB', 'ZB']
+
+    def test_array(self, backend: str) -> None:
+        values = array('q', [1, 1024, 2 ** 40])
+        amounts, units = convert_units_many(values)
+        assert (list(amounts), list(units)) == expected(values)
+
+    def test_buffer(self, backend: str) -> None:
+        values = memoryview(array('d', [1.0, 2048.0]).tobytes()).cast('d')
+        amounts, units = convert_units_many(values)
+        assert (list(amounts), list(units)) == ([1.0, 2.0], ['B', 'KiB'])
+
+    def test_iterator(self, backend: str) -> None:
+        amounts, units = convert_units_many(iter([1, 2048]))
+        assert (list(amounts), list(units)) == ([1.0, 2.0], ['B', 'KiB'])
+
+    def test_bytes(self, backend: str) -> None:
+        amounts, units = convert_units_many(b'\x01\x02')
+        assert (list(amounts), list(units)) == ([1.0, 2.0], ['B', 'B'])
+
+    def test_set(self, backend: str) -> None:
+        amounts, units = convert_units_many({2048})
+        assert (list(amounts), list(units)) == ([2.0], ['KiB'])
+
+    def test_range(self, backend: str) -> None:
+        amounts, units = convert_units_many(range(1023, 1026))
+        assert list(units) == ['B', 'KiB', 'KiB']
+
+    def test_large_integers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+        values = [bunits.YB, -bunits.YB, dunits.YB, dunits.YB - 1]
+        amounts, units = convert_units_many(values, si=True)
+        assert (list(amounts), list(units)) == expected(values, si=True)
+
+    def test_inexact_unit(self) -> None:
+        pytest.importorskip('numpy')
+
+        # The integer is divided by the closest double to a yottabyte
+        amounts, units = convert_units_many([1, 1.0], to=dunits.YB)
+        assert amounts.tolist() == [1 / float(dunits.YB)] * 2
+        assert convert_units(1, to=dunits.YB)[0] != amounts[0]
+
+    def test_ndarray(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        values = np.array([[1, 2048], [3 * 2 ** 20, -(2 ** 30)]], dtype=np.int64)
+        amounts, units = convert_units_many(values)
+        assert amounts.tolist() == [[1.0, 2.0], [3.0, -1.0]]
+        assert units.tolist() == [['B', 'KiB'], ['MiB', 'GiB']]
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_many([1], unit=5)
+
+    def test_unknown_to(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_many([1], to=5)
+
+
+class TestConvertUnitsCommon:
+    COLUMN = [512, 1536, 3 * 2 ** 20, 5 * 2 ** 20, -(2 ** 30)]
+
+    def test_max(self, backend: str) -> None:
+        amounts, unit = convert_units_common(self.COLUMN)
+        assert unit == 'GiB'
+        assert list(amounts) == [n / bunits.GB for n in self.COLUMN]
+
+    def test_median(self, backend: str) -> None:
+        amounts, unit = convert_units_common(self.COLUMN, policy='median')
+        assert unit == 'MiB'
+        assert list(amounts) == [n / bunits.MB for n in self.COLUMN]
+
+    @pytest.mark.parametrize('policy, unit', [(0, 'B'), (25, 'KiB'), (50, 'MiB'), (100, 'GiB')])
+    def test_percentile(self, backend: str, policy: float, unit: str) -> None:
+        assert convert_units_common(self.COLUMN, policy=policy)[1] == unit
+
+    def test_interpolated_percentile(self, backend: str) -> None:
+        # Halfway between 1 KiB and 1 MiB
+        assert common_unit([bunits.KB, bunits.MB], policy=50) == bunits.KB
+        assert common_unit([bunits.KB, 3 * bunits.MB], policy=50) == bunits.MB
+
+    def test_si(self, backend: str) -> None:
+        amounts, unit = convert_units_common([999, 10 ** 6, 2 * 10 ** 6], si=True)
+        assert unit == 'MB'
+        assert list(amounts) == [0.000999, 1.0, 2.0]
+
+        assert convert_units_common([1, 2], unit=dunits.MB)[1] == 'MB'
+
+    def test_unit(self, backend: str) -> None:
+        amounts, unit = convert_units_common([0.5, 1024], unit=bunits.MB)
+        assert unit == 'GiB'
+        assert list(amounts) == [0.5 / 1024, 1.0]
+
+    def test_matches_convert_units(self, backend: str) -> None:
+        for n in VALUES:
+            assert convert_units_common([n])[1] == convert_units(n)[1]
+            assert convert_units_common([n], si=True)[1] == convert_units(n, si=True)[1]
+
+    def test_single_pass(self, backend: str) -> None:
+        amounts, unit = convert_units_common(iter(self.COLUMN))
+        assert unit == 'GiB'
+        assert len(amounts) == len(self.COLUMN)
+
+    def test_set(self, backend: str) -> None:
+        amounts, unit = convert_units_common({1, 2048})
+        assert (sorted(amounts), unit) == ([1 / 1024, 2.0], 'KiB')
+        assert common_unit({1, 2048}) == bunits.KB
+
+    def test_bytes(self, backend: str) -> None:
+        amounts, unit = convert_units_common(b'\x01\x02')
+        assert (list(amounts), unit) == ([1.0, 2.0], 'B')
+        assert common_unit(bytearray(b'\x01\x02')) == bunits.B
+
+    def test_empty(self, backend: str) -> None:
+        amounts, unit = convert_units_common([])
+        assert (list(amounts), unit) == ([], 'B')
+        assert common_unit(iter([])) == bunits.B
+
+    def test_ndarray(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        amounts, unit = convert_units_common(np.array([[1, 2048], [3 * 2 ** 20, 4]]))
+        assert unit == 'MiB'
+        assert amounts.shape == (2, 2)
+
+    def test_invalid_policy(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_common([1], policy='min')
+        with pytest.raises(ValueError):
+            common_unit([1], policy=101)
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_common([1], unit=5)
+        with pytest.raises(ValueError):
+            common_unit([1], unit=5)
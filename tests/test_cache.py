@@ -0,0 +1,69 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from binary import BinaryUnits as bunits, CachedConverter, convert_units
+
+
+class TestCachedConverter:
+    def test_results(self) -> None:
+        convert = CachedConverter()
+        for _ in range(2):
+            assert convert(1536) == convert_units(1536)
+            assert convert(1536, si=True) == convert_units(1536, si=True)
+            assert convert(3.14, bunits.YB, bunits.B, exact=True) == convert_units(3.14, bunits.YB, bunits.B, exact=True)
+
+    def test_stats(self) -> None:
+        convert = CachedConverter(maxsize=2)
+        convert(1)
+        convert(1)
+        convert(unit=bunits.B, n=1)
+        convert(2)
+        convert(3)
+        convert(1)
+
+        stats = convert.stats
+        assert (stats.hits, stats.misses, stats.maxsize, stats.currsize) == (2, 4, 2, 2)
+
+    def test_typed(self) -> None:
+        convert = CachedConverter()
+        assert isinstance(convert(1)[0], int)
+        assert isinstance(convert(1.0)[0], float)
+        assert convert.stats.misses == 2
+
+    def test_equal_decimals(self) -> None:
+        convert = CachedConverter()
+        assert str(convert(Decimal('1.50'), exact=True)[0]) == '1.50'
+        assert str(convert(Decimal('1.5'), exact=True)[0]) == '1.5'
+        assert convert.stats.misses == 2
+
+    def test_signed_zero(self) -> None:
+        convert = CachedConverter()
+        assert math.copysign(1.0, convert(0.0)[0]) == 1.0
+        assert math.copysign(1.0, convert(-0.0)[0]) == -1.0
+        assert str(convert(-0.0, exact=True)[0]) == '-0.0'
+        assert convert.stats.misses == 3
+
+    def test_clear(self) -> None:
+        convert = CachedConverter()
+        convert(1)
+        convert.clear()
+        assert convert.stats.currsize == convert.stats.hits == convert.stats.misses == 0
+
+    def test_errors_are_not_cached(self) -> None:
+        convert = CachedConverter()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                convert(1, unit=5)
+
+        assert convert.stats.currsize == 0
+
+    def test_threads(self) -> None:
+        convert = CachedConverter(maxsize=8)
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(convert, [i % 16 * 1024 for i in range(1000)]))
+
+        assert results == [convert_units(i % 16 * 1024) for i in range(1000)]
+        assert convert.stats.hits + convert.stats.misses == 1000
@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from binary import Converter
+from binary.cli import main
+
+
+class TestHumanize:
+    def test_columns(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'sizes.tsv'
+        path.write_text('size\tname\n1536\tdocs\n1073741824\tdata\n')
+
+        assert main(['humanize', str(path)]) == 0
+        assert capsys.readouterr().out == 'size\tname\n1.50 KiB\tdocs\n1.00 GiB\tdata\n'
+
+    def test_options(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'sizes.csv'
+        path.write_text('data,2500\n')
+
+        assert main(['humanize', str(path), '-c', '1', '-d', ',', '-p', '1', '--si']) == 0
+        assert capsys.readouterr().out == 'data,2.5 KB\n'
+
+    def test_json(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'sizes.jsonl'
+        path.write_text(json.dumps({'name': 'data', 'size': 2048}) + '\n')
+
+        assert main(['humanize', str(path), '-f', 'size']) == 0
+        assert json.loads(capsys.readouterr().out) == {'name': 'data', 'size': '2.00 KiB'}
+
+    def test_stdin(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        monkeypatch.setattr('sys.stdin', ['1024\n'])
+
+        assert main(['humanize']) == 0
+        assert capsys.readouterr().out == '1.00 KiB\n'
+
+    def test_missing_file(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'missing.tsv'
+
+        assert main(['humanize', str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out == ''
+        assert captured.err.startswith('binary humanize: ')
+        assert str(path) in captured.err
+
+
+class TestDu:
+    def test_tree(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'sub' / 'file').write_bytes(b'x' * 1536)
+
+        assert main(['du', '-b', '-d', '1', '-p', '2', str(tmp_path)]) == 0
+        sub = os.stat(tmp_path / 'sub').st_size + 1536
+        root = os.stat(tmp_path).st_size + sub
+        assert capsys.readouterr().out.splitlines() == [
+            f'{Converter(precision=2).format(sub)}\t{tmp_path / "sub"}',
+            f'{Converter(precision=2).format(root)}\t{tmp_path}',
+        ]
+
+    def test_file(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'file'
+        path.write_bytes(b'x' * 2048)
+
+        assert main(['du', '-b', str(path)]) == 0
+        captured = capsys.readouterr()
+        assert captured.out == f'2.0 KiB\t{path}\n'
+        assert captured.err == ''
+
+    def test_missing(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        path = tmp_path / 'file'
+        path.write_bytes(b'x' * 1000)
+
+        assert main(['du', '-b', '--si', str(tmp_path / 'missing'), str(path)]) == 1
+        captured = capsys.readouterr()
+        assert captured.out == f'1.0 KB\t{path}\n'
+        assert captured.err.startswith('binary du: ')
+        assert 'missing' in captured.err
+
+    def test_humanize_does_not_import_du(self) -> None:
+        code = 'import sys; import binary.cli; print("binary.du" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], text=True)
+        assert output.strip() == 'False'
@@ -0,0 +1,83 @@
+import importlib.util
+import os
+from decimal import Decimal
+from fractions import Fraction
+from types import ModuleType
+from typing import List, Union
+
+import pytest
+
+from binary import core, parsing
+from binary.core import PREFIXES
+
+pytestmark = pytest.mark.skipif(not core.COMPILED, reason='the compiled modules are not installed')
+
+
+def load_source(module: ModuleType) -> ModuleType:
+    # The compiled modules are distributed alongside their sources
+    path = os.path.join(os.path.dirname(module.__file__ or ''), f'{module.__name__.rpartition(".")[2]}.py')
+    if not os.path.isfile(path):
+        pytest.skip(f'{path} is not installed')
+
+    spec = importlib.util.spec_from_file_location(f'{module.__name__}_source', path)
+    assert spec is not None and spec.loader is not None
+    source = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(source)
+    return source
+
+
+NUMBERS: List[Union[int, float]] = [
+    0, 1, -1, 3.14, 1023, 1024, 999, 1000, 10 ** 6, -(2 ** 30), 2 ** 53 + 1, 2 ** 80, 10 ** 25, 1e30, -1e-3,
+]
+
+
+class TestCompiled:
+    def test_flag(self) -> None:
+        assert not load_source(core).COMPILED
+
+    @pytest.mark.parametrize('si', [False, True])
+    def test_convert_units(self, si: bool) -> None:
+        source = load_source(core)
+        for n in NUMBERS:
+            for unit in PREFIXES:
+                assert core.convert_units(n, unit, si=si) == source.convert_units(n, unit, si=si)
+                for to in PREFIXES:
+                    assert core.convert_units(n, unit, to, si) == source.convert_units(n, unit, to, si)
+
+    def test_convert_units_exact(self) -> None:
+        source = load_source(core)
+        for n in [*NUMBERS, Decimal('1.5'), Fraction(1, 3)]:
+            for unit in PREFIXES:
+                assert core.convert_units(n, unit, exact=True) == source.convert_units(n, unit, exact=True)
+
+    def test_convert_units_int(self) -> None:
+        source = load_source(core)
+        for n in NUMBERS:
+            if isinstance(n, int):
+                for unit in PREFIXES:
+                    for si in (False, True):
+                        assert core.convert_units_int(n, unit, si=si) == source.convert_units_int(n, unit, si=si)
+
+    def test_convert_units_rounded(self) -> None:
+        source = load_source(core)
+        for n in [*NUMBERS, 1023.996 * 1024, 999.6 * 1000]:
+            for si in (False, True):
+                for precision in (0, 2):
+                    assert core.convert_units_rounded(n, si=si, precision=precision) == source.convert_units_rounded(
+                        n, si=si, precision=precision
+                    )
+                assert core.convert_units_rounded(n, si=si, digits=3) == source.convert_units_rounded(n, si=si, digits=3)
+
+    def test_parse_size(self) -> None:
+        source = load_source(parsing)
+        for s in ['0', '1.5 GiB', '200MB', '3T', '2ki', '-4 KiB', '1e3 kb', '512 bytes']:
+            assert parsing.parse_size(s) == source.parse_size(s)
+            assert parsing.parse_size(s, exact=True) == source.parse_size(s, exact=True)
+
+    def test_errors(self) -> None:
+        source = load_source(core)
+        for module in (core, source):
+            with pytest.raises(ValueError):
+                module.convert_units(1, unit=3)
+            with pytest.raises(ValueError):
+                module.convert_units(1, to=3)
@@ -0,0 +1,79 @@
+from decimal import ROUND_DOWN, Context, Decimal
+from fractions import Fraction
+
+import pytest
+
+from binary import BinaryUnits as bunits, Converter, DecimalUnits as dunits, convert_units
+
+VALUES = [
+    0, 1, -1, 1023, 1024, -1024, 999, 1000, 3.14, -3.14, 2 ** 53 + 1,
+    bunits.MB - 1, bunits.YB, -bunits.YB, dunits.YB - 1, dunits.YB, float(dunits.YB),
+]
+
+
+class TestConverter:
+    @pytest.mark.parametrize('si', [False, True])
+    @pytest.mark.parametrize('exact', [False, True])
+    def test_auto_scale(self, si: bool, exact: bool) -> None:
+        converter = Converter(si=si, exact=exact)
+        for n in VALUES:
+            assert converter(n) == convert_units(n, si=si, exact=exact)
+
+    @pytest.mark.parametrize('unit', [bunits.KB, dunits.KB, bunits.YB, dunits.YB])
+    def test_unit(self, unit: int) -> None:
+        converter = Converter(unit)
+        for n in VALUES:
+            assert converter(n) == convert_units(n, unit)
+
+    @pytest.mark.parametrize('to', [bunits.B, bunits.KB, dunits.MB, bunits.YB])
+    @pytest.mark.parametrize('exact', [False, True])
+    def test_to(self, to: int, exact: bool) -> None:
+        converter = Converter(bunits.MB, to, exact=exact)
+        for n in VALUES[:11]:
+            assert converter(n) == convert_units(n, bunits.MB, to, exact=exact)
+
+    @pytest.mark.parametrize('to', [None, bunits.B, bunits.KB])
+    def test_context(self, to: int) -> None:
+        context = Context(prec=8, rounding=ROUND_DOWN)
+        converter = Converter(bunits.KB, to, exact=True, context=context)
+        for n in (Fraction(1, 3), Decimal('1.5'), 1000, 3.14):
+            assert converter(n) == convert_units(n, bunits.KB, to, exact=True, context=context)
+
+    def test_types(self) -> None:
+        assert Converter()(5) == (5, 'B')
+        assert isinstance(Converter()(5)[0], int)
+        assert isinstance(Converter(exact=True)(2048)[0], Decimal)
+
+    def test_format(self) -> None:
+        assert Converter().format(1536) == '1.5 KiB'
+        assert Converter(precision=2).format(1536) == '1.50 KiB'
+        assert Converter(si=True, template='{amount:.1f}{unit}/s').format(2500) == '2.5KB/s'
+
+    def test_format_exact(self) -> None:
+        converter = Converter(exact=True, precision=30)
+        assert converter.format(Decimal(1) / 3) == f'{Decimal(1) / 3:.30f} B'
+        assert Converter(exact=True).format(1536) == '1.5 KiB'
+
+    @pytest.mark.parametrize('to', [None, bunits.KB])
+    def test_format_matches_convert(self, to: int) -> None:
+        converter = Converter(to=to, precision=3)
+        for n in VALUES:
+            amount, unit = convert_units(n, to=to)
+            assert converter.format(n) == f'{amount:.3f} {unit}'
+
+    def test_format_template_fields(self) -> None:
+        assert Converter(template='{{{amount}}} {unit!r:>6}').format(2048) == "{2.0}  'KiB'"
+        with pytest.raises(ValueError):
+            Converter(template='{amount} {units}')
+
+    def test_convert(self) -> None:
+        converter = Converter(si=True)
+        assert converter.convert(2500) == converter(2500) == (2.5, 'KB')
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            Converter(unit=5)
+
+    def test_unknown_to(self) -> None:
+        with pytest.raises(ValueError):
+            Converter(to=5)
@@ -1,11 +1,17 @@
-from decimal import Decimal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_DOWN, Context, Decimal
+from fractions import Fraction
+from typing import Any, Tuple
 
 import pytest
 
 import binary
 from binary import (
-    BinaryUnits as bunits, DecimalUnits as dunits, convert_units
+    BinaryUnits as bunits, DecimalUnits as dunits, convert_units, convert_units_int, convert_units_rounded
 )
+from binary import core
 from binary.core import PREFIXES
 
 
@@ -261,6 +267,53 @@ class TestConvertFloatExact:
         assert convert_units(-3.14, dunits.YB, dunits.YB, exact=True) == (Decimal('-3.14'), 'YB')
 
 
+class TestConvertExactTypes:
+    def test_int(self) -> None:
+        n = 10 ** 20 + 1
+        assert convert_units(n, to=bunits.B, exact=True) == (Decimal(n), 'B')
+
+    def test_decimal(self) -> None:
+        assert convert_units(Decimal('1.5'), bunits.KB, exact=True) == (Decimal('1.5'), 'KiB')
+        assert convert_units(Decimal('1.5'), bunits.KB, bunits.B, exact=True) == (Decimal(1536), 'B')
+
+    def test_fraction(self) -> None:
+        assert convert_units(Fraction(3, 2), bunits.MB, exact=True) == (Decimal('1.5'), 'MiB')
+        assert convert_units(Fraction(1, 4), bunits.KB, bunits.B, exact=True) == (Decimal(256), 'B')
+
+    def test_context(self) -> None:
+        context = Context(prec=5, rounding=ROUND_DOWN)
+        assert convert_units(Fraction(1, 3), bunits.KB, exact=True, context=context) == (Decimal('341.32'), 'B')
+        assert convert_units(2 ** 40 - 1, exact=True, context=context) == (Decimal('1023.9'), 'GiB')
+        assert convert_units(5, bunits.KB, dunits.KB, exact=True, context=context) == (Decimal('5.12'), 'KB')
+        assert convert_units(5.5, bunits.KB, bunits.B, exact=True, context=context) == (Decimal(5632), 'B')
+
+    def test_context_ignored_when_inexact(self) -> None:
+        assert convert_units(3, bunits.KB, context=Context(prec=1)) == (3.0, 'KiB')
+
+    def test_lazy_initialization_threads(self) -> None:
+        # Every round resets the table of decimal units so that the threads
+        # race to build it, switching threads as often as possible.
+        units = dict(core._EXACT_UNITS)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(20):
+                core._EXACT_UNITS.clear()
+                barrier = threading.Barrier(16)
+
+                def work() -> Tuple[Any, str]:
+                    barrier.wait()
+                    return convert_units(1, bunits.YB, exact=True)
+
+                with ThreadPoolExecutor(16) as executor:
+                    futures = [executor.submit(work) for _ in range(16)]
+
+                assert [future.result() for future in futures] == [(Decimal(1), 'YiB')] * 16
+        finally:
+            sys.setswitchinterval(interval)
+            core._EXACT_UNITS.update(units)
+
+
 class TestConvertUnknownTo:
     def test_byte(self) -> None:
         assert convert_units(bunits.B) == (bunits.B, 'B')
@@ -365,6 +418,107 @@ class TestConvertUnknownTo:
         assert convert_units(-dunits.YB, si=True) == (-dunits.YB / dunits.YB, 'YB')
 
 
+class TestConvertInt:
+    def test_to(self) -> None:
+        assert convert_units_int(1, bunits.YB, bunits.B) == (bunits.YB, 0, 'B')
+        assert convert_units_int(1536, bunits.B, bunits.KB) == (1, 512, 'KiB')
+        assert convert_units_int(-1536, bunits.B, bunits.KB) == (-1, -512, 'KiB')
+        assert convert_units_int(2500, dunits.MB, dunits.GB) == (2, 500 * dunits.MB, 'GB')
+
+    def test_binary(self) -> None:
+        assert convert_units_int(0) == (0, 0, 'B')
+        assert convert_units_int(bunits.KB - 1) == (bunits.KB - 1, 0, 'B')
+        assert convert_units_int(bunits.KB) == (1, 0, 'KiB')
+        assert convert_units_int(bunits.MB - 1) == (1023, bunits.KB - 1, 'KiB')
+        assert convert_units_int(-bunits.MB + 1) == (-1023, -bunits.KB + 1, 'KiB')
+        assert convert_units_int(bunits.YB - 1) == (1023, bunits.ZB - 1, 'ZiB')
+        assert convert_units_int(bunits.YB * 2048 + 1) == (2048, 1, 'YiB')
+
+    def test_decimal(self) -> None:
+        assert convert_units_int(dunits.KB - 1, si=True) == (dunits.KB - 1, 0, 'B')
+        assert convert_units_int(dunits.KB, si=True) == (1, 0, 'KB')
+        assert convert_units_int(-dunits.GB - 1, si=True) == (-1, -1, 'GB')
+        assert convert_units_int(3, bunits.MB, si=True) == (3, 145728, 'MB')
+        assert convert_units_int(5000, dunits.YB) == (5000, 0, 'YB')
+
+    def test_matches_auto_scale(self) -> None:
+        for n in (1, 1023, 1024, 10 ** 6, 2 ** 40 + 7, -(2 ** 50), 999_999_999):
+            for si in (False, True):
+                assert convert_units_int(n, si=si)[2] == convert_units(n, si=si)[1]
+
+    def test_precision(self) -> None:
+        n = 2 ** 70 + 1
+        quotient, remainder, unit = convert_units_int(n, bunits.B, bunits.KB)
+        assert quotient * bunits.KB + remainder == n
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_int(1, unit=5)
+
+    def test_unknown_to(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_int(1, to=5)
+
+
+class TestConvertRounded:
+    def test_rounds_up_to_next_unit(self) -> None:
+        assert convert_units_rounded(1023.994 * bunits.KB) == (1023.99, 2, 'KiB')
+        assert convert_units_rounded(1023.996 * bunits.KB) == (1.0, 2, 'MiB')
+        assert convert_units_rounded(bunits.MB - 1) == (1.0, 2, 'MiB')
+        assert convert_units_rounded(-(bunits.MB - 1)) == (-1.0, 2, 'MiB')
+        assert convert_units_rounded(999.996, dunits.MB) == (1.0, 2, 'GB')
+        assert convert_units_rounded(1023.6, bunits.KB, precision=0) == (1.0, 0, 'MiB')
+        assert convert_units_rounded(1023.4, bunits.KB, precision=0) == (1023.0, 0, 'KiB')
+
+    def test_bytes(self) -> None:
+        assert convert_units_rounded(0) == (0.0, 2, 'B')
+        assert convert_units_rounded(512) == (512.0, 2, 'B')
+        assert convert_units_rounded(1023.999) == (1.0, 2, 'KiB')
+
+    def test_si(self) -> None:
+        assert convert_units_rounded(1, bunits.KB, si=True) == (1.02, 2, 'KB')
+        assert convert_units_rounded(999_999, si=True) == (1.0, 2, 'MB')
+        assert convert_units_rounded(999_999) == (976.56, 2, 'KiB')
+
+    def test_largest_unit(self) -> None:
+        assert convert_units_rounded(2048, bunits.YB) == (2048.0, 2, 'YiB')
+        assert convert_units_rounded(bunits.YB - 1) == (1.0, 2, 'YiB')
+
+    def test_significant_digits(self) -> None:
+        assert convert_units_rounded(1.234, bunits.GB, digits=3) == (1.23, 2, 'GiB')
+        assert convert_units_rounded(9.996, bunits.KB, digits=3) == (10.0, 1, 'KiB')
+        assert convert_units_rounded(12.34, bunits.KB, digits=3) == (12.3, 1, 'KiB')
+        assert convert_units_rounded(99.96, bunits.KB, digits=3) == (100.0, 0, 'KiB')
+        assert convert_units_rounded(999.6, bunits.KB, digits=3) == (1000.0, 0, 'KiB')
+        assert convert_units_rounded(1023.6, bunits.KB, digits=3) == (1.0, 2, 'MiB')
+        assert convert_units_rounded(999.6, dunits.KB, digits=3) == (1.0, 2, 'MB')
+        assert convert_units_rounded(-12.34, dunits.KB, digits=5) == (-12.34, 3, 'KB')
+        assert convert_units_rounded(123_456, bunits.KB, digits=1) == (121.0, 0, 'MiB')
+
+    @pytest.mark.parametrize('precision', [0, 1, 2, 3])
+    @pytest.mark.parametrize('si', [False, True])
+    def test_never_displays_base(self, precision: int, si: bool) -> None:
+        base = 1000 if si else 1024
+        units = bunits[2::2] if not si else dunits[2::2]
+        for unit in units[:-1]:
+            for step in range(-50, 50):
+                n = unit * base - step * unit / 10 ** (precision + 2)
+                amount, decimals, suffix = convert_units_rounded(n, si=si, precision=precision)
+                assert float(f'{amount:.{decimals}f}') < base
+                expected, expected_suffix = convert_units(n, si=si)
+                rounded = round(float(expected), precision)
+                if rounded < base:
+                    assert (amount, suffix) == (rounded, expected_suffix)
+
+    def test_errors(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_rounded(1, unit=5)
+        with pytest.raises(ValueError):
+            convert_units_rounded(1, precision=-1)
+        with pytest.raises(ValueError):
+            convert_units_rounded(1, digits=0)
+
+
 class TestUnknownUnits:
     def test_unit(self) -> None:
         with pytest.raises(ValueError):
@@ -0,0 +1,167 @@
+import threading
+from typing import Callable, List
+
+import pytest
+
+from binary.counters import CounterRegistry, ShardedCounter
+from binary.styles import Style
+
+
+def run_threads(count: int, target: Callable[[], object]) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestShardedCounter:
+    def test_add(self) -> None:
+        counter = ShardedCounter()
+        assert counter.value == 0
+
+        counter.add()
+        counter.add(1023)
+        counter.add(-24)
+        assert counter.value == 1000
+
+    def test_threads(self) -> None:
+        counter = ShardedCounter()
+
+        def work() -> None:
+            for _ in range(10_000):
+                counter.add(3)
+
+        run_threads(8, work)
+        assert counter.value == 8 * 10_000 * 3
+
+    def test_exited_threads_are_folded(self) -> None:
+        counter = ShardedCounter()
+        run_threads(4, lambda: counter.add(5))
+
+        assert counter.value == 20
+        assert counter._shards == []
+        assert counter._retired == 20
+
+        counter.add(1)
+        assert counter.value == 21
+        assert len(counter._shards) == 1
+
+    def test_read_while_adding(self) -> None:
+        counter = ShardedCounter()
+        stop = threading.Event()
+        values: List[int] = []
+
+        def work() -> None:
+            while not stop.is_set():
+                counter.add(1)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(100):
+                values.append(counter.value)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        assert values == sorted(values)
+        assert counter.value >= values[-1]
+
+    def test_humanize(self) -> None:
+        counter = ShardedCounter()
+        counter.add(1536)
+        assert counter.humanize() == '1.50 KiB'
+
+        rendered = counter.humanize()
+        assert counter.humanize() is rendered
+
+        counter.add(1)
+        assert counter.humanize() is not rendered
+        assert counter.humanize() == '1.50 KiB'
+
+        counter.add(2 ** 20)
+        assert counter.humanize() == '1.00 MiB'
+
+    def test_style(self) -> None:
+        counter = ShardedCounter('kubernetes')
+        counter.add(3 * 2 ** 30)
+        assert counter.humanize() == '3Gi'
+
+        counter = ShardedCounter(Style(('B', 'kB'), base=1000, precision=1))
+        counter.add(2500)
+        assert counter.humanize() == '2.5 kB'
+
+    def test_unknown_style(self) -> None:
+        with pytest.raises(ValueError):
+            ShardedCounter('unknown')
+
+    def test_repr(self) -> None:
+        counter = ShardedCounter()
+        counter.add(7)
+        assert repr(counter) == "ShardedCounter(value=7, style='iec')"
+
+
+class TestCounterRegistry:
+    def test_counter(self) -> None:
+        counters = CounterRegistry()
+        read = counters.counter('read')
+
+        assert counters.counter('read') is read
+        assert 'read' in counters
+        assert 'written' not in counters
+        assert len(counters) == 1
+
+    def test_snapshot(self) -> None:
+        counters = CounterRegistry()
+        counters.counter('read').add(100)
+        counters.counter('written').add(50)
+        counters.counter('written').add(50)
+
+        assert counters.snapshot() == {'read': 100, 'written': 100}
+
+    def test_concurrent_creation(self) -> None:
+        counters = CounterRegistry()
+        created: List[ShardedCounter] = []
+
+        def work() -> None:
+            counter = counters.counter('cached')
+            created.append(counter)
+            for _ in range(1000):
+                counter.add(2)
+
+        run_threads(8, work)
+        assert all(counter is created[0] for counter in created)
+        assert counters.snapshot() == {'cached': 16_000}
+
+    def test_humanize(self) -> None:
+        counters = CounterRegistry(style='si')
+        counters.counter('read').add(1500)
+        counters.counter('written')
+
+        humanized = counters.humanize()
+        assert humanized == {'read': '1.50 KB', 'written': '0.00 B'}
+
+        # Mutating the result does not affect the cache
+        humanized['read'] = ''
+        assert counters.humanize()['read'] == '1.50 KB'
+
+    def test_humanize_cached(self) -> None:
+        counters = CounterRegistry()
+        read = counters.counter('read')
+        read.add(1)
+
+        first = counters._rendered
+        counters.humanize()
+        cached = counters._rendered
+        counters.humanize()
+        assert counters._rendered is cached is not first
+
+        read.add(1)
+        counters.humanize()
+        assert counters._rendered is not cached
+
+        counters.counter('written')
+        assert counters.humanize() == {'read': '2.00 B', 'written': '0.00 B'}
@@ -0,0 +1,319 @@
+"""Differential tests of every alternative conversion path against the
+scalar :func:`~binary.core.convert_units`.
+
+Each implementation is registered with :func:`implementation` and receives
+generated cases covering the whole range of units, negatives, floats, exact
+quantities and the values around every unit threshold. An implementation
+returns ``None`` for cases outside of its documented domain, and must raise
+the same type of exception as the reference if the reference raises, e.g.
+when an exact quotient exceeds the precision of the decimal context. The
+median time per call of each implementation is shown in the terminal
+summary.
+"""
+import math
+from decimal import Decimal
+from fractions import Fraction
+from time import perf_counter, perf_counter_ns
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+import pytest
+
+hypothesis = pytest.importorskip('hypothesis')
+
+from hypothesis import example, given, settings, strategies as st  # noqa: E402
+
+from binary import CachedConverter, Converter, convert_units_int, convert_units_rounded, core, profiling  # noqa: E402
+from binary.batch import _convert_units_many_python, _unit_system, convert_units_many  # noqa: E402
+from binary.core import BINARY_PREFIXES, BYTE, PREFIXES  # noqa: E402
+
+from .conftest import TIMINGS  # noqa: E402
+
+if core.COMPILED:
+    from .test_compiled import load_source
+
+    reference = load_source(core).convert_units
+else:
+    reference = core.convert_units
+
+# Generated examples are not saved so that runs leave no files behind
+SETTINGS = settings(max_examples=300, deadline=None, database=None)
+# The number of calls timed per case
+REPEAT = 20
+
+UNITS = sorted(PREFIXES)
+UNIT_BY_SUFFIX = {suffix: unit for unit, suffix in PREFIXES.items()}
+
+
+class Case(NamedTuple):
+    n: Any
+    unit: int
+    to: Optional[int]
+    si: bool
+    exact: bool
+
+    def bytes(self) -> Any:
+        return self.n * self.unit
+
+
+Result = Tuple[Any, str]
+Convert = Callable[[Case], Optional[Result]]
+
+
+def same(case: Case, result: Result) -> Optional[Result]:
+    return result
+
+
+class Implementation(NamedTuple):
+    convert: Convert
+    expected: Callable[[Case, Result], Optional[Result]]
+    rel_tol: float
+    abs_tol: float
+
+
+IMPLEMENTATIONS: Dict[str, Implementation] = {}
+
+
+def implementation(
+    name: str,
+    expected: Callable[[Case, Result], Optional[Result]] = same,
+    rel_tol: float = 0.0,
+    abs_tol: float = 0.0
+) -> Callable[[Convert], Convert]:
+    """Registers a conversion path. By default it must match the result of
+    the reference for the same case exactly.
+    """
+    def register(convert: Convert) -> Convert:
+        IMPLEMENTATIONS[name] = Implementation(convert, expected, rel_tol, abs_tol)
+        return convert
+
+    return register
+
+
+def is_number(n: Any) -> bool:
+    return isinstance(n, (int, float))
+
+
+def is_double(n: Any) -> bool:
+    # Integers beyond 2 ** 53 are not exactly representable as floats
+    return isinstance(n, float) or (isinstance(n, int) and abs(n) <= 2 ** 53)
+
+
+CONVERTERS: Dict[Tuple[int, Optional[int], bool, bool], Converter] = {}
+
+
+@implementation('converter')
+def converter(case: Case) -> Optional[Result]:
+    key = case[1:]
+    try:
+        convert = CONVERTERS[key]
+    except KeyError:
+        convert = CONVERTERS[key] = Converter(case.unit, case.to, case.si, case.exact)
+    return convert(case.n)
+
+
+CACHE = CachedConverter(maxsize=64)
+
+
+@implementation('cached')
+def cached(case: Case) -> Optional[Result]:
+    return CACHE(case.n, case.unit, case.to, case.si, case.exact)
+
+
+PROFILED = profiling._make_wrapper(None, perf_counter)
+
+
+@implementation('profiled')
+def profiled(case: Case) -> Optional[Result]:
+    result: Result = PROFILED(case.n, case.unit, case.to, case.si, case.exact)
+    return result
+
+
+if core.COMPILED:
+    @implementation('compiled')
+    def compiled(case: Case) -> Optional[Result]:
+        return core.convert_units(case.n, case.unit, case.to, case.si, case.exact)
+
+
+@implementation('many')
+def many(case: Case) -> Optional[Result]:
+    # Without NumPy this is the same as many_python
+    if case.exact or not is_double(case.n) or not is_double(case.bytes()):
+        return None
+    # Integers are divided by the closest double to an inexact unit, see
+    # convert_units_many
+    if isinstance(case.n, int) and not all(float(u) == u for u in (case.unit, case.to or BYTE)):
+        return None
+
+    amounts, units = convert_units_many([case.n], case.unit, case.to, case.si)
+    return amounts[0], units[0]
+
+
+@implementation('many_python')
+def many_python(case: Case) -> Optional[Result]:
+    if case.exact or not is_number(case.n):
+        return None
+    # Quantities are stored as doubles
+    if case.to == BYTE and not is_double(case.bytes()):
+        return None
+
+    thresholds, _, suffixes = _unit_system(case.unit, case.si)
+    amounts, units = _convert_units_many_python([case.n], case.unit, case.to, thresholds, suffixes)
+    return amounts[0], units[0]
+
+
+@implementation('int', rel_tol=1e-12)
+def integer(case: Case) -> Optional[Result]:
+    if case.exact or not isinstance(case.n, int):
+        return None
+
+    quotient, remainder, suffix = convert_units_int(case.n, case.unit, case.to, case.si)
+    divisor = UNIT_BY_SUFFIX[suffix]
+    assert quotient * divisor + remainder == case.bytes()
+    assert abs(remainder) < divisor
+
+    return quotient + remainder / divisor, suffix
+
+
+def rounded_expected(case: Case, result: Result) -> Optional[Result]:
+    amount, suffix = result
+    base = 1024 if case.unit in BINARY_PREFIXES and not case.si else 1000
+    # Amounts that round up to the base are expected in the next unit
+    if abs(round(amount, 2)) >= base and suffix not in ('YiB', 'YB'):
+        return None
+    return round(amount, 2), suffix
+
+
+# Rounding at a tie may differ by one digit as the amounts are computed from
+# floats rather than the exact byte count
+@implementation('rounded', expected=rounded_expected, rel_tol=1e-12, abs_tol=0.01)
+def rounded(case: Case) -> Optional[Result]:
+    if case.exact or case.to or not is_number(case.n):
+        return None
+
+    amount, _, suffix = convert_units_rounded(case.n, case.unit, case.si)
+    return amount, suffix
+
+
+@implementation('exact', rel_tol=1e-12)
+def exact(case: Case) -> Optional[Result]:
+    # Floats are converted from their shortest representation rather than
+    # their binary value, which may fall on the other side of a threshold
+    if case.exact or not isinstance(case.n, int):
+        return None
+    # Integer division fails beyond the precision of the decimal context
+    if case.to == BYTE and abs(case.bytes()) >= 10 ** 28:
+        return None
+
+    amount, suffix = core.convert_units(case.n, case.unit, case.to, case.si, exact=True)
+    return float(amount), suffix
+
+
+def threshold_values() -> 'st.SearchStrategy[Any]':
+    # The integers and floats closest to every multiple of a unit that is a
+    # threshold in either unit system
+    thresholds = sorted({unit * factor for unit in UNITS for factor in (1, 1000, 1024)})
+    integers = st.builds(lambda t, d, sign: sign * (t + d), st.sampled_from(thresholds), st.integers(-2, 2),
+                         st.sampled_from([1, -1]))
+    floats = st.builds(lambda t, up: math.nextafter(float(t), math.inf if up else 0.0), st.sampled_from(thresholds),
+                       st.booleans())
+    return st.one_of(integers, floats)
+
+
+NUMBERS = st.one_of(
+    st.integers(-(2 ** 100), 2 ** 100),
+    st.integers(-(2 ** 20), 2 ** 20),
+    st.floats(-1e30, 1e30, allow_nan=False, allow_infinity=False),
+    threshold_values(),
+)
+EXACT_NUMBERS = st.one_of(
+    NUMBERS,
+    st.decimals(-10 ** 20, 10 ** 20, allow_nan=False, allow_infinity=False, places=6),
+    st.fractions(-(10 ** 12), 10 ** 12, max_denominator=10 ** 6),
+)
+
+
+@st.composite
+def cases(draw: Callable[..., Any]) -> Case:
+    exact = draw(st.booleans())
+    n = draw(EXACT_NUMBERS if exact else NUMBERS)
+    unit = draw(st.sampled_from(UNITS))
+    # Large quantities of large units exceed the range of doubles
+    if isinstance(n, float) and abs(n) * unit > 1e300:
+        n = n / unit
+    return Case(n, unit, draw(st.none() | st.sampled_from(UNITS)), draw(st.booleans()), exact)
+
+
+class Timings(Dict[str, List[Tuple[float, float]]]):
+    # The nanoseconds of every call of an implementation and of the reference
+    # for the same case, shown briefly in the report of a failing example
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(self)})'
+
+
+@pytest.fixture(scope='module')
+def timings(request: pytest.FixtureRequest) -> Timings:
+    # Reported in the terminal summary, see conftest.py
+    timings = request.config.stash[TIMINGS] = Timings()
+    return timings
+
+
+def timed(convert: Callable[[], Optional[Result]]) -> Tuple[Optional[Result], Optional[Type[Exception]], float]:
+    try:
+        result = convert()
+    except Exception as e:
+        return None, type(e), 0.0
+
+    # A single call would mostly measure cold caches after generating the case
+    start = perf_counter_ns()
+    for _ in range(REPEAT):
+        convert()
+    return result, None, (perf_counter_ns() - start) / REPEAT
+
+
+def assert_agrees(actual: Result, expected: Result, rel_tol: float, abs_tol: float) -> None:
+    assert actual[1] == expected[1]
+    if rel_tol or abs_tol:
+        assert math.isclose(actual[0], expected[0], rel_tol=rel_tol, abs_tol=abs_tol)
+    else:
+        assert actual[0] == expected[0]
+
+
+@pytest.mark.parametrize('name', sorted(IMPLEMENTATIONS))
+@SETTINGS
+@given(case=cases())
+@example(case=Case(2 ** 60 - 1, BYTE, None, False, False))
+@example(case=Case(999_999_999_999, BYTE, None, True, False))
+@example(case=Case(-1024, BYTE, None, False, False))
+@example(case=Case(1.5, 1024 ** 8, 1000, False, False))
+@example(case=Case(Decimal('1023.999'), 1024, None, False, True))
+@example(case=Case(Fraction(1, 3), 1000, None, False, True))
+@example(case=Case(10 ** 30, BYTE, BYTE, False, True))
+@example(case=Case(1, BYTE, 10 ** 24, False, False))
+def test_agrees_with_reference(name: str, case: Case, timings: Timings) -> None:
+    implementation = IMPLEMENTATIONS[name]
+    expected, expected_error, reference_time = timed(
+        lambda: reference(case.n, case.unit, case.to, case.si, case.exact)
+    )
+    actual, error, elapsed = timed(lambda: implementation.convert(case))
+
+    if expected_error is not None:
+        assert error is expected_error or (actual is None and error is None)
+        return
+
+    assert error is None
+    assert expected is not None
+    if actual is None:
+        return
+
+    timings.setdefault(name, []).append((elapsed, reference_time))
+
+    expected = implementation.expected(case, expected)
+    if expected is not None:
+        assert_agrees(actual, expected, implementation.rel_tol, implementation.abs_tol)
+
+
+def test_registry() -> None:
+    assert {'converter', 'cached', 'profiled', 'many', 'many_python', 'int', 'rounded', 'exact'} <= set(
+        IMPLEMENTATIONS
+    )
+    assert ('compiled' in IMPLEMENTATIONS) is core.COMPILED
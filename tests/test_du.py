@@ -0,0 +1,145 @@
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from binary.du import DirectoryUsage, scan
+
+
+def make_tree(root: Path) -> None:
+    (root / 'a' / 'b').mkdir(parents=True)
+    (root / 'c').mkdir()
+    (root / 'top.bin').write_bytes(b'x' * 100)
+    (root / 'a' / 'one.bin').write_bytes(b'x' * 2000)
+    (root / 'a' / 'b' / 'two.bin').write_bytes(b'x' * 30000)
+    (root / 'c' / 'empty.bin').write_bytes(b'')
+
+
+def directory_size(path: Path) -> int:
+    return os.stat(path).st_size
+
+
+def by_path(usages: List[DirectoryUsage]) -> Dict[str, DirectoryUsage]:
+    return {usage.path: usage for usage in usages}
+
+
+class TestScan:
+    def test_totals(self, tmp_path: Path) -> None:
+        make_tree(tmp_path)
+        usages = by_path(list(scan(tmp_path, workers=4)))
+
+        b = usages[str(tmp_path / 'a' / 'b')]
+        assert (b.apparent, b.files, b.depth) == (30000 + directory_size(tmp_path / 'a' / 'b'), 1, 2)
+
+        a = usages[str(tmp_path / 'a')]
+        assert a.apparent == b.apparent + 2000 + directory_size(tmp_path / 'a')
+        assert a.files == 2
+
+        root = usages[str(tmp_path)]
+        assert root.files == 4
+        assert root.apparent == sum(
+            os.lstat(os.path.join(directory, name)).st_size
+            for directory, dirs, files in os.walk(tmp_path)
+            for name in dirs + files
+        ) + directory_size(tmp_path)
+
+    def test_allocated(self, tmp_path: Path) -> None:
+        make_tree(tmp_path)
+        root = list(scan(tmp_path))[-1]
+
+        if hasattr(os.stat_result, 'st_blocks'):
+            expected = sum(
+                os.lstat(os.path.join(directory, name)).st_blocks * 512
+                for directory, dirs, files in os.walk(tmp_path)
+                for name in dirs + files
+            ) + os.stat(tmp_path).st_blocks * 512
+            assert root.allocated == expected
+        else:
+            assert root.allocated == root.apparent
+
+    def test_children_before_parents(self, tmp_path: Path) -> None:
+        make_tree(tmp_path)
+        paths = [usage.path for usage in scan(tmp_path)]
+
+        assert paths[-1] == str(tmp_path)
+        assert paths.index(str(tmp_path / 'a' / 'b')) < paths.index(str(tmp_path / 'a'))
+        assert len(paths) == 4
+
+    def test_max_depth(self, tmp_path: Path) -> None:
+        make_tree(tmp_path)
+        usages = list(scan(tmp_path, max_depth=1))
+
+        assert sorted(usage.path for usage in usages) == sorted(map(str, [tmp_path, tmp_path / 'a', tmp_path / 'c']))
+        assert usages[-1].files == 4
+
+    def test_hard_links_counted_once(self, tmp_path: Path) -> None:
+        (tmp_path / 'a').mkdir()
+        (tmp_path / 'b').mkdir()
+        (tmp_path / 'a' / 'data').write_bytes(b'x' * 5000)
+        try:
+            os.link(tmp_path / 'a' / 'data', tmp_path / 'b' / 'data')
+        except OSError:
+            pytest.skip('hard links are not supported')
+
+        root = list(scan(tmp_path))[-1]
+        assert root.files == 1
+        assert root.apparent == 5000 + sum(directory_size(p) for p in (tmp_path, tmp_path / 'a', tmp_path / 'b'))
+
+    def test_symlinks(self, tmp_path: Path) -> None:
+        make_tree(tmp_path)
+        try:
+            os.symlink(tmp_path, tmp_path / 'c' / 'loop', target_is_directory=True)
+        except OSError:
+            pytest.skip('symbolic links are not supported')
+
+        # The link itself is counted as a file
+        assert list(scan(tmp_path))[-1].files == 5
+
+        # Cycles are only followed once
+        usages = list(scan(tmp_path, follow_symlinks=True))
+        assert usages[-1].files == 4
+        assert len(usages) == 4
+
+    def test_errors(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        make_tree(tmp_path)
+        errors: List[OSError] = []
+
+        def fail(path: str) -> None:
+            raise PermissionError(13, 'Permission denied', path)
+
+        original = os.scandir
+
+        def scandir(path: str) -> 'os._ScandirIterator[str]':
+            if path == str(tmp_path / 'a'):
+                fail(path)
+            return original(path)
+
+        monkeypatch.setattr(os, 'scandir', scandir)
+        usages = by_path(list(scan(tmp_path, onerror=errors.append)))
+
+        assert [error.filename for error in errors] == [str(tmp_path / 'a')]
+        assert usages[str(tmp_path / 'a')].files == 0
+        assert usages[str(tmp_path)].files == 2
+
+    def test_stop_early(self, tmp_path: Path) -> None:
+        for i in range(20):
+            (tmp_path / str(i) / 'sub').mkdir(parents=True)
+
+        iterator = scan(tmp_path, workers=2)
+        first = next(iterator)
+        iterator.close()
+        assert first.path.startswith(str(tmp_path))
+
+    def test_file(self, tmp_path: Path) -> None:
+        path = tmp_path / 'file'
+        path.write_bytes(b'x' * 100)
+
+        usages = list(scan(path))
+        assert len(usages) == 1
+        assert usages[0].path == str(path)
+        assert (usages[0].apparent, usages[0].files, usages[0].depth) == (100, 1, 0)
+
+    def test_missing(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            next(scan(tmp_path / 'missing'))
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+import binary
+from binary._units import BinaryUnits
+
+
+def imported_modules(code: str) -> Set[str]:
+    process = subprocess.run(
+        [sys.executable, '-c', f'{code}; import sys; print(" ".join(sys.modules))'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(process.stdout.split())
+
+
+class TestLazyImports:
+    def test_import_is_light(self) -> None:
+        modules = imported_modules('import binary')
+        assert 'decimal' not in modules
+        assert 'typing' not in modules
+        assert 'binary.converter' not in modules
+
+    def test_plain_conversion_is_light(self) -> None:
+        modules = imported_modules('import binary; binary.convert_units(1536, si=True)')
+        assert 'decimal' not in modules
+
+    def test_exact_imports_decimal(self) -> None:
+        modules = imported_modules('import binary; binary.convert_units(1536, exact=True)')
+        assert 'decimal' in modules
+
+    def test_lazy_attributes(self) -> None:
+        for name in binary.__all__:
+            assert getattr(binary, name) is not None
+
+        assert binary.BinaryUnits is BinaryUnits
+        assert set(binary.__all__) <= set(dir(binary))
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match='foo'):
+            binary.foo
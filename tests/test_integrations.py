@@ -0,0 +1,134 @@
+import math
+from typing import List
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, convert_units, parse_size
+
+# Beyond 2 ** 53 only floats convert identically, see convert_units_many
+VALUES = [0, 512, 1536, 10 ** 6, 3 * 2 ** 30, -2048, 2.0 ** 80]
+SIZES = [
+    '1.5 GiB', '200MB', '3T', ' 12 ', '512 bytes', '2ki', '1e3 KB', '-4 KiB', '8.00 Mb', '16 Kib', '1 gb',
+    '1_000 KB', '+2 MB', '.5 KiB', '1. KB', '1e',
+]
+INVALID = ['1 XB', 'KiB', '1.2.3 MB', 'inf KB', 'nan B', '1__0', '_1', '1._5', '- 5']
+
+
+def humanized(values: List[float], si: bool = False) -> List[str]:
+    return [f'{float(a):.2f} {u}' for a, u in (convert_units(n, si=si) for n in values)]
+
+
+class TestSeriesAccessor:
+    @pytest.fixture(autouse=True)
+    def pandas(self) -> None:
+        pytest.importorskip('pandas')
+        import binary.integrations  # noqa: F401
+
+    @pytest.mark.parametrize('si', [False, True])
+    def test_convert(self, si: bool) -> None:
+        import pandas as pd
+
+        frame = pd.Series(VALUES, index=list('abcdefg')).binary.convert(si=si)
+        pairs = [convert_units(n, si=si) for n in VALUES]
+
+        assert list(frame.index) == list('abcdefg')
+        assert frame['amount'].tolist() == [float(a) for a, _ in pairs]
+        assert frame['unit'].tolist() == [u for _, u in pairs]
+        assert frame['unit'].dtype == 'category'
+
+    def test_convert_to(self) -> None:
+        import pandas as pd
+
+        frame = pd.Series([1.5, 2048]).binary.convert(unit=bunits.MB, to=dunits.GB)
+        assert frame['amount'].tolist() == [float(convert_units(n, bunits.MB, dunits.GB)[0]) for n in (1.5, 2048)]
+        assert frame['unit'].tolist() == ['GB', 'GB']
+
+    def test_humanize(self) -> None:
+        import pandas as pd
+
+        assert pd.Series(VALUES).binary.humanize().tolist() == humanized(VALUES)
+        assert pd.Series(VALUES).binary.humanize(si=True).tolist() == humanized(VALUES, si=True)
+        assert pd.Series([1.0, None]).binary.humanize(precision=0).tolist() == ['1 B', None]
+
+    def test_parse(self) -> None:
+        import pandas as pd
+
+        assert pd.Series(SIZES).binary.parse().tolist() == [float(parse_size(s)) for s in SIZES]
+
+    def test_parse_missing(self) -> None:
+        import pandas as pd
+
+        result = pd.Series(['1 KiB', None]).binary.parse().tolist()
+        assert result[0] == 1024
+        assert math.isnan(result[1])
+
+    @pytest.mark.parametrize('size', INVALID)
+    def test_parse_invalid(self, size: str) -> None:
+        import pandas as pd
+
+        # The same numbers as parse_size are rejected
+        with pytest.raises(ValueError):
+            parse_size(size)
+        with pytest.raises(ValueError):
+            pd.Series(['1 KiB', size]).binary.parse()
+
+
+class TestArrow:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self) -> None:
+        pytest.importorskip('pyarrow')
+
+    @pytest.mark.parametrize('si', [False, True])
+    def test_convert_array(self, si: bool) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import convert_array
+
+        result = convert_array(pa.array(VALUES, type=pa.float64()), si=si)
+        pairs = [convert_units(n, si=si) for n in VALUES]
+
+        assert result.field('amount').to_pylist() == [float(a) for a, _ in pairs]
+        assert result.field('unit').to_pylist() == [u for _, u in pairs]
+        assert pa.types.is_dictionary(result.field('unit').type)
+
+    def test_convert_array_nulls(self) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import convert_array
+
+        result = convert_array(pa.array([2048, None]), to=bunits.KB)
+        assert result.to_pylist() == [{'amount': 2.0, 'unit': 'KiB'}, {'amount': None, 'unit': None}]
+
+    def test_humanize_array(self) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import humanize_array
+
+        result = humanize_array(pa.chunked_array([VALUES[:3], VALUES[3:] + [None]], type=pa.float64()))
+        assert isinstance(result, pa.ChunkedArray)
+        assert result.to_pylist() == [*humanized(VALUES), None]
+
+    def test_parse_array(self) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import parse_array
+
+        result = parse_array(pa.array(SIZES + [None]))
+        assert result.to_pylist() == [float(parse_size(s)) for s in SIZES] + [None]
+
+    @pytest.mark.parametrize('size', INVALID)
+    def test_parse_array_invalid(self, size: str) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import parse_array
+
+        with pytest.raises(ValueError):
+            parse_array(pa.array(['1 KiB', size]))
+
+    def test_invalid_unit(self) -> None:
+        import pyarrow as pa
+
+        from binary.integrations import convert_array
+
+        with pytest.raises(ValueError):
+            convert_array(pa.array([1]), unit=3)
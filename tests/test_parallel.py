@@ -0,0 +1,122 @@
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits
+from binary.batch import convert_units_many
+from binary import parallel
+from binary.parallel import convert_units_parallel
+
+VALUES = [float(i * 7919 % 10 ** 7) * 1.5 ** (i % 60) for i in range(1000)]
+
+
+@pytest.fixture(scope='module')
+def pool() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def as_lists(result: Any) -> List[List[Any]]:
+    return [list(result[0]), list(result[1])]
+
+
+class TestConvertUnitsParallel:
+    @pytest.mark.parametrize('si', [False, True])
+    def test_iterable(self, pool: ProcessPoolExecutor, si: bool) -> None:
+        result = convert_units_parallel(iter(VALUES), si=si, chunk_size=128, executor=pool)
+        assert as_lists(result) == as_lists(convert_units_many(VALUES, si=si))
+
+    def test_to(self, pool: ProcessPoolExecutor) -> None:
+        result = convert_units_parallel(VALUES, unit=bunits.KB, to=dunits.MB, chunk_size=100, executor=pool)
+        assert as_lists(result) == as_lists(convert_units_many(VALUES, unit=bunits.KB, to=dunits.MB))
+
+    def test_small_input_is_not_sharded(self) -> None:
+        result = convert_units_parallel([1024, 2048], executor=ThreadPoolExecutor(1), chunk_size=2)
+        assert as_lists(result) == [[1.0, 2.0], ['KiB', 'KiB']]
+
+    def test_empty(self) -> None:
+        assert as_lists(convert_units_parallel(iter([]))) == [[], []]
+
+    def test_without_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        with ThreadPoolExecutor(2) as executor:
+            amounts, units = convert_units_parallel(iter(VALUES), chunk_size=128, executor=executor)
+
+        assert isinstance(units, list)
+        assert [list(amounts), units] == as_lists(convert_units_many(VALUES))
+
+    @pytest.mark.parametrize('to', [None, bunits.B, bunits.GB])
+    def test_shared_memory(self, pool: ProcessPoolExecutor, to: int) -> None:
+        np = pytest.importorskip('numpy')
+        values = np.array(VALUES).reshape(10, 100)
+        amounts, units = convert_units_parallel(values, unit=bunits.KB, to=to, chunk_size=64, executor=pool)
+        expected_amounts, expected_units = convert_units_many(values, unit=bunits.KB, to=to)
+
+        assert amounts.shape == units.shape == (10, 100)
+        assert np.array_equal(amounts, expected_amounts)
+        assert np.array_equal(units, expected_units)
+
+    def test_file(self, pool: ProcessPoolExecutor, tmp_path: Path) -> None:
+        path = tmp_path / 'sizes.txt'
+        path.write_text(''.join(f'{n!r}\n' for n in VALUES))
+
+        result = convert_units_parallel(path, si=True, chunk_size=512, executor=pool)
+        assert as_lists(result) == as_lists(convert_units_many(VALUES, si=True))
+
+    def test_file_without_trailing_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / 'sizes.txt'
+        path.write_text('1024\n2048\n\n3072')
+
+        with ThreadPoolExecutor(2) as executor:
+            result = convert_units_parallel(str(path), chunk_size=3, executor=executor)
+
+        assert as_lists(result) == [[1.0, 2.0, 3.0], ['KiB', 'KiB', 'KiB']]
+
+    def test_bounded_submission(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        completed = []
+        backlog = []
+
+        def convert_chunk(*args: Any) -> Any:
+            time.sleep(0.001)
+            result = convert_units_many(*args)
+            completed.append(len(args[0]))
+            return result
+
+        def values() -> Iterator[float]:
+            for i, n in enumerate(VALUES):
+                backlog.append(i - sum(completed))
+                yield n
+
+        monkeypatch.setattr(parallel, '_convert_chunk', convert_chunk)
+        with ThreadPoolExecutor(2) as executor:
+            result = convert_units_parallel(values(), workers=2, chunk_size=10, executor=executor)
+
+        assert as_lists(result) == as_lists(convert_units_many(VALUES))
+        # Twice the workers pending, one chunk waiting to be submitted and
+        # one being read
+        assert max(backlog) <= (2 * 2 + 2) * 10
+
+    @pytest.mark.skipif(sys.version_info >= (3, 13), reason='shared memory is attached without tracking')
+    def test_shared_memory_threads(self) -> None:
+        np = pytest.importorskip('numpy')
+        from multiprocessing import resource_tracker
+
+        register = resource_tracker.register
+        values = np.array(VALUES)
+        with ThreadPoolExecutor(4) as executor:
+            amounts, units = convert_units_parallel(values, chunk_size=8, executor=executor)
+
+        assert resource_tracker.register is register
+        assert np.array_equal(amounts, convert_units_many(values)[0])
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            convert_units_parallel([1], unit=3)
+        with pytest.raises(ValueError):
+            convert_units_parallel([1], to=3)
+        with pytest.raises(ValueError):
+            convert_units_parallel([1], chunk_size=0)
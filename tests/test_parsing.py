@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, convert_units, format_rate, parse_size, parse_sizes
+from binary.core import PREFIXES
+
+
+class TestParseSize:
+    def test_bytes(self) -> None:
+        assert parse_size('0') == 0
+        assert parse_size('10') == 10
+        assert parse_size('10B') == 10
+        assert parse_size(' 10 bytes ') == 10
+        assert parse_size('-10') == -10
+
+    def test_binary(self) -> None:
+        assert parse_size('1.5 GiB') == 1.5 * bunits.GB
+        assert parse_size('3KiB') == 3 * bunits.KB
+        assert parse_size('5Ki') == 5 * bunits.KB
+        assert parse_size('2 mib') == 2 * bunits.MB
+        assert parse_size('1 YiB') == bunits.YB
+
+    def test_decimal(self) -> None:
+        assert parse_size('200MB') == 200 * dunits.MB
+        assert parse_size('3T') == 3 * dunits.TB
+        assert parse_size('1k') == dunits.KB
+        assert parse_size('2 kB') == 2 * dunits.KB
+        assert parse_size('1e3K') == dunits.MB
+
+    def test_bits(self) -> None:
+        assert parse_size('1 Gb') == dunits.GB // 8
+        assert parse_size('8.00 Mb') == dunits.MB
+        assert parse_size('16 Kib') == 2 * bunits.KB
+        assert parse_size('1.5 Gb', exact=True) == Decimal(187500000)
+        assert isinstance(parse_size('3 Tb'), int)
+
+        # Entirely lowercase suffixes are still bytes
+        assert parse_size('1 gb') == dunits.GB
+        assert parse_size('1 kb') == dunits.KB
+
+    def test_format_rate_round_trip(self) -> None:
+        for n in (dunits.MB, 3 * dunits.GB):
+            assert parse_size(format_rate(n, bits=True, si=True)[:-2]) == pytest.approx(n)
+            assert parse_size(format_rate(n, bits=True)[:-2]) == pytest.approx(n, rel=1e-3)
+
+    def test_types(self) -> None:
+        assert isinstance(parse_size('2 KiB'), int)
+        assert isinstance(parse_size('2.0 KiB'), float)
+        assert parse_size('3.14 YiB', exact=True) == Decimal('3796027073589935608577392.64')
+
+    def test_all_prefixes(self) -> None:
+        for unit, suffix in PREFIXES.items():
+            assert parse_size(f'7 {suffix}') == 7 * unit
+
+    def test_round_trip(self) -> None:
+        for n in (1, 1023, 1536, 10 ** 9, 3 * bunits.TB):
+            for si in (False, True):
+                amount, unit = convert_units(n, si=si)
+                assert parse_size(f'{amount} {unit}') == pytest.approx(n)
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            parse_size('1 XB')
+
+    def test_invalid_number(self) -> None:
+        for s in ('', 'KiB', '1.2.3 MB', '--1'):
+            with pytest.raises(ValueError):
+                parse_size(s)
+            with pytest.raises(ValueError):
+                parse_size(s, exact=True)
+
+
+class TestParseSizes:
+    def test_parse(self) -> None:
+        assert parse_sizes(['1KiB', '1KB', '1']) == [1024, 1000, 1]
+        assert parse_sizes(iter(['0.5 K']), exact=True) == [Decimal(500)]
@@ -0,0 +1,97 @@
+from typing import Iterator, List, Tuple
+
+import pytest
+
+import binary
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, core, profiling
+
+
+@pytest.fixture(autouse=True)
+def restore() -> Iterator[None]:
+    yield
+    profiling.disable()
+    profiling.stats.reset()
+
+
+class TestProfiling:
+    def test_disabled_by_default(self) -> None:
+        assert not profiling.is_enabled()
+        assert binary.convert_units is core.convert_units is profiling._original
+
+    def test_paths(self) -> None:
+        with profiling.profile() as stats:
+            binary.convert_units(1024)
+            binary.convert_units(1024, unit=bunits.MB)
+            binary.convert_units(1024, si=True)
+            binary.convert_units(1024, unit=dunits.MB)
+            binary.convert_units(1024, to=bunits.KB)
+            binary.convert_units(1024, unit=bunits.KB, to=dunits.MB, si=True)
+            core.convert_units(1, exact=True)
+            core.convert_units(1, to=bunits.KB, exact=True)
+
+        assert stats.calls == {'to': 2, 'binary': 2, 'si': 2, 'exact': 2}
+        assert stats.total_calls == 8
+        assert all(elapsed > 0 for elapsed in stats.time.values())
+
+    def test_results_unchanged(self) -> None:
+        expected = binary.convert_units(3.14, bunits.GB, dunits.MB)
+        with profiling.profile():
+            assert binary.convert_units(3.14, bunits.GB, dunits.MB) == expected
+            assert binary.convert_units(n=3.14, to=dunits.MB, unit=bunits.GB) == expected
+
+    def test_swaps_implementation(self) -> None:
+        from binary import size
+
+        profiling.enable()
+        assert binary.convert_units is core.convert_units is vars(size)['convert_units']
+        assert binary.convert_units is not profiling._original
+        assert binary.convert_units.__doc__ == profiling._original.__doc__
+
+        profiling.disable()
+        assert binary.convert_units is core.convert_units is vars(size)['convert_units'] is profiling._original
+
+    def test_dependent_modules(self) -> None:
+        with profiling.profile() as stats:
+            str(binary.Size(2048))
+        assert stats.calls['binary'] == 1
+
+    def test_hook(self) -> None:
+        events: List[Tuple[str, float]] = []
+        ticks = iter([1.0, 1.5, 2.0, 4.0])
+
+        with profiling.profile(hook=lambda path, elapsed: events.append((path, elapsed)), clock=lambda: next(ticks)):
+            binary.convert_units(1)
+            binary.convert_units(1, si=True)
+
+        assert events == [('binary', 0.5), ('si', 2.0)]
+        assert profiling.stats.time['si'] == 2.0
+        assert profiling.stats.total_time == 2.5
+
+    def test_reenable_replaces_wrapper(self) -> None:
+        first: List[str] = []
+        second: List[str] = []
+
+        profiling.enable(hook=lambda path, elapsed: first.append(path))
+        profiling.enable(hook=lambda path, elapsed: second.append(path))
+        binary.convert_units(1)
+
+        assert (first, second) == ([], ['binary'])
+        profiling.disable()
+        assert binary.convert_units is profiling._original
+
+    def test_errors_are_not_counted(self) -> None:
+        with profiling.profile() as stats:
+            with pytest.raises(ValueError):
+                binary.convert_units(1, unit=3)
+
+        assert stats.total_calls == 0
+
+    def test_counts_survive_disable(self) -> None:
+        profiling.enable()
+        binary.convert_units(1)
+        profiling.disable()
+        binary.convert_units(1)
+
+        assert profiling.stats.calls['binary'] == 1
+        profiling.stats.reset()
+        assert profiling.stats.total_calls == 0
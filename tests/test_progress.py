@@ -0,0 +1,91 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from binary import GIBIBYTE, MEBIBYTE, TEBIBYTE, Progress
+from binary.progress import format_duration
+
+
+class TestFormatDuration:
+    def test_seconds(self) -> None:
+        assert format_duration(0) == '0s'
+        assert format_duration(41.6) == '42s'
+
+    def test_minutes(self) -> None:
+        assert format_duration(185) == '3m05s'
+
+    def test_hours(self) -> None:
+        assert format_duration(4320) == '1h12m'
+
+    def test_days(self) -> None:
+        assert format_duration(2 * 86400 + 3 * 3600) == '2d03h'
+
+
+class TestProgress:
+    def test_render(self) -> None:
+        progress = Progress(total=4 * TEBIBYTE)
+        progress.render(0.0)
+        progress.add(12 * GIBIBYTE)
+        assert progress.render(10.0) == '12.0 GiB / 4.0 TiB, 1.2 GiB/s, ETA 56m43s'
+
+    def test_render_unknown_total(self) -> None:
+        progress = Progress(si=True, precision=2)
+        progress.render(0.0)
+        progress.add(3000)
+        assert progress.render(1.0) == '3.00 KB, 3.00 KB/s'
+
+    def test_unknown_rate(self) -> None:
+        progress = Progress(total=MEBIBYTE)
+        assert progress.eta() is None
+        assert progress.render(0.0) == '0.0 B / 1.0 MiB, 0.0 B/s, ETA ?'
+
+    def test_complete(self) -> None:
+        progress = Progress(total=MEBIBYTE)
+        progress.render(0.0)
+        progress.add(2 * MEBIBYTE)
+        progress.render(1.0)
+        assert progress.eta() == 0.0
+
+    def test_invalid_interval(self) -> None:
+        with pytest.raises(ValueError):
+            Progress(interval=0)
+
+    def test_concurrent_tasks(self) -> None:
+        statuses: List[str] = []
+
+        async def transfer(progress: Progress) -> None:
+            for _ in range(50):
+                progress.add(MEBIBYTE)
+                await asyncio.sleep(0.001)
+
+        async def main() -> Progress:
+            async with Progress(total=8 * 50 * MEBIBYTE, interval=0.01, callback=statuses.append) as progress:
+                await asyncio.gather(*(transfer(progress) for _ in range(8)))
+            return progress
+
+        progress = asyncio.run(main())
+        assert progress.completed == 8 * 50 * MEBIBYTE
+        assert statuses[-1].startswith('400.0 MiB / 400.0 MiB, ')
+        assert statuses[-1].endswith(', ETA 0s')
+        # Far fewer renders than updates
+        assert 1 < len(statuses) < 400
+
+    def test_cancel_while_exiting(self) -> None:
+        exited: List[bool] = []
+
+        async def work() -> None:
+            async with Progress(interval=10, callback=lambda status: None):
+                pass
+            exited.append(True)
+
+        async def main() -> None:
+            task = asyncio.create_task(work())
+            # Runs until the task waits for the refresh to stop
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert not exited
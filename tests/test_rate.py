@@ -0,0 +1,90 @@
+import pytest
+
+from binary import KIBIBYTE, MEBIBYTE, MEGABYTE, RateMeter, format_rate
+
+
+class TestFormatRate:
+    def test_bytes(self) -> None:
+        assert format_rate(1536) == '1.50 KiB/s'
+        assert format_rate(1536, si=True) == '1.54 KB/s'
+        assert format_rate(100) == '100.00 B/s'
+
+    def test_bits(self) -> None:
+        assert format_rate(MEGABYTE, bits=True, si=True) == '8.00 Mb/s'
+        assert format_rate(MEBIBYTE, bits=True) == '8.00 Mib/s'
+        assert format_rate(10, bits=True) == '80.00 b/s'
+
+    def test_precision(self) -> None:
+        assert format_rate(1536, precision=0) == '2 KiB/s'
+
+
+class TestRateMeter:
+    def test_no_rate_until_time_passes(self) -> None:
+        meter = RateMeter()
+        assert meter.rate == 0.0
+        meter.update(0.0, 0)
+        meter.update(0.0, KIBIBYTE)
+        assert meter.rate == 0.0
+        assert meter.total == KIBIBYTE
+
+    def test_first_interval_is_exact(self) -> None:
+        meter = RateMeter()
+        meter.update(0.0, 0)
+        meter.update(2.0, 4 * KIBIBYTE)
+        assert meter.rate == 2 * KIBIBYTE
+        assert str(meter) == '2.00 KiB/s'
+
+    def test_coalesces_equal_timestamps(self) -> None:
+        meter = RateMeter()
+        meter.update(0.0, 0)
+        meter.update(1.0, 1)
+        assert meter.rate == 1.0
+        for _ in range(999):
+            meter.update(1.0, 1)
+        assert meter.rate == 1.0
+        meter.update(2.0, 1)
+        assert meter.rate == pytest.approx(500.5)
+
+    def test_constant_rate(self) -> None:
+        meter = RateMeter(half_life=0.5)
+        for i in range(100):
+            meter.update(i / 10, 100)
+        assert meter.rate == pytest.approx(1000)
+
+    def test_half_life(self) -> None:
+        meter = RateMeter(half_life=1.0)
+        meter.update(0.0, 0)
+        meter.update(1.0, 1000)
+        meter.update(2.0, 0)
+        assert meter.rate == pytest.approx(500)
+        meter.update(3.0, 0)
+        assert meter.rate == pytest.approx(250)
+
+    def test_irregular_intervals(self) -> None:
+        meter = RateMeter(half_life=1.0)
+        meter.update(0.0, 0)
+        meter.update(1.0, 1000)
+        meter.update(1.5, 0)
+        meter.update(2.0, 0)
+        assert meter.rate == pytest.approx(500)
+
+    def test_format(self) -> None:
+        meter = RateMeter(bits=True, si=True, precision=1)
+        meter.update(0.0, 0)
+        meter.update(1.0, 125 * MEGABYTE)
+        assert meter.format() == '1.0 Gb/s'
+
+    def test_reset(self) -> None:
+        meter = RateMeter()
+        meter.update(0.0, 0)
+        meter.update(1.0, 100)
+        meter.reset()
+        assert meter.rate == 0.0
+        assert meter.total == 0
+        meter.update(5.0, 0)
+        meter.update(6.0, 10)
+        assert meter.rate == 10
+
+    def test_invalid_half_life(self) -> None:
+        with pytest.raises(ValueError):
+            RateMeter(half_life=0)
@@ -0,0 +1,91 @@
+import io
+from array import array
+from typing import List
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, convert_units
+from binary.render import ColumnRenderer
+
+VALUES = [0, 512, 1536, 10 ** 6, 3 * 2 ** 30, -2048, 2 ** 80]
+
+
+def expected(values: List[int], width: int = 12, si: bool = False) -> str:
+    return ''.join(f'{f"{float(a):.2f} {u}":>{width}}\n' for a, u in (convert_units(n, si=si) for n in values))
+
+
+class TestColumnRenderer:
+    @pytest.mark.parametrize('si', [False, True])
+    def test_write(self, backend: str, si: bool) -> None:
+        stream = io.StringIO()
+        written = ColumnRenderer(si=si).write(VALUES, stream)
+        assert stream.getvalue() == expected(VALUES, si=si)
+        assert written == len(VALUES) * 13
+
+    def test_render_into(self, backend: str) -> None:
+        renderer = ColumnRenderer(width=14)
+        buffer = bytearray(b'#' * (len(VALUES) * renderer.record_size + 2))
+        end = renderer.render_into(VALUES, buffer, offset=1)
+
+        assert end == len(buffer) - 1
+        assert buffer[:1] == buffer[-1:] == b'#'
+        assert buffer[1:-1].decode() == expected(VALUES, width=14)
+
+    def test_fixed_offsets(self, backend: str) -> None:
+        renderer = ColumnRenderer(separator='|')
+        buffer = memoryview(bytearray(len(VALUES) * renderer.record_size))
+        renderer.render_into(VALUES, buffer)
+        assert bytes(buffer[2 * 13:3 * 13]) == b'    1.50 KiB|'
+
+    def test_chunks(self, backend: str) -> None:
+        renderer = ColumnRenderer()
+        values = iter(range(0, 10000, 7))
+        chunks = list(renderer.chunks(values, chunk_size=100))
+        assert len(chunks) == 15
+        assert ''.join(chunks) == expected(list(range(0, 10000, 7)))
+
+    def test_array(self, backend: str) -> None:
+        stream = io.StringIO()
+        ColumnRenderer().write(array('q', VALUES[:-1]), stream)
+        assert stream.getvalue() == expected(VALUES[:-1])
+
+    def test_to(self, backend: str) -> None:
+        stream = io.StringIO()
+        ColumnRenderer(width=8, precision=1, unit=bunits.KB, to=dunits.MB).write([1000, 2048], stream)
+        assert stream.getvalue() == '  1.0 MB\n  2.1 MB\n'
+
+    def test_suffixes(self, backend: str) -> None:
+        stream = io.StringIO()
+        ColumnRenderer(width=6, precision=1, suffixes={'KiB': 'K', 'B': ''}).write([100, 1536], stream)
+        assert stream.getvalue() == ' 100.0\n 1.5 K\n'
+
+    def test_numpy_input(self) -> None:
+        np = pytest.importorskip('numpy')
+        stream = io.StringIO()
+        ColumnRenderer().write(np.array(VALUES, dtype=np.float64), stream)
+        assert stream.getvalue() == expected(VALUES)
+
+    def test_numpy_2d_input(self) -> None:
+        np = pytest.importorskip('numpy')
+        values = np.array(VALUES[:6], dtype=np.float64).reshape(2, 3)
+        assert ''.join(ColumnRenderer().chunks(values, chunk_size=2)) == expected(VALUES[:6])
+
+        stream = io.StringIO()
+        ColumnRenderer().write(values, stream)
+        assert stream.getvalue() == expected(VALUES[:6])
+
+    def test_value_too_wide(self, backend: str) -> None:
+        with pytest.raises(ValueError):
+            ColumnRenderer(to=bunits.B).write([2 ** 40], io.StringIO())
+
+    def test_buffer_too_small(self, backend: str) -> None:
+        with pytest.raises(ValueError):
+            ColumnRenderer().render_into([1, 2], bytearray(25))
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            ColumnRenderer(unit=3)
+        with pytest.raises(ValueError):
+            ColumnRenderer(to=3)
+        with pytest.raises(ValueError):
+            ColumnRenderer(separator='\u2028')
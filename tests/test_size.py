@@ -0,0 +1,133 @@
+import copy
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, Size
+
+
+class TestSize:
+    def test_construct(self) -> None:
+        assert Size().bytes == 0
+        assert Size(1536).bytes == 1536
+        assert Size(1.5, bunits.KB).bytes == 1536
+        assert Size(3, dunits.GB).bytes == 3 * dunits.GB
+        assert type(Size(2.9).bytes) is int
+        assert Size(2.9).bytes == 2
+        assert not Size(5).si
+        assert Size(5, si=True).si
+
+    def test_unknown_unit(self) -> None:
+        with pytest.raises(ValueError):
+            Size(1, 5)
+
+    def test_slots(self) -> None:
+        with pytest.raises(AttributeError):
+            Size(1).foo = 1
+
+    def test_immutable(self) -> None:
+        s = Size(1)
+        with pytest.raises(AttributeError):
+            s._bytes = 7
+        with pytest.raises(AttributeError):
+            del s._si
+        assert s.bytes == 1
+        assert not s.si
+
+    @pytest.mark.parametrize('duplicate', [
+        lambda s: pickle.loads(pickle.dumps(s)), copy.copy, copy.deepcopy,
+    ])
+    def test_copy(self, duplicate: Any) -> None:
+        for s in (Size(2 ** 70), Size(1536, si=True)):
+            copied = duplicate(s)
+            assert type(copied) is Size
+            assert (copied.bytes, copied.si) == (s.bytes, s.si)
+
+    def test_not_a_number(self) -> None:
+        for n in ('12', b'12', None, [1]):
+            with pytest.raises(TypeError):
+                Size(n)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            Size('1', bunits.KB)  # type: ignore[arg-type]
+
+    def test_numbers(self) -> None:
+        assert Size(Fraction(3, 2), bunits.KB).bytes == 1536  # type: ignore[arg-type]
+        assert Size(Decimal('2.5')).bytes == 2  # type: ignore[arg-type]
+        assert Size(Size(7)).bytes == 7  # type: ignore[arg-type]
+
+    def test_int(self) -> None:
+        s = Size(1024)
+        assert s == 1024
+        assert hash(s) == hash(1024)
+        assert int(s) == 1024
+        assert [0, 1, 2][Size(1)] == 1
+        assert bool(Size(1))
+        assert not Size(0)
+        assert 1 in {Size(1)}
+
+    def test_compare(self) -> None:
+        assert Size(1) < Size(2) <= Size(2) < 3
+        assert Size(3) > Size(2) >= Size(2) > 1
+        assert Size(1) != Size(2)
+        assert Size(1) != '1'
+        assert sorted([Size(3), Size(1), Size(2)]) == [1, 2, 3]
+
+        with pytest.raises(TypeError):
+            assert Size(1) < 1.5
+
+    def test_arithmetic(self) -> None:
+        assert Size(1) + Size(2) == 3
+        assert Size(1) + 2 == 2 + Size(1) == 3
+        assert Size(5) - Size(2) == Size(5) - 2 == 3
+        assert 5 - Size(2) == 3
+        assert Size(5) * 2 == 2 * Size(5) == 10
+        assert Size(7) // 2 == 3
+        assert Size(7) // Size(2) == 3
+        assert Size(7) % 4 == Size(7) % Size(4) == 3
+        assert Size(3) / Size(2) == 1.5
+        assert -Size(3) == -3
+        assert +Size(3) == 3
+        assert abs(Size(-3)) == 3
+        assert sum([Size(1), Size(2)], Size()) == 3
+
+        for value in (Size(1) + 1, 1 + Size(1), Size(7) // 2, -Size(1), abs(Size(1)), sum([Size(1)])):
+            assert isinstance(value, Size)
+
+    def test_arithmetic_keeps_si(self) -> None:
+        assert (Size(1, si=True) + 1).si
+        assert (Size(1, si=True) * 2).si
+        assert (-Size(1, si=True)).si
+
+    def test_unsupported_arithmetic(self) -> None:
+        with pytest.raises(TypeError):
+            Size(1) + 1.5
+        with pytest.raises(TypeError):
+            Size(1) * Size(2)
+        with pytest.raises(TypeError):
+            Size(1) / 2
+
+    def test_convert(self) -> None:
+        assert Size(1536).convert() == (1.5, 'KiB')
+        assert Size(1536, si=True).convert() == (1.536, 'KB')
+        assert Size(1536).convert(bunits.B) == (1536.0, 'B')
+
+    def test_str(self) -> None:
+        assert str(Size(1536)) == '1.5 KiB'
+        assert str(Size(1500, si=True)) == '1.5 KB'
+        assert repr(Size(1536)) == 'Size(1536)'
+        assert repr(Size(1536, si=True)) == 'Size(1536, si=True)'
+
+    def test_format(self) -> None:
+        s = Size(1536)
+        assert f'{s}' == '1.5 KiB'
+        assert f'{s:.2f}' == '1.50 KiB'
+        assert f'{s:.2fiec}' == '1.50 KiB'
+        assert f'{s:.2fsi}' == '1.54 KB'
+        assert f'{s:.0fB}' == '1536 B'
+        assert f'{s:.3fMiB}' == '0.001 MiB'
+        assert f'{s:>8.1fKB}' == '     1.5 KB'
+        assert f'{Size(1536, si=True):.2f}' == '1.54 KB'
+        assert f'{Size(1536, si=True):.2fiec}' == '1.50 KiB'
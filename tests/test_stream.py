@@ -0,0 +1,68 @@
+import io
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from binary import Converter
+from binary.stream import humanize_columns, humanize_json, read_lines, write_lines
+
+
+class TestReadLines:
+    def test_read(self, tmp_path: Path) -> None:
+        path = tmp_path / 'sizes.txt'
+        path.write_bytes(b'1\n2\r\n3')
+        assert list(read_lines(str(path))) == ['1\n', '2\r\n', '3']
+
+    def test_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / 'sizes.txt'
+        path.touch()
+        assert list(read_lines(str(path))) == []
+
+    @pytest.mark.skipif(not os.path.isdir('/dev/fd'), reason='Requires /dev/fd')
+    def test_pipe(self) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, b'1024\tx\n2\n')
+            os.close(write_fd)
+            assert list(read_lines(f'/dev/fd/{read_fd}')) == ['1024\tx\n', '2\n']
+        finally:
+            os.close(read_fd)
+
+
+class TestWriteLines:
+    def test_write(self) -> None:
+        out = io.StringIO()
+        write_lines((f'{i}\n' for i in range(10)), out, batch_size=3)
+        assert out.getvalue() == ''.join(f'{i}\n' for i in range(10))
+
+
+class TestHumanizeColumns:
+    def test_default(self) -> None:
+        lines = ['4096\t./a\n', '1536\t./b\r\n', '5\t./c']
+        assert list(humanize_columns(lines)) == ['4.00 KiB\t./a\n', '1.50 KiB\t./b\r\n', '5.00 B\t./c']
+
+    def test_column(self) -> None:
+        lines = ['a,2000,b\n', 'c,0.5,d\n']
+        output = humanize_columns(lines, 1, ',', Converter(si=True, precision=1))
+        assert list(output) == ['a,2.0 KB,b\n', 'c,0.5 B,d\n']
+
+    def test_passthrough(self) -> None:
+        lines = ['size\tpath\n', '\n', 'x\n']
+        assert list(humanize_columns(lines, 1)) == lines
+
+    def test_lazy(self) -> None:
+        output = humanize_columns(iter(['1024\n', 'not consumed']))
+        assert next(output) == '1.00 KiB\n'
+
+
+class TestHumanizeJson:
+    def test_field(self) -> None:
+        lines = ['{"path": "a", "size": 2048}\n', '{"path": "b", "size": 1.5}\n']
+        output = [json.loads(line) for line in humanize_json(lines, 'size')]
+        assert output == [{'path': 'a', 'size': '2.00 KiB'}, {'path': 'b', 'size': '1.50 B'}]
+
+    def test_passthrough(self) -> None:
+        lines = ['{"path": "a"}\n', '{"size": "big"}\n', '{"size": true}\n', '[1]\n', 'oops\n']
+        assert list(humanize_json(lines, 'size')) == lines
@@ -0,0 +1,81 @@
+from typing import List
+
+import pytest
+
+from binary import BinaryUnits as bunits, DecimalUnits as dunits, convert_units
+from binary.styles import STYLES, Style, formatter
+
+
+class TestPresets:
+    @pytest.mark.parametrize('name,expected', [
+        ('iec', ['0.00 B', '512.00 B', '1.50 KiB', '1.50 GiB', '-1.00 TiB']),
+        ('si', ['0.00 B', '512.00 B', '1.54 KB', '1.61 GB', '-1.10 TB']),
+        ('jedec', ['0.00 B', '512.00 B', '1.50 KB', '1.50 GB', '-1.00 TB']),
+        ('short', ['0', '512', '1.5K', '1.5G', '-1T']),
+        ('kubernetes', ['0', '512', '1.5Ki', '1.5Gi', '-1Ti']),
+        ('bits', ['0.00 b', '4.10 Kb', '12.29 Kb', '12.88 Gb', '-8.80 Tb']),
+    ])
+    def test_render(self, name: str, expected: List[str]) -> None:
+        render = formatter(name)
+        assert [render(n) for n in (0, 512, 1536, 1610612736, -(2 ** 40))] == expected
+
+    @pytest.mark.parametrize('si', [False, True])
+    def test_matches_convert_units(self, si: bool) -> None:
+        render = formatter('si' if si else 'iec')
+        for n in (0, 1, 999, 1000, 1023, 1024, 10 ** 6, 3.14 * 2 ** 50, -(10 ** 12), 2 ** 90):
+            amount, unit = convert_units(n, si=si)
+            assert render(n) == f'{amount:.2f} {unit}'
+
+    def test_largest_unit(self) -> None:
+        assert formatter('kubernetes')(2 ** 70) == '1024Ei'
+        assert formatter('iec')(2 ** 90) == '1024.00 YiB'
+
+    def test_rounds_up_to_next_unit(self) -> None:
+        assert formatter('iec')(1023.996 * 1024) == '1.00 MiB'
+        assert formatter('iec')(1023.994 * 1024) == '1023.99 KiB'
+        assert formatter('short')(1023.96 * 1024) == '1M'
+        assert formatter('si', precision=0)(999.5 * 1000) == '1 MB'
+        assert formatter('bits')(124_999.5) == '1.00 Mb'
+
+    def test_fractional_bytes(self) -> None:
+        assert formatter('iec')(0.5) == '0.50 B'
+        assert formatter('short')(-0.25) == '-0.2'
+
+
+class TestFormatter:
+    def test_unit(self) -> None:
+        assert formatter('iec', unit=bunits.MB)(1.5) == '1.50 MiB'
+        assert formatter('short', unit=dunits.GB)(2) == '1.9G'
+
+    def test_options(self) -> None:
+        assert formatter('iec', precision=1, decimal_point=',')(1536) == '1,5 KiB'
+        assert formatter('si', trim=True)(10 ** 9) == '1 GB'
+        assert formatter('kubernetes', trim=False)(1024) == '1.00Ki'
+        assert formatter('iec', separator=' ')(2048) == '2.00 KiB'
+
+    def test_trim(self) -> None:
+        render = formatter('iec', precision=3, trim=True)
+        assert [render(n) for n in (1024, 1536, 1100, 10240)] == ['1 KiB', '1.5 KiB', '1.074 KiB', '10 KiB']
+
+    def test_custom_style(self) -> None:
+        style = Style(('bytes', 'kilobytes', '%'), base=1000, precision=0)
+        render = formatter(style)
+        assert [render(n) for n in (5, 5000, 5 * 10 ** 6)] == ['5 bytes', '5 kilobytes', '5 %']
+        assert style.compile()(5000) == '5 kilobytes'
+
+    def test_cached(self) -> None:
+        assert formatter('iec') is formatter('iec')
+        assert formatter('iec', precision=1) is formatter(STYLES['iec']._replace(precision=1))
+        assert formatter('iec') is not formatter('iec', unit=bunits.KB)
+
+    def test_errors(self) -> None:
+        with pytest.raises(ValueError, match='not a known style'):
+            formatter('unknown')
+        with pytest.raises(ValueError):
+            formatter('iec', unit=3)
+        with pytest.raises(ValueError):
+            formatter('iec', base=10)
+        with pytest.raises(ValueError):
+            formatter(Style(()))
+        with pytest.raises(ValueError):
+            formatter('iec', colour='red')